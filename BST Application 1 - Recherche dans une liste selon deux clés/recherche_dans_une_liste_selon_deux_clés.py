@@ -1,3 +1,12 @@
+import csv
+import json
+import os
+import sys
+import tempfile
+from heapq import merge
+from itertools import islice
+from operator import attrgetter, itemgetter
+
 class Etudiant:
     def __init__(self, matricule, nom, moyenne):
         self.matricule = matricule
@@ -10,119 +19,500 @@ class Etudiant:
 class Node:
     def __init__(self, key, data):
         self.key = key  # Clé pour l'ABR (matricule ou moyenne)
-        self.data = data  # Référence à l'objet étudiant
+        self.values = [data]  # Étudiants partageant cette clé (liste de postings : aucun doublon n'est perdu)
         self.left = None
         self.right = None
+        self.height = 1  # Hauteur du sous-arbre, pour l'équilibrage AVL
+        self.size = 1  # Nombre de clés distinctes dans le sous-arbre, pour les estimations
+
+    @property
+    def data(self):
+        # Premier étudiant inséré avec cette clé
+        return self.values[0]
 
 class BinarySearchTree:
     def __init__(self):
         self.root = None
+        self.count = 0  # Nombre total d'étudiants indexés (doublons compris)
 
     def insert(self, key, data):
-        # Insère une clé et un étudiant dans l'ABR
-        if not self.root:
-            self.root = Node(key, data)
-        else:
-            self._insert_recursive(self.root, key, data)
+        # Insère une clé et un étudiant dans l'ABR ; une clé déjà présente reçoit l'étudiant dans sa liste
+        self.root = self._insert_recursive(self.root, key, data)
+        self.count += 1
 
     def _insert_recursive(self, current, key, data):
+        if current is None:
+            return Node(key, data)
         if key < current.key:
-            if current.left is None:
-                current.left = Node(key, data)
-            else:
-                self._insert_recursive(current.left, key, data)
+            current.left = self._insert_recursive(current.left, key, data)
         elif key > current.key:
-            if current.right is None:
-                current.right = Node(key, data)
+            current.right = self._insert_recursive(current.right, key, data)
+        else:
+            current.values.append(data)
+            return current
+        return self._rebalance(current)
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
+
+    def _update(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        # Rétablit l'équilibre AVL : la hauteur reste en O(log n) même si les clés arrivent triées
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def items(self):
+        # Parcourt les couples (clé, étudiant) dans l'ordre des clés
+        for node in self._iter_nodes():
+            for data in node.values:
+                yield node.key, data
+
+    def _iter_nodes(self):
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current
+            current = current.right
+
+    def build_sorted(self, pairs):
+        # Reconstruit l'arbre en O(n) à partir de couples (clé, étudiant) déjà triés par clé :
+        # les clés égales sont regroupées, puis chaque médiane devient la racine de son sous-arbre
+        nodes = []
+        count = 0
+        for key, data in pairs:
+            if nodes and nodes[-1].key == key:
+                nodes[-1].values.append(data)
             else:
-                self._insert_recursive(current.right, key, data)
+                nodes.append(Node(key, data))
+            count += 1
+        self.root = self._build_balanced(nodes, 0, len(nodes))
+        self.count = count
+
+    def _build_balanced(self, nodes, low, high):
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = nodes[middle]
+        node.left = self._build_balanced(nodes, low, middle)
+        node.right = self._build_balanced(nodes, middle + 1, high)
+        self._update(node)
+        return node
+
+    def _find_node(self, key):
+        current = self.root
+        while current is not None and key != current.key:
+            current = current.left if key < current.key else current.right
+        return current
 
     def search(self, key):
-        # Recherche une clé dans l'ABR
-        return self._search_recursive(self.root, key)
+        # Recherche une clé dans l'ABR et retourne le premier étudiant associé
+        node = self._find_node(key)
+        return node.data if node else None
 
-    def _search_recursive(self, current, key):
-        if current is None:
-            return None
-        if key == current.key:
-            return current.data
-        elif key < current.key:
-            return self._search_recursive(current.left, key)
-        else:
-            return self._search_recursive(current.right, key)
+    def search_all(self, key):
+        # Retourne tous les étudiants associés à la clé
+        node = self._find_node(key)
+        return list(node.values) if node else []
+
+    def range_search(self, low=None, high=None):
+        # Parcourt, dans l'ordre des clés, les étudiants dont la clé est dans [low, high]
+        # (None : pas de borne). Seuls les sous-arbres qui chevauchent l'intervalle sont visités.
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                if low is not None and current.key < low:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if high is not None and current.key > high:
+                return
+            yield from current.values
+            current = current.right
+
+    def _count_keys_before(self, key, inclusive):
+        # Nombre de clés distinctes inférieures à key (ou égales si inclusive), en O(log n)
+        count = 0
+        current = self.root
+        while current is not None:
+            if current.key < key or (inclusive and current.key == key):
+                count += self._size(current.left) + 1
+                current = current.right
+            else:
+                current = current.left
+        return count
+
+    def estimate_range(self, low=None, high=None):
+        # Estime le nombre d'étudiants dans [low, high] : clés distinctes de l'intervalle
+        # multipliées par le nombre moyen d'étudiants par clé
+        if self.root is None:
+            return 0
+        keys_up_to_high = self.root.size if high is None else self._count_keys_before(high, True)
+        keys_below_low = 0 if low is None else self._count_keys_before(low, False)
+        return max(0, keys_up_to_high - keys_below_low) * self.count / self.root.size
+
+    def _subtree(self, key):
+        # Racine de la vue : tout l'arbre, ou le sous-arbre de la clé donnée
+        return self.root if key is None else self._find_node(key)
+
+    def print_tree_2d(self, out=None, max_depth=None, key=None):
+        # Affiche l'arbre en 2D avec des barres inclinées, ligne par ligne dans out (sys.stdout
+        # par défaut). Parcours itératif droite-racine-gauche : aucune récursion, et le préfixe
+        # est partagé entre les niveaux au lieu d'être recopié dans chaque appel.
+        # max_depth limite la profondeur affichée (les sous-arbres coupés sont notés « … »),
+        # key restreint l'affichage au sous-arbre de cette clé.
+        out = sys.stdout if out is None else out
+        root = self._subtree(key)
+        segments = []  # segments[i] : morceau de préfixe apporté par l'ancêtre de niveau i
+        # Éléments de la pile : (nœud, niveau, est un enfant droit, segment, déjà développé)
+        stack = [(root, 0, False, '', False)] if root else []
+        while stack:
+            current, level, is_right, segment, expanded = stack.pop()
+            del segments[max(level - 1, 0):]
+            if level:
+                segments.append(segment)
+            truncated = max_depth is not None and level > max_depth
+            if expanded or truncated:
+                label = '…' if truncated else str(current.key)
+                out.write(''.join(segments) + ('┌── ' if is_right else '└── ') + label + '\n')
+                continue
+            # Empiler l'enfant gauche, le nœud lui-même, puis l'enfant droit (traité en premier)
+            if current.left:
+                stack.append((current.left, level + 1, False, '    ' if not is_right else '│   ', False))
+            stack.append((current, level, is_right, segment, True))
+            if current.right:
+                stack.append((current.right, level + 1, True, '    ' if is_right else '│   ', False))
+
+    def _iter_export(self, max_depth, key):
+        # Parcours préfixe itératif pour les exports : (identifiant, nœud, niveau, identifiant du parent)
+        root = self._subtree(key)
+        stack = [(root, 0, None)] if root else []
+        identifier = 0
+        while stack:
+            current, level, parent = stack.pop()
+            yield identifier, current, level, parent
+            if max_depth is None or level < max_depth:
+                for child in (current.right, current.left):
+                    if child:
+                        stack.append((child, level + 1, identifier))
+            identifier += 1
 
+    def export_dot(self, out, max_depth=None, key=None):
+        # Exporte l'arbre au format DOT (Graphviz), un nœud et une arête par ligne
+        out.write('digraph ABR {\n    node [shape=box];\n')
+        for identifier, current, level, parent in self._iter_export(max_depth, key):
+            hidden = self._size(current.left) + self._size(current.right) if level == max_depth else 0
+            label = f"{current.key} ({len(current.values)})" + (f" +{hidden} clés" if hidden else '')
+            out.write(f'    n{identifier} [label={json.dumps(label, ensure_ascii=False)}];\n')
+            if parent is not None:
+                out.write(f'    n{parent} -> n{identifier};\n')
+        out.write('}\n')
 
-    def print_tree_2d(self):
-        # Affiche l'arbre en 2D avec des barres inclinées
-        lines = []
-        self._build_tree_2d(self.root, 0, False, '', lines)
-        for line in lines:
-            print(line)
+    def export_json(self, out, max_depth=None, key=None):
+        # Exporte l'arbre en JSON Lines compact : un objet par nœud, relié à son parent par identifiant
+        # (pas d'imbrication, donc aucune limite de profondeur à l'écriture comme à la relecture)
+        for identifier, current, level, parent in self._iter_export(max_depth, key):
+            objet = {"id": identifier, "parent": parent, "key": current.key,
+                     "count": len(current.values), "height": current.height, "size": current.size}
+            if level == max_depth and (current.left or current.right):
+                objet["truncated"] = True
+            out.write(json.dumps(objet, ensure_ascii=False, separators=(',', ':')) + '\n')
 
-    def _build_tree_2d(self, current, level, is_right, prefix, lines):
-        if current is not None:
-            # Construire la représentation de l'enfant droit
-            self._build_tree_2d(current.right, level + 1, True, prefix + ('    ' if is_right else '│   '), lines)
-            # Ajouter la ligne actuelle
-            lines.append(prefix + ('┌── ' if is_right else '└── ') + str(current.key))
-            # Construire la représentation de l'enfant gauche
-            self._build_tree_2d(current.left, level + 1, False, prefix + ('    ' if not is_right else '│   '), lines)
+def par_paquets(enregistrements, taille):
+    # Découpe un itérable en listes d'au plus taille éléments, sans jamais le matérialiser en entier
+    iterateur = iter(enregistrements)
+    while paquet := list(islice(iterateur, taille)):
+        yield paquet
+
+def lire_csv(chemin, separateur=','):
+    # Lit paresseusement un fichier CSV avec les colonnes matricule, nom et moyenne
+    with open(chemin, newline='', encoding='utf-8') as fichier:
+        for ligne in csv.DictReader(fichier, delimiter=separateur):
+            yield Etudiant(ligne['matricule'], ligne['nom'], float(ligne['moyenne']))
+
+def lire_jsonl(chemin):
+    # Lit paresseusement un fichier JSON Lines (un objet étudiant par ligne)
+    with open(chemin, encoding='utf-8') as fichier:
+        for ligne in fichier:
+            if ligne.strip():
+                objet = json.loads(ligne)
+                yield Etudiant(objet['matricule'], objet['nom'], float(objet['moyenne']))
+
+class CollectionIndexee:
+    # Collection d'enregistrements avec un index ordonné (ABR) par champ déclaré, et
+    # éventuellement un index de hachage (dictionnaire) pour les recherches exactes en O(1).
+    # Un critère de recherche est soit une valeur exacte, soit un intervalle fermé (min, max).
+    def __init__(self, *champs, hachage=()):
+        self.enregistrements = []
+        self.index = {}
+        self.index_hachage = {}
+        for champ in champs:
+            self.ajouter_index(champ)
+        for champ in hachage:
+            self.ajouter_index_hachage(champ)
+
+    def ajouter_index(self, champ):
+        # Déclare un index sur un champ et y range les enregistrements déjà présents
+        arbre = BinarySearchTree()
+        for enregistrement in self.enregistrements:
+            arbre.insert(getattr(enregistrement, champ), enregistrement)
+        self.index[champ] = arbre
+
+    def ajouter_index_hachage(self, champ):
+        # Déclare un index de hachage (valeur -> liste d'enregistrements) sur un champ
+        table = {}
+        for enregistrement in self.enregistrements:
+            table.setdefault(getattr(enregistrement, champ), []).append(enregistrement)
+        self.index_hachage[champ] = table
+
+    def ajouter(self, enregistrement):
+        # Met à jour tous les index, ordonnés et de hachage, pour rester synchronisé
+        self.enregistrements.append(enregistrement)
+        for champ, arbre in self.index.items():
+            arbre.insert(getattr(enregistrement, champ), enregistrement)
+        for champ, table in self.index_hachage.items():
+            table.setdefault(getattr(enregistrement, champ), []).append(enregistrement)
+
+    def chercher_exact(self, champ, valeur):
+        # Recherche exacte sur un champ, par le meilleur index disponible
+        if champ in self.index_hachage:
+            return list(self.index_hachage[champ].get(valeur, ()))
+        if champ in self.index:
+            return self.index[champ].search_all(valeur)
+        return [e for e in self.enregistrements if getattr(e, champ) == valeur]
+
+    def ajouter_en_masse(self, enregistrements, taille_paquet=100_000):
+        # Import en masse depuis un itérable (éventuellement un générateur de lecture de fichier) :
+        # les enregistrements sont consommés par paquets, chaque paquet est trié selon chaque champ
+        # indexé, puis les paquets triés sont fusionnés avec le contenu actuel des index et chaque
+        # ABR est reconstruit en temps linéaire, sans insertion ligne par ligne.
+        # Rien n'est modifié avant la fin de la lecture : si le flux échoue en cours de route
+        # (ligne invalide), la collection et tous ses index restent dans leur état précédent.
+        paquets_lus = []
+        paquets_tries = {champ: [] for champ in self.index}
+        for paquet in par_paquets(enregistrements, taille_paquet):
+            paquets_lus.append(paquet)
+            for champ, paquets in paquets_tries.items():
+                paquets.append(sorted(paquet, key=attrgetter(champ)))
+        reconstruits = {}
+        for champ, arbre in self.index.items():
+            cle = attrgetter(champ)
+            # merge est stable : à clé égale, l'ordre d'arrivée des enregistrements est conservé
+            nouveaux = ((cle(e), e) for e in merge(*paquets_tries[champ], key=cle))
+            reconstruits[champ] = BinarySearchTree()
+            reconstruits[champ].build_sorted(merge(arbre.items(), nouveaux, key=itemgetter(0)))
+        # Mise à jour de tous les index ensemble ; les ABR gardent leur identité (GestionEtudiants
+        # en conserve des références)
+        for champ, reconstruit in reconstruits.items():
+            self.index[champ].root, self.index[champ].count = reconstruit.root, reconstruit.count
+        for paquet in paquets_lus:
+            self.enregistrements.extend(paquet)
+            for champ, table in self.index_hachage.items():
+                for enregistrement in paquet:
+                    table.setdefault(getattr(enregistrement, champ), []).append(enregistrement)
+
+    def __len__(self):
+        return len(self.enregistrements)
+
+    def _plans(self, criteres):
+        # Énumère les plans possibles (estimation, champ, type d'index) pour ces critères.
+        # Une valeur exacte utilise de préférence l'index de hachage (O(1)), un intervalle
+        # ne peut utiliser que l'index ordonné.
+        for champ, critere in criteres.items():
+            if isinstance(critere, tuple):
+                if champ in self.index:
+                    yield self.index[champ].estimate_range(*critere), champ, 'ordonne'
+            elif champ in self.index_hachage:
+                yield len(self.index_hachage[champ].get(critere, ())), champ, 'hachage'
+            elif champ in self.index:
+                yield len(self.index[champ].search_all(critere)), champ, 'ordonne'
+
+    def planifier(self, **criteres):
+        # Choisit l'index le plus sélectif parmi les champs indexés des critères.
+        # Retourne (champ, type d'index, estimation), ou (None, None, taille) pour un parcours complet.
+        plans = list(self._plans(criteres))
+        if not plans:
+            return None, None, len(self.enregistrements)
+        estimation, champ, type_index = min(plans, key=lambda plan: plan[0])
+        return champ, type_index, estimation
+
+    @staticmethod
+    def _satisfait(valeur, critere):
+        if isinstance(critere, tuple):
+            low, high = critere  # Une borne None ne limite pas l'intervalle, comme pour range_search
+            return (low is None or low <= valeur) and (high is None or valeur <= high)
+        return valeur == critere
+
+    def rechercher(self, ordre=None, **criteres):
+        # Recherche composite : l'index choisi par le planificateur fournit les candidats
+        # (déjà triés selon son champ), les autres critères ne sont vérifiés que sur ces candidats.
+        champ, type_index, _ = self.planifier(**criteres)
+        if champ is None:
+            candidats = self.enregistrements
+        elif type_index == 'hachage':
+            candidats = self.index_hachage[champ].get(criteres[champ], ())
+        elif isinstance(criteres[champ], tuple):
+            candidats = self.index[champ].range_search(*criteres[champ])
+        else:
+            candidats = self.index[champ].search_all(criteres[champ])
+        autres = [(c, critere) for c, critere in criteres.items() if c != champ]
+        resultats = [e for e in candidats if all(self._satisfait(getattr(e, c), critere) for c, critere in autres)]
+        if ordre is not None and (ordre != champ or type_index == 'hachage'):
+            resultats.sort(key=lambda e: getattr(e, ordre))
+        return resultats
 
 class GestionEtudiants:
     def __init__(self):
-        self.abr_matricule = BinarySearchTree()
-        self.abr_moyenne = BinarySearchTree()
+        # Le matricule est une clé unique : il dispose en plus d'un index de hachage
+        self.etudiants = CollectionIndexee('matricule', 'moyenne', hachage=('matricule',))
+        self.abr_matricule = self.etudiants.index['matricule']
+        self.abr_moyenne = self.etudiants.index['moyenne']
 
     def ajouter_etudiant(self, matricule, nom, moyenne):
-        etudiant = Etudiant(matricule, nom, moyenne)
-        self.abr_matricule.insert(matricule, etudiant)
-        self.abr_moyenne.insert(moyenne, etudiant)
+        self.etudiants.ajouter(Etudiant(matricule, nom, moyenne))
+
+    def importer(self, chemin, taille_paquet=100_000):
+        # Importe un export CSV ou JSON Lines (selon l'extension) en flux, par paquets
+        if chemin.endswith('.csv'):
+            lecteur = lire_csv(chemin)
+        elif chemin.endswith(('.jsonl', '.ndjson')):
+            lecteur = lire_jsonl(chemin)
+        else:
+            raise ValueError(f"Format de fichier non pris en charge : {chemin}")
+        self.etudiants.ajouter_en_masse(lecteur, taille_paquet)
 
     def rechercher_par_matricule(self, matricule):
-        return self.abr_matricule.search(matricule)
+        # Recherche exacte en O(1) par l'index de hachage
+        etudiants = self.etudiants.index_hachage['matricule'].get(matricule)
+        return etudiants[0] if etudiants else None
 
     def rechercher_par_moyenne(self, moyenne):
         return self.abr_moyenne.search(moyenne)
 
-    def afficher_arbres_2d(self):
+    def rechercher_tous_par_moyenne(self, moyenne):
+        return self.abr_moyenne.search_all(moyenne)
+
+    def rechercher_par_moyenne_entre(self, moyenne_min, moyenne_max):
+        return list(self.abr_moyenne.range_search(moyenne_min, moyenne_max))
+
+    def rechercher(self, ordre=None, **criteres):
+        return self.etudiants.rechercher(ordre=ordre, **criteres)
+
+    def afficher_arbres_2d(self, profondeur_max=None):
         print("\nArbre des matricules :")
-        self.abr_matricule.print_tree_2d()
+        self.abr_matricule.print_tree_2d(max_depth=profondeur_max)
         print("\nArbre des moyennes :")
-        self.abr_moyenne.print_tree_2d()
+        self.abr_moyenne.print_tree_2d(max_depth=profondeur_max)
 
 # Exemple d'utilisation
-gestion = GestionEtudiants()
-
-# Ajout de 20 étudiants
-gestion.ajouter_etudiant("E115", "Samir", 15.5)
-gestion.ajouter_etudiant("E104", "Khalid", 12.0)
-gestion.ajouter_etudiant("E120", "Loubna", 18.0)
-gestion.ajouter_etudiant("E101", "Aziz", 10.5)
-gestion.ajouter_etudiant("E118", "Redone", 16.7)
-gestion.ajouter_etudiant("E106", "Oussama", 14.2)
-gestion.ajouter_etudiant("E113", "Youssef", 19.5)
-gestion.ajouter_etudiant("E108", "Abir", 11.0)
-gestion.ajouter_etudiant("E117", "Khadija", 13.5)
-gestion.ajouter_etudiant("E102", "Rim", 17.8)
-gestion.ajouter_etudiant("E110", "Salim", 12.3)
-gestion.ajouter_etudiant("E112", "ahmed", 15.0)
-gestion.ajouter_etudiant("E105", "Zadi", 18.5)
-gestion.ajouter_etudiant("E114", "Karim", 14.0)
-gestion.ajouter_etudiant("E109", "Rabiaa", 16.0)
-gestion.ajouter_etudiant("E103", "Sanawsar", 10.0)
-gestion.ajouter_etudiant("E119", "soundouss", 13.0)
-gestion.ajouter_etudiant("E107", "Soulaimane", 19.0)
-gestion.ajouter_etudiant("E111", "Radi", 11.5)
-gestion.ajouter_etudiant("E116", "Ibrahim", 17.0)
-
-# Affichage des arbres
-gestion.afficher_arbres_2d()
-
-# Recherche
-print("\nRecherche par matricule 'E105':")
-print(gestion.rechercher_par_matricule("E105"))
-
-print("\nRecherche par moyenne 19.5:")
-print(gestion.rechercher_par_moyenne(19.5))
+if __name__ == "__main__":
+    gestion = GestionEtudiants()
+
+    # Ajout de 20 étudiants
+    gestion.ajouter_etudiant("E115", "Samir", 15.5)
+    gestion.ajouter_etudiant("E104", "Khalid", 12.0)
+    gestion.ajouter_etudiant("E120", "Loubna", 18.0)
+    gestion.ajouter_etudiant("E101", "Aziz", 10.5)
+    gestion.ajouter_etudiant("E118", "Redone", 16.7)
+    gestion.ajouter_etudiant("E106", "Oussama", 14.2)
+    gestion.ajouter_etudiant("E113", "Youssef", 19.5)
+    gestion.ajouter_etudiant("E108", "Abir", 11.0)
+    gestion.ajouter_etudiant("E117", "Khadija", 13.5)
+    gestion.ajouter_etudiant("E102", "Rim", 17.8)
+    gestion.ajouter_etudiant("E110", "Salim", 12.3)
+    gestion.ajouter_etudiant("E112", "ahmed", 15.0)
+    gestion.ajouter_etudiant("E105", "Zadi", 18.5)
+    gestion.ajouter_etudiant("E114", "Karim", 14.0)
+    gestion.ajouter_etudiant("E109", "Rabiaa", 16.0)
+    gestion.ajouter_etudiant("E103", "Sanawsar", 10.0)
+    gestion.ajouter_etudiant("E119", "soundouss", 13.0)
+    gestion.ajouter_etudiant("E107", "Soulaimane", 19.0)
+    gestion.ajouter_etudiant("E111", "Radi", 11.5)
+    gestion.ajouter_etudiant("E116", "Ibrahim", 17.0)
+    gestion.ajouter_etudiant("E121", "Nadia", 19.5)  # Même moyenne que Youssef
+
+    # Affichage des arbres
+    gestion.afficher_arbres_2d()
+
+    # Recherche
+    print("\nRecherche par matricule 'E105':")
+    print(gestion.rechercher_par_matricule("E105"))
+
+    print("\nRecherche par moyenne 19.5:")
+    print(gestion.rechercher_par_moyenne(19.5))
+
+    print("\nTous les étudiants de moyenne 19.5:")
+    print(gestion.rechercher_tous_par_moyenne(19.5))
+
+    print("\nÉtudiants de moyenne entre 12 et 15:")
+    print(gestion.rechercher_par_moyenne_entre(12, 15))
+
+    print("\nRecherche composite (moyenne entre 12 et 18, matricule entre 'E105' et 'E110'):")
+    print("Plan choisi :", gestion.etudiants.planifier(moyenne=(12, 18), matricule=("E105", "E110")))
+    print(gestion.rechercher(moyenne=(12, 18), matricule=("E105", "E110"), ordre='moyenne'))
+
+    print("\nRecherche composite (matricule 'E109', moyenne entre 12 et 18):")
+    print("Plan choisi :", gestion.etudiants.planifier(matricule="E109", moyenne=(12, 18)))
+    print(gestion.rechercher(matricule="E109", moyenne=(12, 18)))
+
+    # Import en masse depuis un fichier CSV
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "etudiants.csv")
+        with open(chemin, "w", newline="", encoding="utf-8") as fichier:
+            fichier.write("matricule,nom,moyenne\nE124,Hind,14.5\nE122,Anas,9.5\nE123,Sara,19.5\n")
+        gestion.importer(chemin, taille_paquet=2)
 
+    print("\nAprès import CSV, étudiants de moyenne entre 9 et 10:")
+    print(gestion.rechercher_par_moyenne_entre(9, 10))
+    print("Tous les étudiants de moyenne 19.5:")
+    print(gestion.rechercher_tous_par_moyenne(19.5))
+    print("Hauteur de l'arbre des matricules :", gestion.abr_matricule.root.height, "pour", len(gestion.etudiants), "étudiants")
 
+    # Affichage partiel et exports de débogage
+    print("\nSous-arbre de la moyenne 12.0, sur deux niveaux :")
+    gestion.abr_moyenne.print_tree_2d(max_depth=1, key=12.0)
+    print("\nExport DOT de l'arbre des matricules (deux niveaux) :")
+    gestion.abr_matricule.export_dot(sys.stdout, max_depth=1)
+    print("\nExport JSON du sous-arbre du matricule 'E121' :")
+    gestion.abr_matricule.export_json(sys.stdout, key="E121")
@@ -0,0 +1,177 @@
+"""
+Benchmark : moteur itératif de bst.BinarySearchTree contre l'ancienne version récursive.
+
+- Sur un arbre aléatoire (peu profond), compare le temps de chaque opération.
+- Sur un arbre dégénéré (une liste liée de --skewed-size nœuds), vérifie que la
+  version itérative termine là où la version récursive lève RecursionError.
+
+calculate_size n'est plus un parcours : la taille est mémorisée dans chaque nœud et lue à la
+racine en O(1). La ligne « parcours (taille) » compare donc le parcours récursif d'origine à un
+parcours itératif équivalent ; le gain de la taille mémorisée est affiché à part.
+
+Utilisation :
+    python benchmarks/bench_bst_iterative.py --size 200000 --skewed-size 10000000
+"""
+
+import argparse
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import BinarySearchTree, Node  # noqa: E402
+
+
+class RecursiveBinarySearchTree(BinarySearchTree):
+    """Référence : les méthodes récursives d'origine, conservées pour la comparaison."""
+
+    def _insert(self, root, data):
+        if root is None:
+            return Node(data)
+        if data < root.data:
+            root.left = self._insert(root.left, data)
+        else:
+            root.right = self._insert(root.right, data)
+        return root
+
+    def calculate_size(self):
+        def _size(node):
+            if not node:
+                return 0
+            return 1 + _size(node.left) + _size(node.right)
+
+        return _size(self.root)
+
+    def find(self, data):
+        def _find(node, data):
+            if node is None:
+                return False
+            if node.data == data:
+                return True
+            elif data < node.data:
+                return _find(node.left, data)
+            else:
+                return _find(node.right, data)
+
+        return _find(self.root, data)
+
+    def _clear_subtree(self, node):
+        if node:
+            self._clear_subtree(node.left)
+            self._clear_subtree(node.right)
+            node.left = None
+            node.right = None
+
+    def _count_leaves(self, node):
+        if node is None:
+            return 0
+        if node.left is None and node.right is None:
+            return 1
+        return self._count_leaves(node.left) + self._count_leaves(node.right)
+
+    def _in_order_traversal(self, node, result):
+        if node:
+            self._in_order_traversal(node.left, result)
+            result.append(node.data)
+            self._in_order_traversal(node.right, result)
+
+    def _pre_order_traversal(self, node, result):
+        if node:
+            result.append(node.data)
+            self._pre_order_traversal(node.left, result)
+            self._pre_order_traversal(node.right, result)
+
+    def _post_order_traversal(self, node, result):
+        if node:
+            self._post_order_traversal(node.left, result)
+            self._post_order_traversal(node.right, result)
+            result.append(node.data)
+
+
+def build_skewed(cls, size):
+    """Construire directement une chaîne droite de size nœuds (insérer des clés triées serait en O(n²))."""
+    tree = cls(None)
+    if size:
+        tree.root = current = Node(0)
+        for i in range(1, size):
+            current.right = Node(i)
+            current = current.right
+        tree._update_subtree(tree.root)
+    return tree
+
+
+def count_nodes(tree):
+    """Parcours itératif complet (pile explicite) : le pendant exact de la taille récursive."""
+    return sum(1 for _ in tree.iter_pre_order())
+
+
+def size_walk(tree):
+    """Parcours qui calcule la taille : récursif pour la référence, itératif sinon."""
+    if isinstance(tree, RecursiveBinarySearchTree):
+        return tree.calculate_size
+    return lambda: count_nodes(tree)
+
+
+def timed(func, *args):
+    start = perf_counter()
+    try:
+        func(*args)
+    except RecursionError:
+        return None
+    return perf_counter() - start
+
+
+def operations(tree, keys):
+    return [
+        ("insert", lambda: [tree.insert(k) for k in keys]),
+        ("find", lambda: [tree.find(k) for k in keys]),
+        ("parcours (taille)", size_walk(tree)),
+        ("count_leaves", tree.count_leaves),
+        ("in_order", tree.in_order),
+        ("pre_order", tree.pre_order),
+        ("post_order", tree.post_order),
+        ("clear", tree.clear),
+    ]
+
+
+def bench_random(size):
+    keys = random.sample(range(size * 10), size)
+    print(f"Arbre aléatoire ({size} clés)")
+    print(f"{'opération':<18}{'récursif (s)':>14}{'itératif (s)':>14}{'gain':>8}")
+    recursive, iterative = RecursiveBinarySearchTree(None), BinarySearchTree(None)
+    for (name, rec_op), (_, it_op) in zip(operations(recursive, keys), operations(iterative, keys)):
+        if name == "clear":
+            # Avant de vider les arbres : taille mémorisée (lue à la racine) contre parcours récursif
+            walk, stored = timed(recursive.calculate_size), timed(iterative.calculate_size)
+            print(f"Taille mémorisée : calculate_size en {stored:.6f} s au lieu de {walk:.4f} s "
+                  f"pour le parcours récursif ({walk / stored:.0f}x, sans rapport avec l'itératif)")
+        rec, it = timed(rec_op), timed(it_op)
+        print(f"{name:<18}{rec:>14.4f}{it:>14.4f}{rec / it:>7.2f}x")
+
+
+def bench_skewed(size):
+    print(f"\nArbre dégénéré ({size} nœuds)")
+    for label, cls in (("récursif", RecursiveBinarySearchTree), ("itératif", BinarySearchTree)):
+        tree = build_skewed(cls, size)
+        results = []
+        for name, op in (("find", lambda: tree.find(size - 1)),
+                         ("parcours (taille)", size_walk(tree)),
+                         ("in_order", tree.in_order),
+                         ("post_order", tree.post_order),
+                         ("clear", tree.clear)):
+            elapsed = timed(op)
+            results.append(f"{name}={'RecursionError' if elapsed is None else f'{elapsed:.2f}s'}")
+        print(f"{label:<10}" + "  ".join(results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="taille de l'arbre aléatoire")
+    parser.add_argument("--skewed-size", type=int, default=1_000_000,
+                        help="taille de l'arbre dégénéré (10_000_000 demande plusieurs Go de mémoire)")
+    args = parser.parse_args()
+    random.seed(42)
+    bench_random(args.size)
+    bench_skewed(args.skewed_size)
@@ -0,0 +1,67 @@
+"""
+Benchmark mémoire : octets par clé selon la disposition des nœuds.
+
+- nœuds avec __dict__ : l'ancienne classe bst.Node (référence recopiée ci-dessous) ;
+- nœuds avec __slots__ : bst.Node actuel ;
+- tableaux parallèles : bst_compact.CompactBinarySearchTree (clés en liste ou en array 'q').
+
+Les objets clés eux-mêmes sont créés avant la mesure et ne sont pas comptés :
+seul le coût de la structure est mesuré (tracemalloc).
+
+Utilisation :
+    python benchmarks/bench_bst_memory.py --size 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import BinarySearchTree  # noqa: E402
+from bst_compact import CompactBinarySearchTree  # noqa: E402
+
+
+class DictNode:
+    """Référence : nœud sans __slots__, tel que bst.Node avant l'ajout de __slots__."""
+
+    def __init__(self, data):
+        self.data = data
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+class DictNodeTree(BinarySearchTree):
+    _node_class = DictNode
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current
+
+
+def main(size):
+    keys = list(range(size))
+    layouts = [
+        ("nœuds avec __dict__", lambda: DictNodeTree.from_sorted(keys)),
+        ("nœuds avec __slots__", lambda: BinarySearchTree.from_sorted(keys)),
+        ("tableaux, clés en liste", lambda: CompactBinarySearchTree(keys)),
+        ("tableaux, clés en array 'q'", lambda: CompactBinarySearchTree(keys, typecode="q")),
+    ]
+    print(f"Mémoire par clé ({size} clés)")
+    for label, build in layouts:
+        print(f"{label:<30}{measure(build) / size:>8.1f} octets/clé")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000, help="nombre de clés")
+    main(parser.parse_args().size)
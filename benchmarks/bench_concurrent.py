@@ -0,0 +1,102 @@
+"""
+Benchmark multi-thread de bst_concurrent.ConcurrentBinarySearchTree.
+
+1. Débit : chaque thread exécute un mélange de recherches et d'insertions
+   (--write-ratio) ; on mesure le nombre total d'opérations par seconde
+   pour 1, 2, 4, ... --max-threads threads.
+2. Parcours long : un lecteur parcourt lentement un instantané pendant
+   qu'un rédacteur insère ; on mesure la latence maximale des insertions.
+
+Avec le GIL de CPython, les lectures ne s'exécutent pas réellement en parallèle :
+ce benchmark mesure surtout le coût de la synchronisation et l'absence de blocage.
+
+Utilisation :
+    python benchmarks/bench_concurrent.py --size 100000 --ops 200000 --max-threads 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+from time import perf_counter, sleep
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import AVLTree  # noqa: E402
+from bst_concurrent import ConcurrentBinarySearchTree  # noqa: E402
+
+
+def build(size):
+    tree = AVLTree(None)
+    tree.root = AVLTree.from_sorted(range(0, size * 2, 2))
+    return ConcurrentBinarySearchTree(tree)
+
+
+def worker(shared, operations, write_ratio, seed, limit):
+    rng = random.Random(seed)
+    for _ in range(operations):
+        key = rng.randrange(limit)
+        if rng.random() < write_ratio:
+            shared.insert(key)
+        else:
+            shared.find(key)
+
+
+def bench_throughput(size, total_ops, max_threads, write_ratio):
+    print(f"Débit ({total_ops} opérations, {write_ratio:.0%} d'écritures, arbre de {size} clés)")
+    threads_count = 1
+    while threads_count <= max_threads:
+        shared = build(size)
+        per_thread = total_ops // threads_count
+        threads = [threading.Thread(target=worker, args=(shared, per_thread, write_ratio, seed, size * 2))
+                   for seed in range(threads_count)]
+        start = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - start
+        print(f"{threads_count:>3} thread(s) : {per_thread * threads_count / elapsed:>12,.0f} op/s")
+        threads_count *= 2
+
+
+def bench_snapshot_iteration(size):
+    shared = build(size)
+    latencies = []
+    done = threading.Event()
+
+    def slow_reader():
+        for index, _ in enumerate(shared):
+            if index % 1000 == 0:
+                sleep(0.001)  # Consommateur lent
+        done.set()
+
+    def writer():
+        key = 1
+        while not done.is_set():
+            start = perf_counter()
+            shared.insert(key)
+            latencies.append(perf_counter() - start)
+            key += 2
+
+    shared.snapshot()  # Instantané initial, pris avant de lancer les threads
+    reader_thread, writer_thread = threading.Thread(target=slow_reader), threading.Thread(target=writer)
+    start = perf_counter()
+    reader_thread.start()
+    writer_thread.start()
+    reader_thread.join()
+    writer_thread.join()
+    print(f"\nParcours lent d'un instantané de {size} clés : {perf_counter() - start:.2f} s ; "
+          f"{len(latencies)} insertions pendant le parcours, latence max {max(latencies) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="taille initiale de l'arbre")
+    parser.add_argument("--ops", type=int, default=200_000, help="nombre total d'opérations")
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+    bench_throughput(args.size, args.ops, args.max_threads, args.write_ratio)
+    bench_snapshot_iteration(args.size)
@@ -0,0 +1,106 @@
+"""
+Benchmark du gradient conjugué de numpy/linear equations.py face aux résolutions denses.
+
+Système de test : opérateur de réaction-diffusion sur une grille m x m (n = m² inconnues),
+A = diag(d) - (voisins haut, bas, gauche, droite), avec des coefficients de réaction
+d répartis sur plusieurs ordres de grandeur : A est symétrique définie positive et creuse
+(5 coefficients non nuls par ligne).
+
+Pour chaque n :
+  - np.linalg.solve et np.linalg.cholesky sur la matrice dense (jusqu'à --dense-max inconnues) ;
+  - gradient conjugué sans préconditionneur, avec Jacobi, et IC(0) (jusqu'à --ichol-max),
+    en mode matrice dense puis en mode matvec (sans jamais stocker A) pour les grands n.
+
+Utilisation :
+    python benchmarks/bench_conjugate_gradient.py --sizes 100 1000 10000 100000 --dense-max 5000
+"""
+
+import argparse
+import os
+from importlib.util import module_from_spec, spec_from_file_location
+from time import perf_counter
+
+import numpy as np
+
+LINEAR_EQUATIONS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "numpy", "linear equations.py")
+
+
+def load_linear_equations():
+    # Le nom du script contient un espace : il est chargé depuis son chemin
+    spec = spec_from_file_location("linear_equations", LINEAR_EQUATIONS)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def reaction_diffusion(m, seed):
+    # Retourne (matvec, diagonale, constructeur de la matrice dense) pour une grille m x m
+    rng = np.random.default_rng(seed)
+    d = 4 + 10 ** rng.uniform(-2, 3, m * m)
+
+    def matvec(v):
+        grid = v.reshape(m, m)
+        result = d.reshape(m, m) * grid
+        result[1:, :] -= grid[:-1, :]
+        result[:-1, :] -= grid[1:, :]
+        result[:, 1:] -= grid[:, :-1]
+        result[:, :-1] -= grid[:, 1:]
+        return result.ravel()
+
+    def dense():
+        n = m * m
+        A = np.diag(d)
+        index = np.arange(n)
+        right = index[(index % m) < m - 1]
+        below = index[index < n - m]
+        A[right, right + 1] = A[right + 1, right] = -1
+        A[below, below + m] = A[below + m, below] = -1
+        return A
+
+    return matvec, d, dense
+
+
+def timed(function, *args, **kwargs):
+    start = perf_counter()
+    result = function(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10_000, 100_000],
+                        help="nombres d'inconnues (arrondis au carré parfait le plus proche)")
+    parser.add_argument("--dense-max", type=int, default=5000, help="taille maximale des résolutions denses")
+    parser.add_argument("--ichol-max", type=int, default=5000, help="taille maximale pour IC(0)")
+    parser.add_argument("--tol", type=float, default=1e-8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    solver = load_linear_equations()
+    for size in args.sizes:
+        m = max(2, round(size ** 0.5))
+        n = m * m
+        matvec, d, dense = reaction_diffusion(m, args.seed)
+        b = np.random.default_rng(args.seed + 1).random(n)
+        print(f"n = {n} ({m} x {m})")
+        if n <= args.dense_max:
+            A = dense()
+            _, elapsed = timed(np.linalg.solve, A, b)
+            print(f"  {'dense solve':<28} {elapsed:9.4f} s")
+            _, elapsed = timed(solver.FactorizationCache().solve, A, b)
+            print(f"  {'dense cholesky':<28} {elapsed:9.4f} s")
+            cases = [("CG dense", A, None), ("CG dense + jacobi", A, "jacobi")]
+            if n <= args.ichol_max:
+                cases.append(("CG dense + ichol", A, "ichol"))
+        else:
+            cases = []
+        cases += [("CG matvec", matvec, None), ("CG matvec + jacobi", matvec, "jacobi")]
+        for label, operator, preconditioner in cases:
+            (x, stats), elapsed = timed(solver.conjugate_gradient, operator, b, tol=args.tol,
+                                        preconditioner=preconditioner, diagonal=d)
+            error = np.linalg.norm(matvec(x) - b) / np.linalg.norm(b)
+            print(f"  {label:<28} {elapsed:9.4f} s  {stats['iterations']:>5} itérations  résidu {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark du calcul des notes finales de exercice01.py.
+
+Compare la version en boucle (calculate_final_grades, étudiant par étudiant) et le
+moteur en colonnes NumPy (calculate_final_grades_vectorized) sur des bases générées
+par random_columns, puis mesure le moteur en colonnes seul sur des bases plus grandes.
+
+Utilisation :
+    python benchmarks/bench_final_grades.py --loop-size 100000 --sizes 1000000 5000000
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import exercice01  # noqa: E402
+
+
+def as_database(columns):
+    # Base au format d'origine (listes Python) pour la version en boucle
+    return {
+        'Students': columns['Students'].tolist(),
+        'Groups': columns['Groups'].tolist(),
+        'DS': columns['DS'].astype(int).tolist(),
+        'TP': columns['TP'].astype(int).tolist(),
+        'Attendance': dict(zip(columns['Days'], columns['Attendance'].tolist())),
+    }
+
+
+def timed(function, *args):
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--loop-size", type=int, default=100_000, help="taille de la comparaison avec la boucle")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 5_000_000],
+                        help="tailles mesurées pour le moteur en colonnes seul")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = exercice01.random_columns(args.loop_size, seed=args.seed)
+    exercice01.database = as_database(columns)
+    loop, loop_time = timed(exercice01.calculate_final_grades)
+    vectorized, vectorized_time = timed(exercice01.calculate_final_grades_vectorized, columns)
+    gap = max(abs(loop[student] - grade) for student, grade in zip(columns['Students'].tolist(), vectorized.tolist()))
+    print(f"{args.loop_size} étudiants : boucle {loop_time:.3f} s, colonnes {vectorized_time:.4f} s "
+          f"({loop_time / vectorized_time:.0f}x), écart maximal {gap}")
+
+    for size in args.sizes:
+        columns = exercice01.random_columns(size, seed=args.seed)
+        _, elapsed = timed(exercice01.calculate_final_grades_vectorized, columns)
+        print(f"{size} étudiants : colonnes {elapsed:.3f} s ({size / elapsed:,.0f} étudiants/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark de passage à l'échelle du calcul parallèle des notes de exercice01.py.
+
+Génère une base synthétique de --size étudiants (mêmes lois que la base de exercice01,
+via random_columns), puis mesure calculate_final_grades_parallel avec 1, 2, 4, ...
+--max-workers processus, en comparant au moteur en colonnes sur un seul cœur.
+Le temps mesuré comprend la copie en mémoire partagée et le démarrage des processus.
+
+Utilisation :
+    python benchmarks/bench_parallel_grades.py --size 5000000 --max-workers 8
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import exercice01  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5_000_000, help="nombre d'étudiants")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="nombre maximal de processus")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = exercice01.random_columns(args.size, seed=args.seed)
+    print(f"{args.size} étudiants, {os.cpu_count()} cœur(s) disponible(s)")
+
+    start = perf_counter()
+    reference = exercice01.calculate_final_grades_vectorized(columns)
+    baseline = perf_counter() - start
+    print(f"Un seul processus (colonnes) : {baseline:.3f} s")
+
+    workers = 1
+    while workers <= args.max_workers:
+        start = perf_counter()
+        grades = exercice01.calculate_final_grades_parallel(columns, workers=workers)
+        elapsed = perf_counter() - start
+        assert (grades == reference).all()
+        print(f"{workers:>3} processus : {elapsed:.3f} s (accélération {baseline / elapsed:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
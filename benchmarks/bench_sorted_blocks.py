@@ -0,0 +1,60 @@
+"""
+Benchmark : SortedBlockList (blocs triés + bisect) contre bst.BinarySearchTree et bst.AVLTree.
+
+Mesure, pour des clés aléatoires, le temps d'insertion une à une, de recherche
+(moitié de clés présentes, moitié absentes) et de parcours en ordre.
+
+Utilisation :
+    python benchmarks/bench_sorted_blocks.py --size 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import AVLTree, BinarySearchTree  # noqa: E402
+from sorted_blocks import SortedBlockList  # noqa: E402
+
+
+def timed(func):
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+def run(name, container, keys, probes):
+    insert, find = container.insert, container.find
+    results = {
+        "insert": timed(lambda: [insert(k) for k in keys]),
+        "find": timed(lambda: [find(k) for k in probes]),
+        "in_order": timed(container.in_order),
+    }
+    return name, results
+
+
+def main(size):
+    random.seed(42)
+    keys = random.sample(range(size * 4), size)
+    probes = keys[: size // 2] + [k * 4 + 1 for k in range(size // 2)]
+    random.shuffle(probes)
+    rows = [
+        run("BinarySearchTree", BinarySearchTree(None), keys, probes),
+        run("AVLTree", AVLTree(None), keys, probes),
+        run("SortedBlockList", SortedBlockList(), keys, probes),
+    ]
+    baseline = rows[0][1]
+    print(f"{size} clés aléatoires (temps en secondes, gain par rapport à BinarySearchTree)")
+    print(f"{'conteneur':<18}" + "".join(f"{op:>22}" for op in baseline))
+    for name, results in rows:
+        cells = "".join(f"{t:>12.3f} ({baseline[op] / t:>5.1f}x)" for op, t in results.items())
+        print(f"{name:<18}{cells}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000, help="nombre de clés")
+    main(parser.parse_args().size)
@@ -0,0 +1,75 @@
+"""
+Benchmark des index de GestionEtudiants (BST Application 1).
+
+Compare, pour une recherche exacte par matricule, l'index de hachage (dictionnaire, O(1))
+et l'index ordonné (ABR équilibré, O(log n)) que la collection maintient en parallèle.
+Les matricules arrivent dans l'ordre croissant (« E0000001 », « E0000002 », ...), le cas
+qui faisait dégénérer l'ABR d'origine.
+
+Utilisation :
+    python benchmarks/bench_student_index.py --size 1000000 --queries 200000
+"""
+
+import argparse
+import os
+import random
+from importlib.util import module_from_spec, spec_from_file_location
+from time import perf_counter
+
+APPLICATION = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                           "BST Application 1 - Recherche dans une liste selon deux clés",
+                           "recherche_dans_une_liste_selon_deux_clés.py")
+
+
+def load_application():
+    # Le nom du script contient des espaces : il est chargé depuis son chemin
+    spec = spec_from_file_location("recherche_deux_cles", APPLICATION)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build(application, size, seed):
+    rng = random.Random(seed)
+    gestion = application.GestionEtudiants()
+    start = perf_counter()
+    for i in range(1, size + 1):
+        gestion.ajouter_etudiant(f"E{i:07d}", f"Etudiant{i}", round(rng.uniform(0, 20), 2))
+    return gestion, perf_counter() - start
+
+
+def timed(lookup, keys):
+    start = perf_counter()
+    for key in keys:
+        lookup(key)
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000, help="nombre d'étudiants")
+    parser.add_argument("--queries", type=int, default=200_000, help="nombre de recherches par index")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    application = load_application()
+    gestion, elapsed = build(application, args.size, args.seed)
+    print(f"Chargement de {args.size} étudiants (deux ABR + un index de hachage) : {elapsed:.2f} s")
+    print(f"Hauteur de l'ABR des matricules : {gestion.abr_matricule.root.height}")
+
+    rng = random.Random(args.seed + 1)
+    # Une recherche sur dix porte sur un matricule absent
+    keys = [f"E{rng.randint(1, args.size * 10 // 9):07d}" for _ in range(args.queries)]
+    hashed = timed(gestion.rechercher_par_matricule, keys)
+    ordered = timed(gestion.abr_matricule.search, keys)
+    print(f"{args.queries} recherches exactes par matricule :")
+    print(f"  index de hachage : {hashed:8.3f} s ({args.queries / hashed:>12,.0f} recherches/s)")
+    print(f"  index ordonné    : {ordered:8.3f} s ({args.queries / ordered:>12,.0f} recherches/s)")
+    print(f"  accélération     : {ordered / hashed:8.1f}x")
+
+    planned = timed(lambda key: gestion.rechercher(matricule=key), keys[:args.queries // 10])
+    print(f"{args.queries // 10} recherches via le planificateur (rechercher) : {planned:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Banc d'essai unifié : mesure les principales opérations du dépôt et produit un rapport JSON.
+
+Suites disponibles :
+  bst         BinarySearchTree et AVLTree : insertion, recherche et parcours sur des entrées
+              aléatoires, triées et asymétriques (beaucoup de doublons concentrés sur les petites valeurs)
+  students    GestionEtudiants (BST Application 1) : chargement et recherches
+  grades      exercice01 : calculate_final_grades (boucle) et version vectorisée, taille croissante
+  solver      numpy/linear equations.py : solve, cache de factorisations, gradient conjugué
+  regression  numpy/linear regression.py : polyfit et ajustement en flux
+
+Chaque mesure est répétée (--repeat) à la manière de timeit (perf_counter, nombre d'appels calibré) ;
+on retient, pour un appel, le meilleur temps et la médiane.
+Le rapport JSON (--output, sinon la sortie standard) peut être comparé à un rapport précédent
+avec --compare : les mesures plus lentes que --threshold fois la référence sont signalées, et le
+code de sortie vaut alors 1.
+
+Utilisation :
+    python benchmarks/run.py --output resultats.json
+    python benchmarks/run.py --suites bst students --quick --compare resultats.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from importlib.util import module_from_spec, spec_from_file_location
+from time import perf_counter
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+
+SUITES = {}
+
+
+def suite(function):
+    # Enregistrer une suite de mesures sous le nom de sa fonction
+    SUITES[function.__name__] = function
+    return function
+
+
+def load_script(relative_path, name):
+    # Charger un script dont le nom n'est pas un nom de module valide (espaces, accents)
+    spec = spec_from_file_location(name, os.path.join(ROOT, relative_path))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(operation, setup=None, repeat=3):
+    # Temps d'un appel de operation(), en secondes.
+    # Sans setup : comme timeit, le nombre d'appels par répétition est calibré (autorange) pour que
+    # chaque répétition dure au moins 0,2 s. Avec setup (opérations qui modifient leur état) :
+    # setup() prépare un état neuf, non chronométré, et chaque répétition mesure un appel operation(état).
+    if setup is None:
+        timer = timeit.Timer(operation)
+        number, _ = timer.autorange()
+        timings = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    else:
+        number = 1
+        timings = []
+        for _ in range(repeat):
+            state = setup()
+            start = perf_counter()
+            operation(state)
+            timings.append(perf_counter() - start)
+    return {"best": min(timings), "median": statistics.median(timings), "repeat": repeat, "number": number}
+
+
+def record(results, suite_name, name, params, timing):
+    entry = {"suite": suite_name, "name": name, "params": params, **timing}
+    results.append(entry)
+    print(f"  {name:<34} {json.dumps(params):<44} {timing['best']:10.5f} s", file=sys.stderr)
+
+
+def key_inputs(kind, n, rng):
+    if kind == "random":
+        return rng.sample(range(n * 10), n)
+    if kind == "sorted":
+        return list(range(n))
+    # Asymétrique : valeurs concentrées près de 0, avec de nombreux doublons
+    return [int(n * rng.random() ** 4) for _ in range(n)]
+
+
+@suite
+def bst(args, results):
+    from bst import AVLTree, BinarySearchTree
+
+    rng = random.Random(args.seed)
+    n = args.bst_size // (10 if args.quick else 1)
+    for cls in (BinarySearchTree, AVLTree):
+        for kind in ("random", "sorted", "skewed"):
+            keys = key_inputs(kind, n, rng)
+            queries = rng.sample(keys, min(len(keys), 1000))
+            params = {"tree": cls.__name__, "input": kind, "size": n}
+
+            def insert_all(tree, keys=keys):
+                for key in keys:
+                    tree.insert(key)
+
+            record(results, "bst", "insert", params,
+                   measure(insert_all, setup=lambda cls=cls: cls(None), repeat=args.repeat))
+            tree = cls(None)
+            insert_all(tree)
+            record(results, "bst", "find", dict(params, queries=len(queries)),
+                   measure(lambda: [tree.find(key) for key in queries], repeat=args.repeat))
+            for traversal in ("in_order", "pre_order", "post_order", "level_order"):
+                record(results, "bst", traversal, params, measure(getattr(tree, traversal), repeat=args.repeat))
+
+
+@suite
+def students(args, results):
+    application = load_script(os.path.join("BST Application 1 - Recherche dans une liste selon deux clés",
+                                            "recherche_dans_une_liste_selon_deux_clés.py"), "recherche_deux_cles")
+    rng = random.Random(args.seed)
+    n = args.students_size // (10 if args.quick else 1)
+    rows = [(f"E{i:07d}", f"Etudiant{i}", round(rng.uniform(0, 20), 2)) for i in rng.sample(range(n * 10), n)]
+    params = {"size": n}
+
+    def add_one_by_one(gestion):
+        for row in rows:
+            gestion.ajouter_etudiant(*row)
+
+    record(results, "students", "ajouter_etudiant", params,
+           measure(add_one_by_one, setup=application.GestionEtudiants, repeat=args.repeat))
+    record(results, "students", "ajouter_en_masse", params,
+           measure(lambda gestion: gestion.etudiants.ajouter_en_masse(application.Etudiant(*row) for row in rows),
+                   setup=application.GestionEtudiants, repeat=args.repeat))
+
+    gestion = application.GestionEtudiants()
+    add_one_by_one(gestion)
+    matricules = [rng.choice(rows)[0] for _ in range(10_000)]
+    moyennes = [rng.choice(rows)[2] for _ in range(10_000)]
+    lookups = {
+        "rechercher_par_matricule": lambda: [gestion.rechercher_par_matricule(m) for m in matricules],
+        "abr_matricule.search": lambda: [gestion.abr_matricule.search(m) for m in matricules],
+        "rechercher_tous_par_moyenne": lambda: [gestion.rechercher_tous_par_moyenne(m) for m in moyennes],
+        "rechercher_par_moyenne_entre": lambda: [gestion.rechercher_par_moyenne_entre(m, m + 0.05)
+                                                 for m in moyennes[:1000]],
+        "rechercher composite": lambda: [gestion.rechercher(moyenne=(m, m + 1), matricule=("E0000000", "E0100000"))
+                                         for m in moyennes[:1000]],
+    }
+    for name, operation in lookups.items():
+        queries = 1000 if name in ("rechercher_par_moyenne_entre", "rechercher composite") else 10_000
+        record(results, "students", name, dict(params, queries=queries), measure(operation, repeat=args.repeat))
+
+
+@suite
+def grades(args, results):
+    import exercice01
+    from bench_final_grades import as_database
+
+    original = exercice01.database
+    sizes = [1000, 10_000, 100_000] if not args.quick else [1000, 10_000]
+    try:
+        for size in sizes:
+            columns = exercice01.random_columns(size, seed=args.seed)
+            exercice01.database = as_database(columns)
+            record(results, "grades", "calculate_final_grades", {"size": size},
+                   measure(exercice01.calculate_final_grades, repeat=args.repeat))
+            record(results, "grades", "calculate_final_grades_vectorized", {"size": size},
+                   measure(lambda: exercice01.calculate_final_grades_vectorized(columns), repeat=args.repeat))
+            record(results, "grades", "AttendanceIndex", {"size": size},
+                   measure(lambda: exercice01.AttendanceIndex(exercice01.database), repeat=args.repeat))
+    finally:
+        exercice01.database = original
+
+
+@suite
+def solver(args, results):
+    import numpy as np
+    from bench_conjugate_gradient import reaction_diffusion
+
+    equations = load_script(os.path.join("numpy", "linear equations.py"), "linear_equations")
+    rng = np.random.default_rng(args.seed)
+    for n in ([100, 400] if args.quick else [100, 400, 1000]):
+        A = rng.random((n, n))
+        A = A @ A.T + n * np.eye(n)
+        B = rng.random((n, 100))
+        params = {"size": n, "rhs": 100}
+        record(results, "solver", "np.linalg.solve par colonne", params,
+               measure(lambda: [np.linalg.solve(A, B[:, j]) for j in range(B.shape[1])], repeat=args.repeat))
+        record(results, "solver", "FactorizationCache (à froid)", params,
+               measure(lambda cache: cache.solve(A, B), setup=equations.FactorizationCache, repeat=args.repeat))
+        cache = equations.FactorizationCache()
+        cache.solve(A, B)
+        record(results, "solver", "FactorizationCache (en cache)", params,
+               measure(lambda: cache.solve(A, B), repeat=args.repeat))
+    for m in ([32, 100] if args.quick else [32, 100, 316]):
+        matvec, diagonal, _ = reaction_diffusion(m, args.seed)
+        b = rng.random(m * m)
+        for preconditioner in (None, "jacobi"):
+            record(results, "solver", "conjugate_gradient matvec",
+                   {"size": m * m, "preconditioner": preconditioner},
+                   measure(lambda: equations.conjugate_gradient(matvec, b, tol=1e-8, preconditioner=preconditioner,
+                                                                diagonal=diagonal), repeat=args.repeat))
+
+
+@suite
+def regression(args, results):
+    import numpy as np
+
+    regression_script = load_script(os.path.join("numpy", "linear regression.py"), "linear_regression")
+    rng = np.random.default_rng(args.seed)
+    for n in ([100_000] if args.quick else [100_000, 1_000_000]):
+        x = rng.uniform(-5, 5, n)
+        y = 0.5 * x ** 2 - 2 * x + 3 + rng.normal(0, 1, n)
+        for degree in (1, 3):
+            params = {"size": n, "degree": degree}
+            record(results, "regression", "np.polyfit", params,
+                   measure(lambda: np.polyfit(x, y, degree), repeat=args.repeat))
+            record(results, "regression", "StreamingLeastSquares", dict(params, chunk=10_000),
+                   measure(lambda: regression_script.StreamingLeastSquares(degree=degree).fit(
+                       regression_script.iter_chunks(x, y, 10_000)).coefficients, repeat=args.repeat))
+
+
+def result_key(entry):
+    return entry["suite"], entry["name"], json.dumps(entry["params"], sort_keys=True)
+
+
+def compare(results, reference_path, threshold):
+    # Comparer aux mesures d'un rapport précédent ; retourne le nombre de régressions
+    with open(reference_path, encoding="utf-8") as file:
+        reference = {result_key(entry): entry for entry in json.load(file)["results"]}
+    regressions = 0
+    print(f"\nComparaison avec {reference_path} (seuil {threshold:.2f}x) :", file=sys.stderr)
+    for entry in results:
+        previous = reference.get(result_key(entry))
+        if previous is None:
+            continue
+        ratio = entry["best"] / previous["best"]
+        entry["ratio"] = ratio
+        if ratio > threshold:
+            regressions += 1
+            print(f"  RÉGRESSION {entry['suite']}/{entry['name']} {json.dumps(entry['params'])} : {ratio:.2f}x",
+                  file=sys.stderr)
+    print(f"  {regressions} régression(s)", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suites", nargs="+", choices=sorted(SUITES), default=list(SUITES))
+    parser.add_argument("--repeat", type=int, default=3, help="nombre de répétitions de chaque mesure")
+    parser.add_argument("--quick", action="store_true", help="tailles réduites (vérification rapide)")
+    parser.add_argument("--bst-size", type=int, default=3000)
+    parser.add_argument("--students-size", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="fichier JSON de sortie (par défaut : sortie standard)")
+    parser.add_argument("--compare", help="rapport JSON de référence")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ralentissement toléré avant signalement")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.suites:
+        print(f"[{name}]", file=sys.stderr)
+        SUITES[name](args, results)
+
+    regressions = compare(results, args.compare, args.threshold) if args.compare else 0
+    report = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "arguments": vars(args),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,17 @@
 
-from collections import deque
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from heapq import merge
+from itertools import islice, takewhile
+from math import log2
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    if not hasattr(np, "ndarray"):  # Le dossier numpy/ du dépôt masque le paquet s'il n'est pas installé
+        np = None
 
 class Node:
     """
@@ -8,12 +20,18 @@ class Node:
         data : Valeur stockée dans le nœud.
         left : Référence au nœud enfant gauche.
         right : Référence au nœud enfant droit.
+        size : Nombre de nœuds du sous-arbre enraciné en ce nœud (lui compris).
+    Les attributs sont déclarés dans __slots__ : pas de __dict__ par nœud, ce qui réduit
+    fortement la mémoire occupée par les grands arbres.
     """
 
+    __slots__ = ("data", "left", "right", "size")
+
     def __init__(self, data):
         self.data = data
         self.left = None
         self.right = None
+        self.size = 1
 
     def __str__(self):
         return f"Node({self.data})"
@@ -25,6 +43,20 @@ class Node:
         return isinstance(other, Node) and self.data < other.data
 
 
+class AVLNode(Node):
+    """
+    Nœud d'un arbre AVL : un nœud classique qui mémorise en plus sa hauteur.
+    Attributs :
+        height : Hauteur du sous-arbre enraciné en ce nœud (une feuille a une hauteur de 1).
+    """
+
+    __slots__ = ("height",)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
 class BinarySearchTree:
     """
     Classe représentant un arbre binaire de recherche.
@@ -32,9 +64,12 @@ class BinarySearchTree:
         root : Le nœud racine de l'arbre.
     """
 
+    _node_class = Node
+
     def __init__(self, data):
+        self._snapshot = None  # Tableau trié des clés, construit à la demande par les opérations groupées
         if isinstance(data, (int, float, str)):
-            self.root = Node(data)
+            self.root = self._node_class(data)
         elif isinstance(data, list):
             self.root = self.from_list(data)
         elif isinstance(data, set):
@@ -63,10 +98,11 @@ class BinarySearchTree:
         Modifier la valeur stockée dans la racine de l'arbre.
         Si la racine n'existe pas, elle est créée avec la valeur donnée.
         """
+        self._snapshot = None
         if self.root:
             self.root.data = value
         else:
-            self.root = Node(value)
+            self.root = self._node_class(value)
 
     def get_left_subtree(self):
         """
@@ -84,22 +120,110 @@ class BinarySearchTree:
 
     def _insert(self, root, data):
         """
-        Méthode auxiliaire pour insérer récursivement un nouveau nœud dans l'arbre binaire de recherche.
+        Méthode auxiliaire pour insérer un nouveau nœud dans l'arbre binaire de recherche.
+        Parcours itératif : aucune récursion, même sur un arbre dégénéré.
+        Retourne la racine de l'arbre.
         """
+        new_node = self._node_class(data)
         if root is None:
-            return Node(data)
-        if data < root.data:
-            root.left = self._insert(root.left, data)
-        else:
-            root.right = self._insert(root.right, data)
-        return root
+            return new_node
+        current = root
+        while True:
+            # Le nouveau nœud appartiendra au sous-arbre de chaque nœud traversé
+            current.size += 1
+            if data < current.data:
+                if current.left is None:
+                    current.left = new_node
+                    return root
+                current = current.left
+            else:
+                if current.right is None:
+                    current.right = new_node
+                    return root
+                current = current.right
 
     def insert(self, data):
         """
         Méthode publique pour insérer un nouveau nœud dans l'arbre binaire de recherche.
         """
+        self._snapshot = None
         self.root = self._insert(self.root, data)
 
+    def _delete(self, root, data):
+        """
+        Méthode auxiliaire pour supprimer itérativement un nœud portant la valeur data.
+        Un nœud à deux enfants prend la valeur de son successeur, qui est ensuite détaché.
+        Retourne un couple (nouvelle racine, True si un nœud a été supprimé).
+        """
+        path = []
+        node = root
+        while node is not None and node.data != data:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        if node is None:
+            return root, False
+        if node.left and node.right:
+            # Deux enfants : remplacer par le successeur (minimum du sous-arbre droit)
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+        child = node.left or node.right
+        if not path:
+            return child, True
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        # Chaque ancêtre perd un nœud dans son sous-arbre
+        for ancestor in path:
+            ancestor.size -= 1
+        return root, True
+
+    def discard(self, data):
+        """
+        Supprimer une occurrence de la valeur data si elle est présente.
+        Retourne True si un nœud a été supprimé, sinon False. Coût en O(hauteur).
+        """
+        self.root, deleted = self._delete(self.root, data)
+        if deleted:
+            self._snapshot = None
+        return deleted
+
+    def delete(self, data):
+        """
+        Supprimer une occurrence de la valeur data.
+        Lève KeyError si la valeur n'est pas dans l'arbre.
+        """
+        if not self.discard(data):
+            raise KeyError(data)
+
+    def pop_min(self):
+        """
+        Retirer et retourner la plus petite valeur de l'arbre.
+        Lève KeyError si l'arbre est vide.
+        """
+        if self.is_empty():
+            raise KeyError("pop_min sur un arbre vide")
+        value = self.find_minimum()
+        self.discard(value)
+        return value
+
+    def pop_max(self):
+        """
+        Retirer et retourner la plus grande valeur de l'arbre.
+        Lève KeyError si l'arbre est vide.
+        """
+        if self.is_empty():
+            raise KeyError("pop_max sur un arbre vide")
+        value = self.find_maximum()
+        self.discard(value)
+        return value
+
     def find_minimum(self):
         """
         Trouver le nœud avec la valeur minimale dans l'arbre binaire de recherche.
@@ -112,67 +236,299 @@ class BinarySearchTree:
             current = current.left
         return current.data
 
+    def find_maximum(self):
+        """
+        Trouver le nœud avec la valeur maximale dans l'arbre binaire de recherche.
+        Retourne la valeur maximale si l'arbre n'est pas vide, sinon None.
+        """
+        if self.is_empty():
+            return None
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.data
+
+    def floor(self, data):
+        """
+        Retourner la plus grande valeur inférieure ou égale à data, ou None si elle n'existe pas.
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                return node.data
+            if node.data < data:
+                best = node.data
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def ceiling(self, data):
+        """
+        Retourner la plus petite valeur supérieure ou égale à data, ou None si elle n'existe pas.
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                return node.data
+            if node.data > data:
+                best = node.data
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def successor(self, data):
+        """
+        Retourner la plus petite valeur strictement supérieure à data, ou None si elle n'existe pas.
+        La valeur data n'a pas besoin d'être présente dans l'arbre.
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data > data:
+                best = node.data
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def predecessor(self, data):
+        """
+        Retourner la plus grande valeur strictement inférieure à data, ou None si elle n'existe pas.
+        La valeur data n'a pas besoin d'être présente dans l'arbre.
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data < data:
+                best = node.data
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def range(self, low, high):
+        """
+        Parcourir paresseusement, en ordre croissant, les valeurs de l'intervalle fermé [low, high].
+        Seuls les sous-arbres qui chevauchent l'intervalle sont visités : O(hauteur + k) pour k résultats.
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.data < low:
+                    # Tout le sous-arbre gauche est aussi inférieur à low
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.data > high:
+                # Le parcours est croissant : plus aucune valeur ne peut convenir
+                return
+            yield node.data
+            node = node.right
+
     def calculate_size(self):
         """
         Calculer la taille de l'arbre binaire de recherche (nombre total de nœuds).
-        Retourne un entier représentant la taille de l'arbre.
+        Retourne un entier représentant la taille de l'arbre, lu en O(1) sur la racine.
+        """
+        return self.root.size if self.root else 0
+
+    def __len__(self):
+        return self.calculate_size()
+
+    def select(self, k):
+        """
+        Retourner le k-ième plus petit élément (k commence à 0, un k négatif compte depuis la fin).
+        Descente unique guidée par la taille des sous-arbres : O(hauteur).
+        Lève IndexError si k est hors limites.
+        """
+        size = len(self)
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError("indice hors de l'arbre")
+        return self._select(k)
+
+    def _select(self, k):
+        """Méthode auxiliaire : k-ième plus petit nœud de l'arbre (0 <= k < nombre de nœuds)."""
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.data
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def _count_before(self, data, inclusive):
         """
+        Méthode auxiliaire : nombre d'éléments strictement inférieurs à data
+        (ou inférieurs ou égaux si inclusive est vrai), en O(hauteur).
+        """
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.data < data or (inclusive and node.data == data):
+                count += (node.left.size if node.left else 0) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
 
-        def _size(node):
-            if not node:
-                return 0
-            return 1 + _size(node.left) + _size(node.right)
+    def rank(self, data):
+        """
+        Retourner le rang de data : le nombre d'éléments strictement inférieurs à data.
+        La valeur n'a pas besoin d'être présente dans l'arbre.
+        """
+        return self._count_before(data, inclusive=False)
 
-        return _size(self.root)
+    def count_between(self, low, high):
+        """
+        Compter les éléments compris dans l'intervalle fermé [low, high], en O(hauteur).
+        """
+        if high < low:
+            return 0
+        return self._count_before(high, inclusive=True) - self._count_before(low, inclusive=False)
 
     def find(self, data):
         """
         Rechercher un nœud avec une valeur spécifique dans l'arbre binaire de recherche.
         Retourne True si la valeur est trouvée, sinon False.
         """
-
-        def _find(node, data):
-            if node is None:
-                return False
+        node = self.root
+        while node is not None:
             if node.data == data:
                 return True
             elif data < node.data:
-                return _find(node.left, data)
+                node = node.left
             else:
-                return _find(node.right, data)
+                node = node.right
+        return False
+
+    def _sorted_snapshot(self):
+        """
+        Méthode auxiliaire : tableau NumPy trié de toutes les clés, construit en O(n) puis réutilisé
+        tant que l'arbre n'est pas modifié par insert, delete, clear ou set_root_value.
+        """
+        if self._snapshot is None:
+            self._snapshot = np.array(self.in_order())
+        return self._snapshot
+
+    @staticmethod
+    def _as_numeric_array(keys):
+        """Méthode auxiliaire : convertir keys en tableau NumPy numérique, ou retourner None."""
+        array = np.asarray(keys)
+        return array if array.dtype.kind in "iuf" else None
+
+    def contains_mask(self, keys):
+        """
+        Tester l'appartenance d'un lot de clés en un seul appel.
+        Retourne un tableau NumPy de booléens (mask[i] vaut True si keys[i] est dans l'arbre).
+        Pour des clés numériques, la recherche est vectorisée avec np.searchsorted sur un
+        instantané trié des clés, au lieu de parcourir l'arbre une fois par clé.
+        """
+        if np is None:
+            raise ImportError("contains_mask nécessite NumPy")
+        array = self._as_numeric_array(keys)
+        snapshot = self._sorted_snapshot() if array is not None else None
+        if snapshot is None or snapshot.dtype.kind not in "iuf":
+            return np.fromiter((self.find(key) for key in keys), dtype=bool, count=len(keys))
+        positions = np.searchsorted(snapshot, array)
+        found = positions < snapshot.size
+        found[found] = snapshot[positions[found]] == array[found]
+        return found
+
+    def find_many(self, keys):
+        """
+        Rechercher un lot de clés (liste ou tableau NumPy).
+        Retourne un tableau NumPy de booléens si NumPy est disponible, sinon une liste de booléens.
+        """
+        if np is None:
+            find = self.find
+            return [find(key) for key in keys]
+        return self.contains_mask(keys)
 
-        return _find(self.root, data)
+    def insert_many(self, keys):
+        """
+        Insérer un lot de clés (liste ou tableau NumPy).
+        Un petit lot est inséré clé par clé. Un lot important est trié puis fusionné avec les clés
+        existantes, et l'arbre est reconstruit équilibré en O(n + m) : on évite m parcours de l'arbre.
+        """
+        count = len(keys)
+        if not count:
+            return
+        array = self._as_numeric_array(keys) if np is not None else None
+        if array is not None and isinstance(keys, np.ndarray):
+            keys = array.tolist()  # Scalaires Python : l'arbre ne doit pas contenir de np.float64
+        size = len(self)
+        if count * log2(size + 2) < size:
+            for key in keys:
+                self.insert(key)
+            return
+        snapshot = self._sorted_snapshot() if array is not None else None
+        if snapshot is not None and (not size or snapshot.dtype == array.dtype):
+            # Clés numériques de même type : tri et fusion vectorisés
+            merged = np.concatenate((snapshot, array)) if size else array.copy()
+            merged.sort(kind="stable")
+            values = merged.tolist()
+        else:
+            merged = None
+            values = list(merge(self, sorted(keys)))
+        self._clear_subtree(self.root)
+        self.root = self._build_balanced(values, 0, len(values))
+        self._snapshot = merged
 
-    def _clear_recursive(self, node):
+    def _clear_subtree(self, node):
         """
-        Méthode auxiliaire pour supprimer récursivement tous les nœuds de l'arbre.
+        Méthode auxiliaire pour détacher tous les nœuds d'un sous-arbre à l'aide d'une pile explicite.
         """
-        if node:
-            # Supprimer récursivement les sous-arbres gauche et droit
-            self._clear_recursive(node.left)
-            self._clear_recursive(node.right)
-            # Supprimer le nœud actuel
-            node.left = None
-            node.right = None
+        stack = [node] if node else []
+        while stack:
+            current = stack.pop()
+            if current.left:
+                stack.append(current.left)
+            if current.right:
+                stack.append(current.right)
+            # Supprimer les liens du nœud actuel
+            current.left = None
+            current.right = None
 
     def clear(self):
         """
-        Supprimer tous les nœuds de l'arbre en appelant la méthode auxiliaire récursive.
+        Supprimer tous les nœuds de l'arbre en appelant la méthode auxiliaire.
         """
-        self._clear_recursive(self.root)
+        self._snapshot = None
+        self._clear_subtree(self.root)
         self.root = None
 
     def _count_leaves(self, node):
         """
-        Méthode auxiliaire pour compter le nombre de feuilles dans l'arbre de manière récursive.
+        Méthode auxiliaire pour compter le nombre de feuilles d'un sous-arbre à l'aide d'une pile explicite.
         """
-        if node is None:
-            return 0
-        # Si le nœud est une feuille (aucun enfant gauche ni droit)
-        if node.left is None and node.right is None:
-            return 1
-        # Sinon, compter les feuilles dans les sous-arbres gauche et droit
-        return self._count_leaves(node.left) + self._count_leaves(node.right)
+        leaves = 0
+        stack = [node] if node else []
+        while stack:
+            current = stack.pop()
+            # Si le nœud est une feuille (aucun enfant gauche ni droit)
+            if current.left is None and current.right is None:
+                leaves += 1
+                continue
+            # Sinon, explorer les sous-arbres gauche et droit
+            if current.left:
+                stack.append(current.left)
+            if current.right:
+                stack.append(current.right)
+        return leaves
 
     def count_leaves(self):
         """
@@ -181,12 +537,78 @@ class BinarySearchTree:
         """
         return self._count_leaves(self.root)
 
+    def _iter_in_order(self, node):
+        """Générateur auxiliaire : parcours en ordre (infixe) avec une pile explicite de taille O(hauteur)."""
+        stack = []
+        pop, push = stack.pop, stack.append
+        while stack or node:
+            # Descendre le plus à gauche possible
+            while node:
+                push(node)
+                node = node.left
+            node = pop()
+            yield node.data
+            node = node.right
+
+    def _iter_reverse_order(self, node):
+        """Générateur auxiliaire : parcours en ordre décroissant (symétrique du parcours infixe)."""
+        stack = []
+        pop, push = stack.pop, stack.append
+        while stack or node:
+            # Descendre le plus à droite possible
+            while node:
+                push(node)
+                node = node.right
+            node = pop()
+            yield node.data
+            node = node.left
+
+    def _iter_post_order(self, node):
+        """Générateur auxiliaire : parcours post-ordre (postfixe) avec une pile explicite."""
+        stack = []
+        pop, push = stack.pop, stack.append
+        last_visited = None
+        while stack or node:
+            while node:
+                push(node)
+                node = node.left
+            top = stack[-1]
+            # Explorer le sous-arbre droit s'il n'a pas encore été visité
+            right = top.right
+            if right and right is not last_visited:
+                node = right
+            else:
+                yield top.data
+                last_visited = pop()
+
+    def _iter_pre_order(self, node):
+        """Générateur auxiliaire : parcours pré-ordre (préfixe) avec une pile explicite."""
+        stack = [node] if node else []
+        pop, push = stack.pop, stack.append
+        while stack:
+            node = pop()
+            yield node.data
+            # Empiler le fils droit en premier pour visiter le gauche d'abord
+            if node.right:
+                push(node.right)
+            if node.left:
+                push(node.left)
+
+    def _iter_level_order(self, node):
+        """Générateur auxiliaire : parcours en largeur (mémoire proportionnelle à la largeur d'un niveau)."""
+        queue = deque([node] if node else [])
+        popleft, push = queue.popleft, queue.append
+        while queue:
+            node = popleft()
+            yield node.data
+            if node.left:
+                push(node.left)
+            if node.right:
+                push(node.right)
+
     def _in_order_traversal(self, node, result):
         """Méthode auxiliaire pour effectuer un parcours en ordre (infixe)."""
-        if node:
-            self._in_order_traversal(node.left, result)
-            result.append(node.data)
-            self._in_order_traversal(node.right, result)
+        result.extend(self._iter_in_order(node))
 
     def in_order(self):
         """Retourner les éléments de l'arbre selon le parcours en ordre."""
@@ -196,10 +618,7 @@ class BinarySearchTree:
 
     def _post_order_traversal(self, node, result):
         """Méthode auxiliaire pour effectuer un parcours post-ordre (postfixe)."""
-        if node:
-            self._post_order_traversal(node.left, result)
-            self._post_order_traversal(node.right, result)
-            result.append(node.data)
+        result.extend(self._iter_post_order(node))
 
     def post_order(self):
         """Retourner les éléments de l'arbre selon le parcours post-ordre."""
@@ -209,10 +628,7 @@ class BinarySearchTree:
 
     def _pre_order_traversal(self, node, result):
         """Méthode auxiliaire pour effectuer un parcours pré-ordre (préfixe)."""
-        if node:
-            result.append(node.data)
-            self._pre_order_traversal(node.left, result)
-            self._pre_order_traversal(node.right, result)
+        result.extend(self._iter_pre_order(node))
 
     def pre_order(self):
         """Retourner les éléments de l'arbre selon le parcours pré-ordre."""
@@ -222,22 +638,39 @@ class BinarySearchTree:
 
     def level_order(self):
         """Retourner les éléments de l'arbre selon le parcours en largeur (breadth-first)."""
-        if not self.root:
-            return []
+        return list(self._iter_level_order(self.root))
 
-        result = []
-        queue = deque([self.root])
+    def iter_in_order(self):
+        """
+        Parcourir paresseusement les éléments en ordre croissant.
+        La mémoire utilisée est en O(hauteur) et le parcours peut être interrompu à tout moment,
+        par exemple avec itertools.islice (k premiers éléments) ou itertools.takewhile.
+        """
+        return self._iter_in_order(self.root)
 
-        while queue:
-            node = queue.popleft()
-            result.append(node.data)
+    def iter_reverse_order(self):
+        """Parcourir paresseusement les éléments en ordre décroissant, en mémoire O(hauteur)."""
+        return self._iter_reverse_order(self.root)
 
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
+    def iter_pre_order(self):
+        """Parcourir paresseusement les éléments selon le parcours pré-ordre."""
+        return self._iter_pre_order(self.root)
 
-        return result
+    def iter_post_order(self):
+        """Parcourir paresseusement les éléments selon le parcours post-ordre."""
+        return self._iter_post_order(self.root)
+
+    def iter_level_order(self):
+        """Parcourir paresseusement les éléments selon le parcours en largeur."""
+        return self._iter_level_order(self.root)
+
+    def __iter__(self):
+        """Itérer sur les éléments de l'arbre en ordre croissant, sans construire de liste."""
+        return self._iter_in_order(self.root)
+
+    def __reversed__(self):
+        """Itérer sur les éléments de l'arbre en ordre décroissant, sans construire de liste."""
+        return self._iter_reverse_order(self.root)
 
     def is_degenerate(self):
         """
@@ -246,30 +679,171 @@ class BinarySearchTree:
         c'est-à-dire qu'il n'a qu'un seul enfant pour chaque nœud.
         Retourne True si l'arbre est dégénéré, sinon False.
         """
-
-        def _is_degenerate(node):
-            if node is None:
-                return True  # Si le nœud est vide, il est dégénéré par définition
+        # Un arbre vide est dégénéré par définition ; on suit l'unique chemin de la racine
+        node = self.root
+        while node is not None:
             if node.left and node.right:  # Si le nœud a deux enfants
                 return False
-            # Si un seul enfant est présent, vérifier les sous-arbres
-            return _is_degenerate(node.left) and _is_degenerate(node.right)
+            node = node.left or node.right
+        return True
 
-        return _is_degenerate(self.root)
+    def height(self):
+        """
+        Calculer la hauteur de l'arbre (nombre de nœuds sur le plus long chemin racine-feuille).
+        Retourne 0 pour un arbre vide.
+        """
+        height = 0
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return height
+
+    def is_balanced(self):
+        """
+        Vérifier que l'arbre respecte la condition d'équilibre AVL :
+        pour chaque nœud, les hauteurs des deux sous-arbres diffèrent d'au plus 1.
+        Retourne True si l'arbre est équilibré, sinon False.
+        """
+        # Parcours post-ordre itératif : la hauteur d'un nœud est calculée après celles de ses enfants
+        # Les nœuds ne sont pas hachables (__eq__ redéfini) : on indexe par leur identité
+        heights = {}
+        stack = [(self.root, False)] if self.root else []
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                if node.right:
+                    stack.append((node.right, False))
+                if node.left:
+                    stack.append((node.left, False))
+                continue
+            left = heights.pop(id(node.left)) if node.left else 0
+            right = heights.pop(id(node.right)) if node.right else 0
+            if abs(left - right) > 1:
+                return False
+            heights[id(node)] = 1 + max(left, right)
+        return True
 
     def __str__(self):
         """
         Représentation sous forme de chaîne de l'arbre binaire de recherche en tant que liste triée.
+        Les éléments sont lus directement depuis le parcours paresseux, sans liste intermédiaire.
+        """
+        return "[" + ", ".join(map(repr, self)) + "]"
+
+    @staticmethod
+    def _update(node):
+        """
+        Mettre à jour les informations qu'un nœud déduit de ses enfants (ici la taille du sous-arbre).
+        Redéfinie par les variantes qui enrichissent davantage les nœuds.
+        """
+        node.size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+
+    @staticmethod
+    def _is_sorted(data):
+        return all(a <= b for a, b in zip(data, islice(data, 1, None)))
+
+    @classmethod
+    def _build_balanced(cls, data, low, high):
+        """
+        Méthode auxiliaire pour construire un sous-arbre équilibré à partir de data[low:high] (trié).
+        L'élément médian devient la racine ; la profondeur de récursion est en O(log n).
+        """
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = cls._node_class(data[middle])
+        node.left = cls._build_balanced(data, low, middle)
+        node.right = cls._build_balanced(data, middle + 1, high)
+        cls._update(node)
+        return node
+
+    @classmethod
+    def from_sorted(cls, data):
+        """
+        Construire un arbre parfaitement équilibré à partir d'une séquence déjà triée, en O(n).
+        Chaque élément est lu une seule fois : aucune comparaison n'est faite pour l'insertion.
+        Lève ValueError si la séquence n'est pas triée.
+        """
+        if not cls._is_sorted(data):
+            raise ValueError("from_sorted attend des données triées par ordre croissant")
+        return cls._build_balanced(data, 0, len(data))
+
+    @classmethod
+    def from_sorted_iter(cls, iterable):
         """
-        return str(self.in_order())
+        Construire un arbre de hauteur minimale à partir d'un itérable trié de longueur inconnue, en O(n).
+        Les éléments sont consommés au fil de l'eau : seuls O(log n) nœuds « en attente » sont conservés
+        en plus de l'arbre lui-même. Lève ValueError si l'itérable n'est pas trié.
+        """
+        # Le i-ème élément (à partir de 1) occupe, dans un arbre parfait infini numéroté en ordre infixe,
+        # le niveau k = nombre de zéros terminaux de i. Son fils gauche est le dernier nœud vu au niveau
+        # k - 1 et il devient le fils droit du dernier nœud vu au niveau k + 1 (position i - 2**k).
+        last = []  # last[k] : (position, nœud) du dernier nœud placé au niveau k
+        previous = None
+        position = 0
+        for position, value in enumerate(iterable, 1):
+            if position > 1 and value < previous:
+                raise ValueError("from_sorted_iter attend des données triées par ordre croissant")
+            previous = value
+            node = cls._node_class(value)
+            level = (position & -position).bit_length() - 1
+            if level:
+                node.left = last[level - 1][1]
+            if level + 1 < len(last) and last[level + 1][0] == position - (1 << level):
+                last[level + 1][1].right = node
+            if level == len(last):
+                last.append((position, node))
+            else:
+                last[level] = (position, node)
+        if not position:
+            return None
+
+        # Raccrocher les nœuds dont le fils droit « théorique » n'existe pas : le sous-arbre droit
+        # d'un nœud de la branche droite est le nœud de plus haut niveau placé après lui.
+        level = len(last) - 1
+        root_position, root = last[level]
+        node_position, node = root_position, root
+        while True:
+            for lower in range(level - 1, -1, -1):
+                if last[lower][0] > node_position:
+                    break
+            else:
+                break
+            node.right = last[lower][1]
+            node_position, node = last[lower]
+            level = lower
+
+        cls._update_subtree(root)
+        return root
+
+    @classmethod
+    def _update_subtree(cls, node):
+        """Méthode auxiliaire pour recalculer, en post-ordre itératif, les informations de tous les nœuds."""
+        stack = [(node, False)] if node else []
+        while stack:
+            current, children_done = stack.pop()
+            if children_done:
+                cls._update(current)
+                continue
+            stack.append((current, True))
+            if current.right:
+                stack.append((current.right, False))
+            if current.left:
+                stack.append((current.left, False))
 
     @classmethod
     def from_list(cls, data):
         """
         Construire un arbre binaire de recherche à partir d'une liste d'éléments.
+        Une liste déjà triée est chargée en O(n) sous forme d'arbre équilibré ;
+        sinon les éléments sont insérés dans l'ordre de la liste.
         """
         if not data:
             return None
+        if cls._is_sorted(data):
+            return cls._build_balanced(data, 0, len(data))
         tree = cls(data[0])  # Initialiser l'arbre avec le premier élément
         for item in data[1:]:
             tree.insert(item)
@@ -279,15 +853,333 @@ class BinarySearchTree:
     def from_dict(cls, data):
         """
         Construire un arbre binaire de recherche à partir d'un dictionnaire (en utilisant ses valeurs).
+        Les valeurs sont triées puis chargées en O(n).
         """
-        return cls.from_list(list(data.values()))
+        return cls.from_sorted(sorted(data.values()))
 
     @classmethod
     def from_set(cls, data):
         """
-        Construire un arbre binaire de recherche à partir d'un ensemble (trié avant insertion).
+        Construire un arbre binaire de recherche à partir d'un ensemble (trié puis chargé en O(n)).
+        """
+        return cls.from_sorted(sorted(data))
+
+
+class AVLTree(BinarySearchTree):
+    """
+    Arbre binaire de recherche auto-équilibré (AVL).
+    Même interface que BinarySearchTree, mais la hauteur reste en O(log n)
+    quel que soit l'ordre d'insertion : insertion, suppression et recherche
+    sont donc garanties en O(log n), même pour des données déjà triées.
+    """
+
+    _node_class = AVLNode
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    @staticmethod
+    def _update(node):
+        left, right = node.left, node.right
+        node.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+    def _balance_factor(self, node):
+        return self._height(node.left) - self._height(node.right)
+
+    def _rotate_right(self, node):
+        """Rotation simple à droite autour de node, retourne la nouvelle racine du sous-arbre."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_left(self, node):
+        """Rotation simple à gauche autour de node, retourne la nouvelle racine du sous-arbre."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        """
+        Méthode auxiliaire pour rétablir l'équilibre d'un nœud après une modification
+        de l'un de ses sous-arbres. Retourne la nouvelle racine du sous-arbre.
+        """
+        self._update(node)
+        balance = self._balance_factor(node)
+        if balance > 1:
+            # Cas gauche-droite : ramener d'abord au cas gauche-gauche
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            # Cas droite-gauche : ramener d'abord au cas droite-droite
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _insert(self, root, data):
+        """
+        Méthode auxiliaire pour insérer un nouveau nœud puis rééquilibrer le chemin parcouru.
+        """
+        if root is None:
+            return self._node_class(data)
+        if data < root.data:
+            root.left = self._insert(root.left, data)
+        else:
+            root.right = self._insert(root.right, data)
+        return self._rebalance(root)
+
+    def _delete(self, root, data):
+        """
+        Méthode auxiliaire pour supprimer un nœud portant la valeur data.
+        Retourne un couple (nouvelle racine du sous-arbre, True si un nœud a été supprimé).
+        """
+        if root is None:
+            return None, False
+        if data < root.data:
+            root.left, deleted = self._delete(root.left, data)
+        elif data > root.data:
+            root.right, deleted = self._delete(root.right, data)
+        else:
+            deleted = True
+            if root.left is None:
+                return root.right, deleted
+            if root.right is None:
+                return root.left, deleted
+            # Deux enfants : remplacer par le successeur (minimum du sous-arbre droit)
+            successor = root.right
+            while successor.left:
+                successor = successor.left
+            root.data = successor.data
+            root.right, _ = self._delete(root.right, successor.data)
+        if not deleted:
+            return root, False
+        return self._rebalance(root), deleted
+
+    def height(self):
+        """
+        Hauteur de l'arbre, lue directement sur la racine en O(1).
+        """
+        return self._height(self.root)
+
+    def balance_factor(self):
+        """
+        Facteur d'équilibre de la racine (hauteur gauche - hauteur droite),
+        toujours compris entre -1 et 1 pour un arbre AVL.
+        """
+        return self._balance_factor(self.root) if self.root else 0
+
+    @classmethod
+    def from_sorted_iter(cls, iterable):
+        """
+        Construire un arbre AVL à partir d'un itérable trié, en O(n).
+        La construction médiane est la seule à garantir la condition AVL : l'itérable est donc matérialisé.
+        """
+        return cls.from_sorted(list(iterable))
+
+
+class LazyDeletionTree(AVLTree):
+    """
+    Arbre AVL à suppression paresseuse (pierres tombales), pour les charges riches en suppressions.
+    Une suppression se contente de marquer la valeur comme supprimée en O(log n), sans rotation.
+    Quand la proportion de valeurs marquées dépasse compaction_ratio, l'arbre est reconstruit
+    en une seule passe O(n) à partir des valeurs vivantes : le coût de rééquilibrage est amorti
+    sur l'ensemble des suppressions.
+    Les requêtes d'ordre (select, rank, floor, ...) ne compactent pas l'arbre : elles corrigent les
+    tailles de sous-arbres par le nombre de valeurs marquées, gardées dans une liste triée, et coûtent
+    O(hauteur · log t) pour t valeurs marquées.
+    height, count_leaves, is_degenerate, get_root_value et les sous-arbres décrivent l'arbre physique,
+    nœuds marqués compris.
+    Attributs :
+        compaction_ratio : Proportion de valeurs marquées qui déclenche la compaction.
+    """
+
+    def __init__(self, data, compaction_ratio=0.25):
+        self.compaction_ratio = compaction_ratio
+        self._tombstones = Counter()  # valeur -> nombre d'occurrences marquées comme supprimées
+        self._dead = []  # Valeurs marquées triées (avec répétitions), pour les requêtes d'ordre
+        self._tombstone_count = 0
+        super().__init__(data)
+
+    def insert(self, data):
+        """
+        Insérer une valeur. Si une occurrence de cette valeur est marquée supprimée,
+        elle est simplement réactivée, sans nouveau nœud.
+        """
+        if self._tombstones[data]:
+            self._forget_tombstone(data)
+        else:
+            super().insert(data)
+
+    def _forget_tombstone(self, data):
+        self._tombstones[data] -= 1
+        if not self._tombstones[data]:
+            del self._tombstones[data]
+        del self._dead[bisect_left(self._dead, data)]
+        self._tombstone_count -= 1
+        self._snapshot = None
+
+    def _forget_all_tombstones(self):
+        self._tombstones.clear()
+        self._dead.clear()
+        self._tombstone_count = 0
+
+    def _physical_count(self, data):
+        """Nombre de nœuds portant la valeur data, marqués ou non."""
+        if self._tombstones[data]:
+            return super().count_between(data, data)
+        return 1 if super().find(data) else 0
+
+    def find(self, data):
+        """
+        Rechercher une valeur vivante.
+        Retourne True si la valeur est présente et non marquée supprimée, sinon False.
+        """
+        if not self._tombstones[data]:
+            return super().find(data)
+        return self._physical_count(data) > self._tombstones[data]
+
+    def discard(self, data):
+        """
+        Marquer une occurrence vivante de data comme supprimée, en O(log n).
+        Retourne True si une occurrence a été marquée, sinon False.
+        """
+        if not self.find(data):
+            return False
+        self._tombstones[data] += 1
+        insort(self._dead, data)
+        self._tombstone_count += 1
+        self._snapshot = None
+        if self._tombstone_count > self.compaction_ratio * self.root.size:
+            self.compact()
+        return True
+
+    def compact(self):
+        """
+        Retirer physiquement toutes les valeurs marquées : l'arbre est reconstruit
+        parfaitement équilibré à partir des valeurs vivantes triées, en O(n).
+        """
+        if not self._tombstone_count:
+            return
+        values = list(self)
+        self._forget_all_tombstones()
+        self._snapshot = None
+        self._clear_subtree(self.root)
+        self.root = self._build_balanced(values, 0, len(values))
+
+    def clear(self):
+        self._forget_all_tombstones()
+        super().clear()
+
+    def is_empty(self):
+        """Vrai si l'arbre ne contient aucune valeur vivante."""
+        return len(self) == 0
+
+    def calculate_size(self):
+        """Nombre de valeurs vivantes, en O(1)."""
+        return super().calculate_size() - self._tombstone_count
+
+    def _skip_tombstones(self, values):
+        """Générateur auxiliaire : filtrer les occurrences marquées d'un parcours."""
+        if not self._tombstone_count:
+            yield from values
+            return
+        pending = self._tombstones.copy()
+        for value in values:
+            if pending[value]:
+                pending[value] -= 1
+            else:
+                yield value
+
+    def _iter_in_order(self, node):
+        return self._skip_tombstones(super()._iter_in_order(node))
+
+    def _iter_reverse_order(self, node):
+        return self._skip_tombstones(super()._iter_reverse_order(node))
+
+    def _iter_pre_order(self, node):
+        return self._skip_tombstones(super()._iter_pre_order(node))
+
+    def _iter_post_order(self, node):
+        return self._skip_tombstones(super()._iter_post_order(node))
+
+    def _iter_level_order(self, node):
+        return self._skip_tombstones(super()._iter_level_order(node))
+
+    def find_minimum(self):
+        return self._select_live(0) if len(self) else None
+
+    def find_maximum(self):
+        return self._select_live(len(self) - 1) if len(self) else None
+
+    def range(self, low, high):
+        return self._skip_tombstones(super().range(low, high))
+
+    def _live_before(self, data, inclusive):
+        """Nombre de valeurs vivantes inférieures à data (ou égales si inclusive), en O(hauteur + log t)."""
+        dead = bisect_right(self._dead, data) if inclusive else bisect_left(self._dead, data)
+        return self._count_before(data, inclusive) - dead
+
+    def _select_live(self, k):
+        """
+        k-ième plus petite valeur vivante (0 <= k < len(self)). Sa position physique j est la plus
+        petite telle que le nombre de valeurs vivantes <= self._select(j) dépasse k ; j est compris
+        entre k et k + t, d'où une recherche dichotomique de O(log t) descentes.
         """
-        return cls.from_list(sorted(data))
+        low, high = k, min(k + self._tombstone_count, super().calculate_size() - 1)
+        while low < high:
+            middle = (low + high) // 2
+            if self._live_before(self._select(middle), True) > k:
+                high = middle
+            else:
+                low = middle + 1
+        return self._select(low)
+
+    def select(self, k):
+        size = len(self)
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError("indice hors de l'arbre")
+        return self._select_live(k)
+
+    def rank(self, data):
+        return self._live_before(data, inclusive=False)
+
+    def count_between(self, low, high):
+        if high < low:
+            return 0
+        return self._live_before(high, inclusive=True) - self._live_before(low, inclusive=False)
+
+    def _select_or_none(self, k):
+        return self._select_live(k) if 0 <= k < len(self) else None
+
+    def floor(self, data):
+        return self._select_or_none(self._live_before(data, inclusive=True) - 1)
+
+    def ceiling(self, data):
+        return self._select_or_none(self._live_before(data, inclusive=False))
+
+    def successor(self, data):
+        return self._select_or_none(self._live_before(data, inclusive=True))
+
+    def predecessor(self, data):
+        return self._select_or_none(self._live_before(data, inclusive=False) - 1)
+
+    def insert_many(self, keys):
+        count, size = len(keys), len(self)
+        rebuilt = count and count * log2(size + 2) >= size
+        super().insert_many(keys)
+        if rebuilt:  # Reconstruit à partir des seules valeurs vivantes : plus aucune valeur marquée
+            self._forget_all_tombstones()
 
 
 # Exemple d'utilisation
@@ -324,6 +1216,19 @@ if __name__ == "__main__":
     print("La valeur 7 est dans l'arbre :", bst.find(7))
     print("La valeur 100 est dans l'arbre :", bst.find(100))
 
+    # Statistiques d'ordre (tailles de sous-arbres maintenues à chaque insertion)
+    bst_stats = BinarySearchTree([50, 20, 80, 10, 30, 70, 90])
+    print("Nombre d'éléments :", len(bst_stats))
+    print("Médiane (select) :", bst_stats.select(len(bst_stats) // 2))
+    print("Rang de 70 :", bst_stats.rank(70))
+    print("Éléments entre 20 et 70 :", bst_stats.count_between(20, 70))
+
+    # Requêtes ordonnées (plancher, plafond, successeur, prédécesseur, intervalle)
+    print("Valeur maximale :", bst_stats.find_maximum())
+    print("Plancher / plafond de 25 :", bst_stats.floor(25), "/", bst_stats.ceiling(25))
+    print("Successeur / prédécesseur de 50 :", bst_stats.successor(50), "/", bst_stats.predecessor(50))
+    print("Valeurs dans [25, 75] :", list(bst_stats.range(25, 75)))
+
     # Créer un arbre à partir d'une liste
     bst_from_list = BinarySearchTree([20, 10, 30, 25, 5])
     print("Arbre binaire de recherche à partir d'une liste :", bst_from_list)
@@ -343,6 +1248,11 @@ if __name__ == "__main__":
     print("Parcours pré-ordre (préfixe) :", bst.pre_order())
     print("Parcours en largeur (breadth-first) :", bst.level_order())
 
+    # Parcours paresseux : s'arrêter dès que possible sans construire de liste
+    print("Deux plus petites valeurs :", list(islice(bst, 2)))
+    print("Valeurs inférieures à 15 :", list(takewhile(lambda value: value < 15, bst)))
+    print("Plus grande valeur :", next(reversed(bst)))
+
     # Vider l'arbre
     bst.clear()
 
@@ -363,4 +1273,34 @@ if __name__ == "__main__":
 
     # Vérification si les arbres sont dégénérés
     print("L'arbre dégénéré est-il dégénéré ? :", bst_degenerate.is_degenerate())  # True
-    print("L'arbre non dégénéré est-il dégénéré ? :", bst_non_degenerate.is_degenerate())  # False
\ No newline at end of file
+    print("L'arbre non dégénéré est-il dégénéré ? :", bst_non_degenerate.is_degenerate())  # False
+
+    # Chargement en O(n) depuis des données triées (liste ou flux de longueur inconnue)
+    bst_bulk = BinarySearchTree(None)
+    bst_bulk.root = BinarySearchTree.from_sorted_iter(iter(range(1, 11)))
+    print("Arbre chargé depuis un flux trié :", bst_bulk, "- hauteur :", bst_bulk.height())
+
+    # Opérations groupées : insertion et recherche d'un lot de clés en un appel
+    bst_batch = BinarySearchTree(None)
+    bst_batch.insert_many([42, 7, 19, 3, 88, 61])
+    print("Arbre après insertion groupée :", bst_batch)
+    print("Recherche groupée de [7, 8, 88] :", bst_batch.find_many([7, 8, 88]))
+
+    # Arbre AVL : des données triées ne dégradent plus la hauteur
+    avl = AVLTree(list(range(1, 16)))
+    print("Hauteur de l'arbre AVL (15 valeurs triées) :", avl.height())
+    print("L'arbre AVL est-il équilibré ? :", avl.is_balanced())
+    print("Hauteur de l'arbre classique (mêmes valeurs insérées une à une) :",
+          BinarySearchTree([15] + list(range(1, 15))).height())
+    avl.delete(8)
+    print("Arbre AVL après suppression de 8 :", avl)
+    print("Retrait du minimum et du maximum :", avl.pop_min(), avl.pop_max())
+    print("Suppression d'une valeur absente :", avl.discard(100))
+
+    # Suppression paresseuse : les valeurs sont marquées puis retirées en bloc
+    lazy = LazyDeletionTree(list(range(1, 11)), compaction_ratio=0.3)
+    for value in (2, 4, 6):
+        lazy.delete(value)
+    print("Arbre paresseux :", lazy, "- nœuds physiques :", lazy.root.size)
+    lazy.delete(8)  # Le seuil est dépassé : compaction
+    print("Après compaction :", lazy, "- nœuds physiques :", lazy.root.size)
\ No newline at end of file
@@ -0,0 +1,586 @@
+from array import array
+from collections import deque
+from heapq import merge
+from math import log2
+
+from bst import BinarySearchTree, np
+
+NO_CHILD = -1  # Indice utilisé pour représenter l'absence d'enfant
+
+
+class CompactBinarySearchTree:
+    """
+    Arbre binaire de recherche stocké dans des tableaux parallèles plutôt que dans des objets nœuds.
+    Le nœud numéro i est décrit par keys[i], left[i] et right[i] ; les enfants sont des indices
+    (NO_CHILD s'il n'y en a pas). Les clés numériques peuvent être rangées dans un array typé
+    ('q' pour des entiers 64 bits, 'd' pour des flottants), ce qui ramène le coût par clé à
+    quelques octets au lieu d'un objet Python complet par nœud.
+
+    Les méthodes publiques de bst.BinarySearchTree sont toutes disponibles (insertion, suppression,
+    recherche, requêtes d'ordre, opérations groupées, parcours), à deux différences près :
+    get_left_subtree et get_right_subtree retournent l'indice de l'enfant au lieu d'un nœud, et les
+    constructeurs de nœuds from_sorted, from_list... sont remplacés par le constructeur de la classe.
+    Les emplacements libérés par une suppression sont réutilisés par les insertions suivantes.
+    Attributs :
+        root : Indice du nœud racine (NO_CHILD si l'arbre est vide).
+        keys : Clés des nœuds (array typé ou liste Python).
+        left, right : Indices des enfants gauche et droit (array 'i').
+        sizes : Taille du sous-arbre de chaque nœud (array 'i'), pour select et rank.
+    """
+
+    def __init__(self, data=None, typecode=None):
+        self.typecode = typecode
+        self.clear()
+        if isinstance(data, (int, float, str)):
+            self.insert(data)
+        elif isinstance(data, list):
+            if all(a <= b for a, b in zip(data, data[1:])):
+                self._load_sorted(data)
+            else:
+                for item in data:
+                    self.insert(item)
+        elif isinstance(data, (set, dict)):
+            self._load_sorted(sorted(data.values() if isinstance(data, dict) else data))
+
+    def _new_node(self, data):
+        """
+        Méthode auxiliaire pour ajouter un nœud sans enfant et retourner son indice.
+        Un emplacement libéré par une suppression est réutilisé avant d'agrandir les tableaux.
+        """
+        if self._free:
+            index = self._free.pop()
+            self.keys[index] = data
+            self.sizes[index] = 1
+            return index
+        self.keys.append(data)
+        self.left.append(NO_CHILD)
+        self.right.append(NO_CHILD)
+        self.sizes.append(1)
+        return len(self.keys) - 1
+
+    def _free_node(self, index):
+        """Méthode auxiliaire pour libérer l'emplacement d'un nœud détaché de l'arbre."""
+        self.left[index] = NO_CHILD
+        self.right[index] = NO_CHILD
+        self.sizes[index] = 0
+        self._free.append(index)
+
+    def _size(self, index):
+        """Méthode auxiliaire : taille du sous-arbre enraciné en index (0 pour NO_CHILD)."""
+        return 0 if index == NO_CHILD else self.sizes[index]
+
+    def _load_sorted(self, data):
+        """
+        Méthode auxiliaire pour construire un arbre équilibré à partir de données triées, en O(n).
+        Les nœuds sont rangés dans l'ordre infixe : l'indice i porte la i-ème plus petite clé.
+        """
+        self.clear()
+        self.keys.extend(data)
+        size = len(self.keys)
+        self.left = array("i", [NO_CHILD]) * size
+        self.right = array("i", [NO_CHILD]) * size
+        self.sizes = array("i", [0]) * size
+        if not size:
+            return
+        # Pile de segments [low, high) avec l'indice du parent et le côté où les raccrocher
+        stack = [(0, size, NO_CHILD, False)]
+        while stack:
+            low, high, parent, is_right = stack.pop()
+            if low >= high:
+                continue
+            middle = (low + high) // 2
+            self.sizes[middle] = high - low
+            if parent == NO_CHILD:
+                self.root = middle
+            elif is_right:
+                self.right[parent] = middle
+            else:
+                self.left[parent] = middle
+            stack.append((low, middle, middle, False))
+            stack.append((middle + 1, high, middle, True))
+
+    def is_empty(self):
+        """
+        Vérifier si l'arbre binaire de recherche est vide.
+        Retourne True si l'arbre est vide, False sinon.
+        """
+        return self.root == NO_CHILD
+
+    def get_root_value(self):
+        """
+        Lire la valeur stockée dans la racine de l'arbre.
+        Retourne la valeur si la racine existe, sinon None.
+        """
+        return None if self.is_empty() else self.keys[self.root]
+
+    def set_root_value(self, value):
+        """
+        Modifier la valeur stockée dans la racine de l'arbre.
+        Si la racine n'existe pas, elle est créée avec la valeur donnée.
+        """
+        self._snapshot = None
+        if self.is_empty():
+            self.root = self._new_node(value)
+        else:
+            self.keys[self.root] = value
+
+    def get_left_subtree(self):
+        """
+        Lire le sous-arbre gauche de la racine.
+        Retourne l'indice de l'enfant gauche si présent, sinon None.
+        """
+        return None if self.is_empty() or self.left[self.root] == NO_CHILD else self.left[self.root]
+
+    def get_right_subtree(self):
+        """
+        Lire le sous-arbre droit de la racine.
+        Retourne l'indice de l'enfant droit si présent, sinon None.
+        """
+        return None if self.is_empty() or self.right[self.root] == NO_CHILD else self.right[self.root]
+
+    def insert(self, data):
+        """
+        Insérer une nouvelle clé dans l'arbre (parcours itératif, les égaux vont à droite).
+        """
+        self._snapshot = None
+        if self.is_empty():
+            self.root = self._new_node(data)
+            return
+        keys, left, right, sizes = self.keys, self.left, self.right, self.sizes
+        current = self.root
+        while True:
+            # La nouvelle clé appartiendra au sous-arbre de chaque nœud traversé
+            sizes[current] += 1
+            if data < keys[current]:
+                if left[current] == NO_CHILD:
+                    left[current] = self._new_node(data)
+                    return
+                current = left[current]
+            else:
+                if right[current] == NO_CHILD:
+                    right[current] = self._new_node(data)
+                    return
+                current = right[current]
+
+    def discard(self, data):
+        """
+        Supprimer une occurrence de la valeur data si elle est présente.
+        Un nœud à deux enfants prend la valeur de son successeur, qui est ensuite détaché.
+        Retourne True si un nœud a été supprimé, sinon False. Coût en O(hauteur).
+        """
+        keys, left, right = self.keys, self.left, self.right
+        path = []
+        current = self.root
+        while current != NO_CHILD and keys[current] != data:
+            path.append(current)
+            current = left[current] if data < keys[current] else right[current]
+        if current == NO_CHILD:
+            return False
+        if left[current] != NO_CHILD and right[current] != NO_CHILD:
+            # Deux enfants : remplacer par le successeur (minimum du sous-arbre droit)
+            path.append(current)
+            successor = right[current]
+            while left[successor] != NO_CHILD:
+                path.append(successor)
+                successor = left[successor]
+            keys[current] = keys[successor]
+            current = successor
+        child = left[current] if left[current] != NO_CHILD else right[current]
+        if not path:
+            self.root = child
+        elif left[path[-1]] == current:
+            left[path[-1]] = child
+        else:
+            right[path[-1]] = child
+        # Chaque ancêtre perd un nœud dans son sous-arbre
+        for ancestor in path:
+            self.sizes[ancestor] -= 1
+        self._free_node(current)
+        self._snapshot = None
+        return True
+
+    # Méthodes qui ne manipulent pas les nœuds directement : reprises telles quelles de BinarySearchTree
+    delete = BinarySearchTree.delete
+    pop_min = BinarySearchTree.pop_min
+    pop_max = BinarySearchTree.pop_max
+
+    def floor(self, data):
+        """
+        Retourner la plus grande valeur inférieure ou égale à data, ou None si elle n'existe pas.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        best = None
+        current = self.root
+        while current != NO_CHILD:
+            key = keys[current]
+            if key == data:
+                return key
+            if key < data:
+                best = key
+                current = right[current]
+            else:
+                current = left[current]
+        return best
+
+    def ceiling(self, data):
+        """
+        Retourner la plus petite valeur supérieure ou égale à data, ou None si elle n'existe pas.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        best = None
+        current = self.root
+        while current != NO_CHILD:
+            key = keys[current]
+            if key == data:
+                return key
+            if key > data:
+                best = key
+                current = left[current]
+            else:
+                current = right[current]
+        return best
+
+    def successor(self, data):
+        """
+        Retourner la plus petite valeur strictement supérieure à data, ou None si elle n'existe pas.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        best = None
+        current = self.root
+        while current != NO_CHILD:
+            if keys[current] > data:
+                best = keys[current]
+                current = left[current]
+            else:
+                current = right[current]
+        return best
+
+    def predecessor(self, data):
+        """
+        Retourner la plus grande valeur strictement inférieure à data, ou None si elle n'existe pas.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        best = None
+        current = self.root
+        while current != NO_CHILD:
+            if keys[current] < data:
+                best = keys[current]
+                current = right[current]
+            else:
+                current = left[current]
+        return best
+
+    def range(self, low, high):
+        """
+        Parcourir paresseusement, en ordre croissant, les valeurs de l'intervalle fermé [low, high].
+        Seuls les sous-arbres qui chevauchent l'intervalle sont visités : O(hauteur + k) pour k résultats.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        current = self.root
+        while stack or current != NO_CHILD:
+            while current != NO_CHILD:
+                if keys[current] < low:
+                    current = right[current]
+                else:
+                    stack.append(current)
+                    current = left[current]
+            if not stack:
+                return
+            current = stack.pop()
+            if keys[current] > high:
+                return
+            yield keys[current]
+            current = right[current]
+
+    select = BinarySearchTree.select
+
+    def _select(self, k):
+        """Méthode auxiliaire : k-ième plus petite clé de l'arbre (0 <= k < nombre de nœuds)."""
+        current = self.root
+        while True:
+            left_size = self._size(self.left[current])
+            if k < left_size:
+                current = self.left[current]
+            elif k == left_size:
+                return self.keys[current]
+            else:
+                k -= left_size + 1
+                current = self.right[current]
+
+    def _count_before(self, data, inclusive):
+        """
+        Méthode auxiliaire : nombre d'éléments strictement inférieurs à data
+        (ou inférieurs ou égaux si inclusive est vrai), en O(hauteur).
+        """
+        keys, left, right = self.keys, self.left, self.right
+        count = 0
+        current = self.root
+        while current != NO_CHILD:
+            if keys[current] < data or (inclusive and keys[current] == data):
+                count += self._size(left[current]) + 1
+                current = right[current]
+            else:
+                current = left[current]
+        return count
+
+    rank = BinarySearchTree.rank
+    count_between = BinarySearchTree.count_between
+
+    def find(self, data):
+        """
+        Rechercher une valeur dans l'arbre.
+        Retourne True si la valeur est trouvée, sinon False.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        current = self.root
+        while current != NO_CHILD:
+            key = keys[current]
+            if key == data:
+                return True
+            current = left[current] if data < key else right[current]
+        return False
+
+    def find_minimum(self):
+        """Retourner la valeur minimale de l'arbre, ou None s'il est vide."""
+        if self.is_empty():
+            return None
+        current = self.root
+        while self.left[current] != NO_CHILD:
+            current = self.left[current]
+        return self.keys[current]
+
+    def find_maximum(self):
+        """Retourner la valeur maximale de l'arbre, ou None s'il est vide."""
+        if self.is_empty():
+            return None
+        current = self.root
+        while self.right[current] != NO_CHILD:
+            current = self.right[current]
+        return self.keys[current]
+
+    def calculate_size(self):
+        """
+        Calculer la taille de l'arbre : c'est la taille du sous-arbre de la racine, lue en O(1).
+        """
+        return self._size(self.root)
+
+    def __len__(self):
+        return self.calculate_size()
+
+    _sorted_snapshot = BinarySearchTree._sorted_snapshot
+    _as_numeric_array = staticmethod(BinarySearchTree._as_numeric_array)
+    contains_mask = BinarySearchTree.contains_mask
+    find_many = BinarySearchTree.find_many
+
+    def insert_many(self, keys):
+        """
+        Insérer un lot de clés (liste ou tableau NumPy).
+        Un petit lot est inséré clé par clé. Un lot important est trié puis fusionné avec les clés
+        existantes, et les tableaux sont rechargés équilibrés en O(n + m).
+        """
+        if not len(keys):
+            return
+        if np is not None and isinstance(keys, np.ndarray):
+            keys = keys.tolist()  # Scalaires Python, comme dans BinarySearchTree.insert_many
+        size = len(self)
+        if len(keys) * log2(size + 2) < size:
+            for key in keys:
+                self.insert(key)
+            return
+        self._load_sorted(list(merge(self, sorted(keys))))
+
+    def clear(self):
+        """
+        Supprimer tous les nœuds de l'arbre en réinitialisant les tableaux.
+        """
+        self.keys = array(self.typecode) if self.typecode else []
+        self.left = array("i")
+        self.right = array("i")
+        self.sizes = array("i")
+        self._free = []  # Indices des emplacements libérés par les suppressions
+        self._snapshot = None  # Tableau trié des clés pour contains_mask, comme dans BinarySearchTree
+        self.root = NO_CHILD
+
+    def count_leaves(self):
+        """
+        Calculer le nombre de feuilles dans l'arbre.
+        Retourne le nombre de feuilles.
+        """
+        if self.is_empty():
+            return 0
+        # Les emplacements libérés n'ont pas d'enfant : on les retire du décompte
+        leaves = sum(1 for l, r in zip(self.left, self.right) if l == NO_CHILD and r == NO_CHILD)
+        return leaves - len(self._free)
+
+    def height(self):
+        """
+        Calculer la hauteur de l'arbre (nombre de nœuds sur le plus long chemin racine-feuille).
+        """
+        height = 0
+        level = [] if self.is_empty() else [self.root]
+        left, right = self.left, self.right
+        while level:
+            height += 1
+            level = [child for node in level for child in (left[node], right[node]) if child != NO_CHILD]
+        return height
+
+    def is_degenerate(self):
+        """
+        Vérifier si l'arbre est dégénéré (aucun nœud n'a deux enfants).
+        """
+        return not any(l != NO_CHILD and r != NO_CHILD for l, r in zip(self.left, self.right))
+
+    def is_balanced(self):
+        """
+        Vérifier que l'arbre respecte la condition d'équilibre AVL :
+        pour chaque nœud, les hauteurs des deux sous-arbres diffèrent d'au plus 1.
+        """
+        left, right = self.left, self.right
+        heights = {NO_CHILD: 0}
+        stack = [] if self.is_empty() else [(self.root, False)]
+        while stack:
+            current, children_done = stack.pop()
+            if not children_done:
+                stack.append((current, True))
+                if right[current] != NO_CHILD:
+                    stack.append((right[current], False))
+                if left[current] != NO_CHILD:
+                    stack.append((left[current], False))
+                continue
+            left_height, right_height = heights[left[current]], heights[right[current]]
+            if abs(left_height - right_height) > 1:
+                return False
+            heights[current] = 1 + max(left_height, right_height)
+        return True
+
+    def _iter_in_order(self, reverse=False):
+        """Générateur auxiliaire : parcours infixe (ou infixe inversé) avec une pile d'indices."""
+        keys = self.keys
+        first, second = (self.right, self.left) if reverse else (self.left, self.right)
+        stack = []
+        current = self.root
+        while stack or current != NO_CHILD:
+            while current != NO_CHILD:
+                stack.append(current)
+                current = first[current]
+            current = stack.pop()
+            yield keys[current]
+            current = second[current]
+
+    def _iter_pre_order(self):
+        """Générateur auxiliaire : parcours pré-ordre avec une pile d'indices."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = [] if self.is_empty() else [self.root]
+        while stack:
+            current = stack.pop()
+            yield keys[current]
+            if right[current] != NO_CHILD:
+                stack.append(right[current])
+            if left[current] != NO_CHILD:
+                stack.append(left[current])
+
+    def _iter_post_order(self):
+        """Générateur auxiliaire : parcours post-ordre avec une pile d'indices."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = [] if self.is_empty() else [(self.root, False)]
+        while stack:
+            current, children_done = stack.pop()
+            if children_done:
+                yield keys[current]
+                continue
+            stack.append((current, True))
+            if right[current] != NO_CHILD:
+                stack.append((right[current], False))
+            if left[current] != NO_CHILD:
+                stack.append((left[current], False))
+
+    def _iter_level_order(self):
+        """Générateur auxiliaire : parcours en largeur avec une file d'indices."""
+        keys, left, right = self.keys, self.left, self.right
+        queue = deque([] if self.is_empty() else [self.root])
+        while queue:
+            current = queue.popleft()
+            yield keys[current]
+            if left[current] != NO_CHILD:
+                queue.append(left[current])
+            if right[current] != NO_CHILD:
+                queue.append(right[current])
+
+    def iter_in_order(self):
+        """Parcourir paresseusement les éléments en ordre croissant, en mémoire O(hauteur)."""
+        return self._iter_in_order()
+
+    def iter_reverse_order(self):
+        """Itérer sur les éléments de l'arbre en ordre décroissant, sans construire de liste."""
+        return self._iter_in_order(reverse=True)
+
+    def iter_pre_order(self):
+        """Parcourir paresseusement les éléments selon le parcours pré-ordre."""
+        return self._iter_pre_order()
+
+    def iter_post_order(self):
+        """Parcourir paresseusement les éléments selon le parcours post-ordre."""
+        return self._iter_post_order()
+
+    def iter_level_order(self):
+        """Parcourir paresseusement les éléments selon le parcours en largeur."""
+        return self._iter_level_order()
+
+    def __iter__(self):
+        return self._iter_in_order()
+
+    def __reversed__(self):
+        return self._iter_in_order(reverse=True)
+
+    def in_order(self):
+        """Retourner les éléments de l'arbre selon le parcours en ordre."""
+        return list(self._iter_in_order())
+
+    def pre_order(self):
+        """Retourner les éléments de l'arbre selon le parcours pré-ordre."""
+        return list(self._iter_pre_order())
+
+    def post_order(self):
+        """Retourner les éléments de l'arbre selon le parcours post-ordre."""
+        return list(self._iter_post_order())
+
+    def level_order(self):
+        """Retourner les éléments de l'arbre selon le parcours en largeur (breadth-first)."""
+        return list(self._iter_level_order())
+
+    def nbytes(self):
+        """
+        Estimer la mémoire occupée par les tableaux de l'arbre (en octets).
+        Pour des clés non typées (liste Python), seuls les pointeurs de la liste sont comptés.
+        """
+        keys_bytes = (self.keys.itemsize if self.typecode else 8) * len(self.keys)
+        links = (self.left, self.right, self.sizes)
+        return keys_bytes + sum(links_array.itemsize * len(links_array) for links_array in links)
+
+    def __str__(self):
+        return "[" + ", ".join(map(repr, self)) + "]"
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    compact = CompactBinarySearchTree([20, 10, 30, 25, 5], typecode="q")
+    compact.insert(27)
+    print("Arbre compact :", compact)
+    print("Parcours pré-ordre :", compact.pre_order())
+    print("Parcours post-ordre :", compact.post_order())
+    print("Parcours en largeur :", compact.level_order())
+    print("La valeur 25 est dans l'arbre :", compact.find(25))
+    print("Minimum / maximum :", compact.find_minimum(), "/", compact.find_maximum())
+    print("Taille :", len(compact), "- feuilles :", compact.count_leaves(), "- hauteur :", compact.height())
+    print("Troisième plus petite clé :", compact.select(2), "- rang de 26 :", compact.rank(26))
+    print("Plancher / plafond de 26 :", compact.floor(26), "/", compact.ceiling(26))
+    compact.delete(20)
+    print("Après suppression de 20 :", compact)
+    print("Minimum retiré :", compact.pop_min(), "- arbre :", compact)
+    compact.insert_many([1, 2, 3])
+    print("Après insertion groupée :", compact, "- équilibré :", compact.is_balanced())
+
+    sorted_compact = CompactBinarySearchTree(list(range(1_000)), typecode="q")
+    print("Hauteur après chargement trié de 1000 clés :", sorted_compact.height())
+    print("Octets par clé :", sorted_compact.nbytes() / len(sorted_compact))
@@ -0,0 +1,231 @@
+import threading
+from contextlib import contextmanager
+
+from bst import AVLTree
+
+
+class ReadWriteLock:
+    """
+    Verrou lecteurs/rédacteur : plusieurs lecteurs simultanés, un seul rédacteur à la fois.
+    Les rédacteurs sont prioritaires : dès qu'un rédacteur attend, les nouveaux lecteurs
+    patientent, ce qui évite qu'un flux continu de lectures n'affame les écritures.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read_locked(self):
+        """Acquérir le verrou en lecture pour la durée du bloc with."""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        """Acquérir le verrou en écriture (exclusif) pour la durée du bloc with."""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class ConcurrentBinarySearchTree:
+    """
+    Arbre binaire de recherche partagé entre plusieurs threads.
+    Enveloppe un arbre (AVLTree par défaut) : les lectures s'exécutent en parallèle sous le verrou
+    en lecture, les modifications sont sérialisées sous le verrou en écriture.
+    Les parcours longs portent sur un instantané cohérent : l'instantané est copié sous le verrou
+    en lecture, puis parcouru sans verrou, de sorte que les rédacteurs ne restent pas bloqués
+    pendant toute la durée de l'itération. Un même instantané est partagé tant qu'aucune
+    écriture n'a eu lieu.
+    L'arbre enveloppé ne doit pas se modifier pendant une lecture : c'est le cas de AVLTree et de
+    LazyDeletionTree, qui ne compacte que lors des suppressions.
+    Attributs :
+        lock : Le verrou lecteurs/rédacteur protégeant l'arbre.
+    """
+
+    def __init__(self, tree=None):
+        self._tree = tree if tree is not None else AVLTree(None)
+        self.lock = ReadWriteLock()
+        self._version = 0  # Incrémenté à chaque écriture
+        self._snapshot = None
+        self._snapshot_version = -1
+        self._snapshot_lock = threading.Lock()
+
+    # Écritures : sérialisées
+
+    def insert(self, data):
+        with self.lock.write_locked():
+            self._tree.insert(data)
+            self._version += 1
+
+    def insert_many(self, keys):
+        with self.lock.write_locked():
+            self._tree.insert_many(keys)
+            self._version += 1
+
+    def discard(self, data):
+        with self.lock.write_locked():
+            deleted = self._tree.discard(data)
+            if deleted:
+                self._version += 1
+            return deleted
+
+    def delete(self, data):
+        if not self.discard(data):
+            raise KeyError(data)
+
+    def pop_min(self):
+        with self.lock.write_locked():
+            value = self._tree.pop_min()
+            self._version += 1
+            return value
+
+    def pop_max(self):
+        with self.lock.write_locked():
+            value = self._tree.pop_max()
+            self._version += 1
+            return value
+
+    def clear(self):
+        with self.lock.write_locked():
+            self._tree.clear()
+            self._version += 1
+
+    # Lectures ponctuelles : parallèles
+
+    def find(self, data):
+        with self.lock.read_locked():
+            return self._tree.find(data)
+
+    def __contains__(self, data):
+        return self.find(data)
+
+    def find_many(self, keys):
+        # Le premier appel construit un instantané NumPy dans l'arbre enveloppé : c'est une écriture
+        with self.lock.write_locked():
+            return self._tree.find_many(keys)
+
+    def find_minimum(self):
+        with self.lock.read_locked():
+            return self._tree.find_minimum()
+
+    def find_maximum(self):
+        with self.lock.read_locked():
+            return self._tree.find_maximum()
+
+    def floor(self, data):
+        with self.lock.read_locked():
+            return self._tree.floor(data)
+
+    def ceiling(self, data):
+        with self.lock.read_locked():
+            return self._tree.ceiling(data)
+
+    def select(self, k):
+        with self.lock.read_locked():
+            return self._tree.select(k)
+
+    def rank(self, data):
+        with self.lock.read_locked():
+            return self._tree.rank(data)
+
+    def count_between(self, low, high):
+        with self.lock.read_locked():
+            return self._tree.count_between(low, high)
+
+    def is_empty(self):
+        with self.lock.read_locked():
+            return self._tree.is_empty()
+
+    def calculate_size(self):
+        with self.lock.read_locked():
+            return self._tree.calculate_size()
+
+    def __len__(self):
+        return self.calculate_size()
+
+    # Parcours : sur instantané
+
+    def snapshot(self):
+        """
+        Retourner un instantané cohérent (tuple trié) du contenu de l'arbre.
+        L'instantané est réutilisé tant qu'aucune écriture n'a eu lieu.
+        """
+        with self._snapshot_lock:
+            if self._snapshot_version == self._version:
+                return self._snapshot
+            with self.lock.read_locked():
+                version = self._version
+                snapshot = tuple(self._tree)
+            self._snapshot, self._snapshot_version = snapshot, version
+            return snapshot
+
+    def _traversal(self, method):
+        """Méthode auxiliaire : copier un parcours sous le verrou en lecture."""
+        with self.lock.read_locked():
+            return method()
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __reversed__(self):
+        return reversed(self.snapshot())
+
+    def iter_in_order(self):
+        return iter(self.snapshot())
+
+    def in_order(self):
+        return list(self.snapshot())
+
+    def range(self, low, high):
+        """Valeurs de l'intervalle fermé [low, high], copiées sous le verrou en lecture."""
+        with self.lock.read_locked():
+            return list(self._tree.range(low, high))
+
+    def pre_order(self):
+        return self._traversal(self._tree.pre_order)
+
+    def post_order(self):
+        return self._traversal(self._tree.post_order)
+
+    def level_order(self):
+        return self._traversal(self._tree.level_order)
+
+    def __str__(self):
+        return str(list(self.snapshot()))
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    shared = ConcurrentBinarySearchTree()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(shared.insert, range(100)))
+    print("Taille après insertions concurrentes :", len(shared))
+    print("L'arbre reste équilibré :", shared._tree.is_balanced())
+
+    view = iter(shared)  # Instantané pris ici
+    shared.insert(1000)  # L'écriture n'est pas bloquée par l'itération en cours
+    print("Maximum de l'instantané :", max(view), "- maximum actuel :", shared.find_maximum())
@@ -0,0 +1,347 @@
+import threading
+from collections import deque
+from math import log2
+from time import perf_counter_ns
+
+# Opérations instrumentées, lorsqu'elles existent sur la classe de l'arbre :
+# bst.BinarySearchTree (find, insert) et l'ABR de l'application « recherche selon deux clés »
+# (search, search_all, insert).
+OPERATIONS = ("find", "search", "search_all", "insert")
+# Méthodes non mesurées qui appellent en interne les opérations ci-dessus (LazyDeletionTree.discard
+# appelle find, find_many peut appeler find clé par clé, ...) : ces appels imbriqués ne sont pas comptés.
+COMPOSITE_OPERATIONS = ("delete", "discard", "pop_min", "pop_max", "find_many", "contains_mask",
+                        "insert_many", "compact")
+
+
+class LatencyHistogram:
+    """
+    Histogramme des latences à classes logarithmiques : la classe i compte les durées
+    comprises entre 2**(i - 1) et 2**i nanosecondes. L'enregistrement est en O(1) et la
+    mémoire est bornée (une soixantaine de classes au plus).
+    """
+
+    def __init__(self):
+        self.counts = []
+        self.total = 0
+
+    def record(self, nanoseconds):
+        bucket = nanoseconds.bit_length()
+        if bucket >= len(self.counts):
+            self.counts.extend([0] * (bucket + 1 - len(self.counts)))
+        self.counts[bucket] += 1
+        self.total += 1
+
+    def percentile(self, p):
+        """
+        Borne supérieure (en nanosecondes) de la classe contenant le p-ième centile, ou None si vide.
+        """
+        if not self.total:
+            return None
+        threshold = p / 100 * self.total
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold and count:
+                return 2 ** bucket
+        return 2 ** (len(self.counts) - 1)
+
+    def as_dict(self):
+        """Classes non vides, indexées par leur borne supérieure en nanosecondes."""
+        return {2 ** bucket: count for bucket, count in enumerate(self.counts) if count}
+
+
+class OperationStats:
+    """
+    Statistiques d'une opération : nombre d'appels, nœuds visités (total et maximum par appel)
+    et histogramme des latences.
+    """
+
+    __slots__ = ("calls", "nodes_visited", "max_nodes_visited", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.nodes_visited = 0
+        self.max_nodes_visited = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "nodes_visited": self.nodes_visited,
+            "mean_nodes_visited": self.nodes_visited / self.calls if self.calls else 0.0,
+            "max_nodes_visited": self.max_nodes_visited,
+            "latency_p50_ns": self.latency.percentile(50),
+            "latency_p99_ns": self.latency.percentile(99),
+            "latency_histogram_ns": self.latency.as_dict(),
+        }
+
+
+class _ThreadState(threading.local):
+    active = False  # Vrai pendant une opération de ce thread : ses appels internes ne sont pas comptés
+
+
+class TreeStats:
+    """
+    Statistiques collectées sur un arbre instrumenté.
+    Attributs :
+        operations : OperationStats par nom d'opération.
+        max_depth : Profondeur maximale atteinte (en nœuds) par une opération ; pour une insertion,
+                    celle du nouveau nœud avant un éventuel rééquilibrage.
+        shape_reports : Derniers rapports de forme (voir shape_report).
+        shape_interval : Un rapport de forme est produit toutes les shape_interval insertions (None : jamais).
+        on_shape_report : Fonction appelée avec chaque rapport de forme périodique.
+    """
+
+    def __init__(self, shape_interval=None, on_shape_report=None, history=100):
+        self.operations = {}
+        self.max_depth = 0
+        self.shape_reports = deque(maxlen=history)
+        self.shape_interval = shape_interval
+        self.on_shape_report = on_shape_report
+        self._insertions = 0
+        self._state = _ThreadState()  # Indicateur de réentrance, propre à chaque thread
+        self._lock = threading.Lock()  # Les lecteurs d'un arbre partagé enregistrent en parallèle
+
+    def record(self, operation, visited, nanoseconds):
+        """
+        Enregistrer une opération. Pour une insertion, retourne True si un rapport de forme est dû.
+        """
+        with self._lock:
+            stats = self.operations.get(operation)
+            if stats is None:
+                stats = self.operations[operation] = OperationStats()
+            stats.calls += 1
+            stats.nodes_visited += visited
+            if visited > stats.max_nodes_visited:
+                stats.max_nodes_visited = visited
+                if visited > self.max_depth:
+                    self.max_depth = visited
+            stats.latency.record(nanoseconds)
+            if operation != "insert" or not self.shape_interval:
+                return False
+            self._insertions += 1
+            return self._insertions % self.shape_interval == 0
+
+    def as_dict(self):
+        return {
+            "max_depth": self.max_depth,
+            "operations": {name: stats.as_dict() for name, stats in self.operations.items()},
+            "last_shape_report": self.shape_reports[-1] if self.shape_reports else None,
+        }
+
+    def __str__(self):
+        lines = [f"Profondeur maximale atteinte : {self.max_depth}"]
+        for name, stats in self.operations.items():
+            summary = stats.as_dict()
+            lines.append(f"{name:<11} {summary['calls']:>8} appels, {summary['mean_nodes_visited']:8.2f} nœuds/appel "
+                         f"(max {summary['max_nodes_visited']}), p50 <= {summary['latency_p50_ns']} ns, "
+                         f"p99 <= {summary['latency_p99_ns']} ns")
+        return "\n".join(lines)
+
+
+def _key_getter(tree_class):
+    """L'ABR de l'application range sa clé dans node.key, bst.Node dans node.data."""
+    return (lambda node: node.key) if hasattr(tree_class, "search") else (lambda node: node.data)
+
+
+def _path_length(root, key, key_of, stop_on_equal):
+    """
+    Nombre de nœuds visités par la descente de la racine vers key : la descente s'arrête sur une
+    clé égale (recherche, ou insertion sans doublon), sinon elle continue à droite comme l'insertion
+    de bst.BinarySearchTree.
+    """
+    visited = 0
+    node = root
+    while node is not None:
+        visited += 1
+        node_key = key_of(node)
+        if key < node_key:
+            node = node.left
+        elif key > node_key or not stop_on_equal:
+            node = node.right
+        else:
+            break
+    return visited
+
+
+def _size(tree):
+    return tree.root.size if tree.root else 0
+
+
+def _instrumented_method(name, original, key_of, stop_on_equal):
+    def method(self, key, *args, **kwargs):
+        stats = self.stats
+        # Nouvelle version créée par l'arbre (arbre persistant, non suivie) ou appel interne
+        if stats is None or stats._state.active:
+            return original(self, key, *args, **kwargs)
+        visited = _path_length(self.root, key, key_of, stop_on_equal)
+        size = _size(self) if name == "insert" else 0
+        state = stats._state
+        state.active = True
+        try:
+            start = perf_counter_ns()
+            result = original(self, key, *args, **kwargs)
+            elapsed = perf_counter_ns() - start
+        finally:
+            state.active = False
+        if name == "insert" and _size(self) > size:
+            visited += 1  # Le nouveau nœud, placé au bout du chemin parcouru
+        if stats.record(name, visited, elapsed):
+            report = shape_report(self)
+            stats.shape_reports.append(report)
+            if stats.on_shape_report is not None:
+                stats.on_shape_report(report)
+        return result
+
+    method.__name__ = name
+    method.__doc__ = original.__doc__
+    return method
+
+
+def _guarded_method(name, original):
+    """Méthode composite : ses appels internes aux opérations instrumentées ne sont pas comptés."""
+    def method(self, *args, **kwargs):
+        stats = self.stats
+        if stats is None or stats._state.active:
+            return original(self, *args, **kwargs)
+        state = stats._state
+        state.active = True
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            state.active = False
+
+    method.__name__ = name
+    method.__doc__ = original.__doc__
+    return method
+
+
+_instrumented_classes = {}
+
+
+def _instrumented_class(tree_class):
+    """Sous-classe instrumentée de tree_class, créée une seule fois par classe."""
+    if tree_class not in _instrumented_classes:
+        key_of = _key_getter(tree_class)
+        allows_duplicates = not hasattr(tree_class, "search")
+        namespace = {"__slots__": (), "stats": None, "_uninstrumented_class": tree_class}
+        for name in OPERATIONS:
+            if hasattr(tree_class, name):
+                stop_on_equal = name != "insert" or not allows_duplicates
+                namespace[name] = _instrumented_method(name, getattr(tree_class, name), key_of, stop_on_equal)
+        for name in COMPOSITE_OPERATIONS:
+            if hasattr(tree_class, name):
+                namespace[name] = _guarded_method(name, getattr(tree_class, name))
+        _instrumented_classes[tree_class] = type("Instrumented" + tree_class.__name__, (tree_class,), namespace)
+    return _instrumented_classes[tree_class]
+
+
+def instrument(tree, shape_interval=None, on_shape_report=None):
+    """
+    Activer l'instrumentation d'un arbre et retourner ses statistiques (TreeStats, aussi dans tree.stats).
+    L'instrumentation remplace la classe de l'objet par une sous-classe dont les méthodes find,
+    search, search_all et insert mesurent les nœuds visités et la latence. Les classes d'origine ne
+    sont jamais modifiées : un arbre non instrumenté ne paie aucun surcoût, pas même un test.
+    Les nœuds visités sont comptés par une descente séparée, hors de la mesure de latence.
+    Les statistiques peuvent être alimentées par plusieurs threads : pour un arbre partagé,
+    instrumenter l'arbre enveloppé par ConcurrentBinarySearchTree (les lecteurs concurrents
+    enregistrent sous un verrou propre aux statistiques, l'indicateur de réentrance est par thread).
+    """
+    if "_uninstrumented_class" in tree.__class__.__dict__:  # Déjà instrumenté
+        return tree.stats
+    tree.__class__ = _instrumented_class(tree.__class__)
+    tree.stats = TreeStats(shape_interval, on_shape_report)
+    return tree.stats
+
+
+def uninstrument(tree):
+    """Désactiver l'instrumentation ; retourne les statistiques collectées (ou None)."""
+    original = tree.__class__.__dict__.get("_uninstrumented_class")
+    if original is None:
+        return None
+    stats = tree.__dict__.pop("stats", None)
+    tree.__class__ = original
+    return stats
+
+
+def _walk_shape(root):
+    """Taille, hauteur et nombre de feuilles, par un parcours itératif (ABR de l'application)."""
+    size = leaves = height = 0
+    degenerate = True
+    stack = [(root, 1)] if root else []
+    while stack:
+        node, depth = stack.pop()
+        size += 1
+        height = max(height, depth)
+        children = [child for child in (node.left, node.right) if child]
+        if not children:
+            leaves += 1
+        elif len(children) == 2:
+            degenerate = False
+        stack.extend((child, depth + 1) for child in children)
+    return size, height, leaves, degenerate
+
+
+def shape_report(tree):
+    """
+    Rapport de forme d'un arbre : taille, hauteur comparée à la hauteur minimale log2(n + 1),
+    nombre de feuilles et dégénérescence (chaque nœud a au plus un enfant).
+    Un rapport height_ratio nettement supérieur à 1 annonce des recherches plus lentes que prévu.
+    """
+    if hasattr(tree, "count_leaves"):
+        size, height = tree.calculate_size(), tree.height()
+        leaves, degenerate = tree.count_leaves(), tree.is_degenerate()
+    else:
+        size, height, leaves, degenerate = _walk_shape(tree.root)
+    optimal = log2(size + 1)
+    return {
+        "size": size,
+        "height": height,
+        "optimal_height": optimal,
+        "height_ratio": height / optimal if size else 1.0,
+        "leaves": leaves,
+        "degenerate": bool(size > 2 and degenerate),
+    }
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    import os
+    import random
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    from bst import AVLTree, BinarySearchTree
+
+    def alert(report):
+        if report["height_ratio"] > 2:
+            print(f"  Alerte : hauteur {report['height']} pour {report['size']} nœuds "
+                  f"(ratio {report['height_ratio']:.1f}, dégénéré : {report['degenerate']})")
+
+    for cls, keys in ((BinarySearchTree, list(range(500))), (AVLTree, list(range(500)))):
+        tree = cls(None)
+        stats = instrument(tree, shape_interval=100, on_shape_report=alert)
+        print(f"{cls.__name__}, 500 clés insérées dans l'ordre :")
+        for key in keys:
+            tree.insert(key)
+        for key in random.sample(keys, 200):
+            tree.find(key)
+        print(stats)
+        print("Rapport de forme :", shape_report(tree))
+        uninstrument(tree)
+        print("Après désactivation :", type(tree).__name__, "\n")
+
+    # L'ABR d'index de l'application « recherche dans une liste selon deux clés »
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "BST Application 1 - Recherche dans une liste selon deux clés")
+    spec = spec_from_file_location("recherche_deux_cles", os.path.join(folder, "recherche_dans_une_liste_selon_deux_clés.py"))
+    application = module_from_spec(spec)
+    spec.loader.exec_module(application)
+    gestion = application.GestionEtudiants()
+    stats = instrument(gestion.abr_moyenne)
+    for i in range(1000):
+        gestion.ajouter_etudiant(f"E{i:04d}", f"Etudiant{i}", round(random.uniform(0, 20), 1))
+    for _ in range(200):
+        gestion.rechercher_tous_par_moyenne(round(random.uniform(0, 20), 1))
+    print("Index des moyennes de GestionEtudiants :")
+    print(stats)
+    print("Rapport de forme :", shape_report(gestion.abr_moyenne))
@@ -0,0 +1,172 @@
+from heapq import merge
+
+from bst import AVLNode, AVLTree, BinarySearchTree
+
+
+class PersistentBinarySearchTree(BinarySearchTree):
+    """
+    Arbre binaire de recherche persistant (immuable), équilibré selon la règle AVL.
+    Une modification ne touche jamais les nœuds existants : elle recopie uniquement le chemin
+    de la racine au nœud modifié (O(log n) nœuds) et retourne une nouvelle version qui partage
+    tous les autres nœuds avec l'ancienne. Chaque version reste interrogeable avec toute
+    l'interface de lecture de BinarySearchTree (find, parcours, select, range, ...).
+
+    Les méthodes de modification retournent donc une nouvelle version :
+        v2 = v1.insert(5)      # v1 est inchangée
+        v3 = v2.delete(5)
+    """
+
+    _node_class = AVLNode
+    _update = staticmethod(AVLTree._update)
+    _height = staticmethod(AVLTree._height)
+
+    @classmethod
+    def _version(cls, root):
+        """Méthode auxiliaire pour créer une version à partir d'une racine (partagée)."""
+        version = cls(None)
+        version.root = root
+        return version
+
+    @classmethod
+    def _make(cls, data, left, right):
+        """Méthode auxiliaire pour créer un nouveau nœud à partir de ses enfants (jamais modifiés ensuite)."""
+        node = cls._node_class(data)
+        node.left = left
+        node.right = right
+        cls._update(node)
+        return node
+
+    @classmethod
+    def _balance(cls, data, left, right):
+        """
+        Méthode auxiliaire pour créer un nœud équilibré à partir de deux sous-arbres AVL dont les
+        hauteurs diffèrent d'au plus 2. Les rotations créent de nouveaux nœuds au lieu de modifier
+        les anciens.
+        """
+        height = cls._height
+        if height(left) > height(right) + 1:
+            if height(left.left) >= height(left.right):
+                return cls._make(left.data, left.left, cls._make(data, left.right, right))
+            pivot = left.right
+            return cls._make(pivot.data, cls._make(left.data, left.left, pivot.left),
+                             cls._make(data, pivot.right, right))
+        if height(right) > height(left) + 1:
+            if height(right.right) >= height(right.left):
+                return cls._make(right.data, cls._make(data, left, right.left), right.right)
+            pivot = right.left
+            return cls._make(pivot.data, cls._make(data, left, pivot.left),
+                             cls._make(right.data, pivot.right, right.right))
+        return cls._make(data, left, right)
+
+    def _insert(self, root, data):
+        """Méthode auxiliaire : retourner une nouvelle racine contenant data (copie de chemin)."""
+        if root is None:
+            return self._node_class(data)
+        if data < root.data:
+            return self._balance(root.data, self._insert(root.left, data), root.right)
+        return self._balance(root.data, root.left, self._insert(root.right, data))
+
+    def _remove_minimum(self, root):
+        """Méthode auxiliaire : retourner (nouvelle racine sans le minimum, valeur minimale)."""
+        if root.left is None:
+            return root.right, root.data
+        left, minimum = self._remove_minimum(root.left)
+        return self._balance(root.data, left, root.right), minimum
+
+    def _delete(self, root, data):
+        """
+        Méthode auxiliaire : retourner (nouvelle racine sans une occurrence de data, True si supprimée).
+        Si data est absente, la racine d'origine est retournée telle quelle.
+        """
+        if root is None:
+            return None, False
+        if data < root.data:
+            left, deleted = self._delete(root.left, data)
+            return (self._balance(root.data, left, root.right), True) if deleted else (root, False)
+        if data > root.data:
+            right, deleted = self._delete(root.right, data)
+            return (self._balance(root.data, root.left, right), True) if deleted else (root, False)
+        if root.left is None:
+            return root.right, True
+        if root.right is None:
+            return root.left, True
+        right, successor = self._remove_minimum(root.right)
+        return self._balance(successor, root.left, right), True
+
+    def insert(self, data):
+        """
+        Retourner une nouvelle version contenant data, en O(log n) temps et mémoire.
+        """
+        return self._version(self._insert(self.root, data))
+
+    def discard(self, data):
+        """
+        Retourner une nouvelle version sans une occurrence de data (la version courante si data est absente).
+        """
+        root, deleted = self._delete(self.root, data)
+        return self._version(root) if deleted else self
+
+    def delete(self, data):
+        """
+        Retourner une nouvelle version sans une occurrence de data.
+        Lève KeyError si la valeur n'est pas dans l'arbre.
+        """
+        root, deleted = self._delete(self.root, data)
+        if not deleted:
+            raise KeyError(data)
+        return self._version(root)
+
+    def pop_min(self):
+        """Retourner le couple (plus petite valeur, nouvelle version sans cette valeur)."""
+        if self.is_empty():
+            raise KeyError("pop_min sur un arbre vide")
+        root, minimum = self._remove_minimum(self.root)
+        return minimum, self._version(root)
+
+    def pop_max(self):
+        """Retourner le couple (plus grande valeur, nouvelle version sans cette valeur)."""
+        if self.is_empty():
+            raise KeyError("pop_max sur un arbre vide")
+        maximum = self.find_maximum()
+        return maximum, self.delete(maximum)
+
+    def insert_many(self, keys):
+        """
+        Retourner une nouvelle version contenant en plus toutes les clés du lot.
+        Les clés sont triées puis fusionnées avec le contenu actuel, et la nouvelle version
+        est construite équilibrée en O(n + m) ; elle ne partage alors aucun nœud.
+        """
+        values = list(merge(self, sorted(keys)))
+        return self._version(self._build_balanced(values, 0, len(values)))
+
+    def clear(self):
+        """Retourner une version vide (les autres versions ne sont pas affectées)."""
+        return self._version(None)
+
+    def set_root_value(self, value):
+        raise TypeError("un arbre persistant ne peut pas être modifié en place")
+
+    @classmethod
+    def from_list(cls, data):
+        """Construire un arbre persistant équilibré à partir d'une liste (triée puis chargée en O(n))."""
+        values = sorted(data)
+        return cls._build_balanced(values, 0, len(values))
+
+    @classmethod
+    def from_sorted_iter(cls, iterable):
+        """La construction médiane est la seule à garantir la condition AVL : l'itérable est matérialisé."""
+        return cls.from_sorted(list(iterable))
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    v1 = PersistentBinarySearchTree([50, 20, 80, 10, 30])
+    v2 = v1.insert(25)
+    v3 = v2.delete(50)
+    print("Version 1 :", v1)
+    print("Version 2 :", v2)
+    print("Version 3 :", v3)
+    print("La version 1 contient 25 :", v1.find(25), "- la version 2 :", v2.find(25))
+    print("Sous-arbre droit partagé entre v1 et v2 :", v1.root.right is v2.root.right)
+    print("Hauteur de v3 :", v3.height(), "- équilibrée :", v3.is_balanced())
+    print("Parcours pré-ordre de v2 :", v2.pre_order())
@@ -0,0 +1,230 @@
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+from bst import BinarySearchTree
+
+# Format du fichier (petit-boutiste) :
+#   en-tête : signature b"BSTK", version (uint16), code de type des clés (1 octet ASCII),
+#             un octet de bourrage, nombre de clés (uint64)                          -> 16 octets
+#   clés    : tableau contigu des clés triées ('q' entiers 64 bits ou 'd' flottants 64 bits)
+# La structure de l'arbre est implicite : c'est l'arbre équilibré obtenu en prenant
+# récursivement l'élément médian du tableau trié (la même forme que BinarySearchTree.from_sorted).
+MAGIC = b"BSTK"
+VERSION = 1
+HEADER = struct.Struct("<4sHcxQ")
+
+
+def _typecode_for(values):
+    """Choisir le code de type array adapté aux clés ('q' pour des entiers, 'd' sinon)."""
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        return "q"
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return "d"
+    raise TypeError("seules les clés numériques (int ou float) peuvent être sauvegardées")
+
+
+def save(tree, path):
+    """
+    Sauvegarder un arbre (BinarySearchTree ou tout conteneur itérable en ordre croissant) dans path.
+    Les clés sont écrites en une seule écriture groupée, déjà triées.
+    """
+    keys = list(tree)
+    typecode = _typecode_for(keys)
+    buffer = array(typecode, keys)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, typecode.encode("ascii"), len(buffer)))
+        buffer.tofile(file)
+
+
+class MappedTree:
+    """
+    Arbre en lecture seule projeté en mémoire depuis un fichier écrit par save().
+    Aucune clé n'est copiée à l'ouverture : les requêtes lisent directement les pages du fichier
+    via une memoryview typée, l'ouverture est donc quasi instantanée quelle que soit la taille.
+    Le nœud médian d'un intervalle [low, high) du tableau trié joue le rôle de racine de ce
+    sous-arbre, ce qui donne find, les requêtes d'intervalle et tous les parcours sans pointeurs.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path} n'est pas un arbre sauvegardé : {size} octets seulement")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, typecode, count = HEADER.unpack_from(self._mmap)
+        typecode = typecode.decode("ascii", "replace")
+        if magic != MAGIC or version != VERSION or typecode not in ("q", "d"):
+            self._mmap.close()
+            raise ValueError(f"{path} n'est pas un arbre sauvegardé (format {VERSION})")
+        # La taille du fichier est vérifiée avant de typer la vue : cast() exige un nombre entier de clés
+        expected = HEADER.size + count * array(typecode).itemsize
+        if size != expected:
+            self._mmap.close()
+            raise ValueError(f"{path} est tronqué ou corrompu : {size} octets au lieu de {expected} "
+                             f"pour {count} clés")
+        self.keys = memoryview(self._mmap)[HEADER.size:].cast(typecode)
+
+    def close(self):
+        """
+        Libérer la projection mémoire.
+        Lève BufferError, sans rien fermer, tant qu'une vue obtenue par as_numpy() est encore utilisée :
+        supprimer d'abord ces vues (ou les copier), puis rappeler close().
+        """
+        if self._mmap.closed:
+            return
+        typecode = self.keys.format
+        self.keys.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            self.keys = memoryview(self._mmap)[HEADER.size:].cast(typecode)  # L'arbre reste utilisable
+            raise BufferError("des vues NumPy (as_numpy) référencent encore le fichier projeté") from None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def is_empty(self):
+        return len(self.keys) == 0
+
+    def calculate_size(self):
+        return len(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get_root_value(self):
+        return self.keys[len(self.keys) // 2] if len(self.keys) else None
+
+    def find(self, data):
+        """
+        Rechercher une valeur par dichotomie sur le tableau projeté (même chemin que la descente dans l'arbre).
+        Retourne True si la valeur est trouvée, sinon False.
+        """
+        index = bisect_left(self.keys, data)
+        return index < len(self.keys) and self.keys[index] == data
+
+    def find_minimum(self):
+        return self.keys[0] if len(self.keys) else None
+
+    def find_maximum(self):
+        return self.keys[-1] if len(self.keys) else None
+
+    def select(self, k):
+        """Retourner le k-ième plus petit élément, en O(1)."""
+        return self.keys[k]
+
+    def rank(self, data):
+        """Nombre d'éléments strictement inférieurs à data."""
+        return bisect_left(self.keys, data)
+
+    def count_between(self, low, high):
+        """Nombre d'éléments de l'intervalle fermé [low, high]."""
+        return max(0, bisect_right(self.keys, high) - bisect_left(self.keys, low))
+
+    def range(self, low, high):
+        """Parcourir paresseusement les valeurs de l'intervalle fermé [low, high]."""
+        start, stop = bisect_left(self.keys, low), bisect_right(self.keys, high)
+        for index in range(start, stop):
+            yield self.keys[index]
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __reversed__(self):
+        return reversed(self.keys)
+
+    def in_order(self):
+        """Retourner les éléments selon le parcours en ordre (une copie du tableau projeté)."""
+        return self.keys.tolist()
+
+    def _iter_pre_order(self):
+        """Générateur auxiliaire : parcours pré-ordre de l'arbre implicite, avec une pile de segments."""
+        keys = self.keys
+        stack = [(0, len(keys))]
+        while stack:
+            low, high = stack.pop()
+            if low < high:
+                middle = (low + high) // 2
+                yield keys[middle]
+                stack.append((middle + 1, high))
+                stack.append((low, middle))
+
+    def pre_order(self):
+        """Retourner les éléments selon le parcours pré-ordre."""
+        return list(self._iter_pre_order())
+
+    def post_order(self):
+        """Retourner les éléments selon le parcours post-ordre."""
+        # Parcours « racine, droite, gauche » puis inversion : on obtient « gauche, droite, racine »
+        keys = self.keys
+        result = []
+        stack = [(0, len(keys))]
+        while stack:
+            low, high = stack.pop()
+            if low < high:
+                middle = (low + high) // 2
+                result.append(keys[middle])
+                stack.append((low, middle))
+                stack.append((middle + 1, high))
+        result.reverse()
+        return result
+
+    def level_order(self):
+        """Retourner les éléments selon le parcours en largeur."""
+        keys = self.keys
+        result = []
+        queue = deque([(0, len(keys))])
+        while queue:
+            low, high = queue.popleft()
+            if low < high:
+                middle = (low + high) // 2
+                result.append(keys[middle])
+                queue.append((low, middle))
+                queue.append((middle + 1, high))
+        return result
+
+    def to_tree(self, cls=BinarySearchTree):
+        """Reconstruire un arbre modifiable (chargement en O(n) depuis les clés triées)."""
+        tree = cls(None)
+        tree.root = cls.from_sorted(self.keys)
+        return tree
+
+    def as_numpy(self):
+        """
+        Vue NumPy des clés, sans copie (nécessite NumPy).
+        La vue doit être libérée avant close() ; utiliser .copy() pour la garder au-delà.
+        """
+        import numpy as np
+
+        return np.frombuffer(self.keys, dtype=np.int64 if self.keys.format == "q" else np.float64)
+
+
+def load(path):
+    """Ouvrir en lecture seule, par projection mémoire, un arbre sauvegardé avec save()."""
+    return MappedTree(path)
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    import tempfile
+
+    tree = BinarySearchTree([50, 20, 80, 10, 30, 70, 90])
+    path = os.path.join(tempfile.gettempdir(), "arbre.bst")
+    save(tree, path)
+    print("Taille du fichier :", os.path.getsize(path), "octets")
+
+    with load(path) as mapped:
+        print("Arbre projeté :", mapped.in_order())
+        print("La valeur 30 est présente :", mapped.find(30))
+        print("Valeurs dans [25, 75] :", list(mapped.range(25, 75)))
+        print("Parcours pré-ordre :", mapped.pre_order())
+        print("Parcours en largeur :", mapped.level_order())
+        print("Arbre reconstruit :", mapped.to_tree())
+    os.remove(path)
@@ -6,8 +6,14 @@ Date de soumission : 08-11-2024
 """
 
 # On considère la section de code suivante :
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
 from random import randint, sample
 
+import numpy as np
+
 std_nbr = 10  # nombre d'etudiants
 DS_nbr = 3  # nombre de devoir surveillé
 TP_nbr = 2  # nombre de TP
@@ -33,20 +39,72 @@ database = {'Students': ['Student_' + str(i) for i in range(1, std_nbr + 1)],
             }
 
 
+##### Regroupement et agrégation en une passe
+
+def is_absent(minutes):
+    # Un étudiant est absent à une séance s'il arrive avec plus de 20 minutes de retard
+    return minutes in min_att['Absent']
+
+
+def group_by(keys, values):
+    # Regrouper values selon keys en un seul parcours ; les clés sont tirées des données, triées
+    groups = {}
+    for key, value in zip(keys, values):
+        groups.setdefault(key, []).append(value)
+    return dict(sorted(groups.items()))
+
+
+class AttendanceIndex:
+    # Index des étudiants par groupe et des absents par séance et par groupe.
+    # Il est construit en un seul parcours de la table des étudiants, puis mis à jour
+    # séance par séance avec add_day, sans rien recalculer.
+    def __init__(self, db=database, group_field='Groups'):
+        self.db = db
+        self.group_field = group_field
+        self.students = db['Students']
+        self.group_of = db[group_field]
+        self.by_group = {}
+        self.absences = {day: {} for day in db['Attendance']}
+        self.absence_counts = {}  # nombre d'absences par étudiant
+        sessions = list(db['Attendance'].items())
+        for i, (student, group) in enumerate(zip(self.students, self.group_of)):
+            self.by_group.setdefault(group, []).append(student)
+            for day, minutes in sessions:
+                if is_absent(minutes[i]):
+                    self.absences[day].setdefault(group, []).append(student)
+                    self.absence_counts[student] = self.absence_counts.get(student, 0) + 1
+        self.by_group = dict(sorted(self.by_group.items()))
+        for day in self.absences:
+            self.absences[day] = {group: self.absences[day].get(group, []) for group in self.by_group}
+
+    def add_day(self, day, minutes):
+        # Enregistrer une nouvelle séance (ou remplacer une séance existante) : seule cette séance
+        # est parcourue, les autres agrégats restent tels quels
+        if day in self.absences:
+            for absents in self.absences[day].values():
+                for student in absents:
+                    self.absence_counts[student] -= 1
+        self.db['Attendance'][day] = minutes
+        absents = {group: [] for group in self.by_group}
+        for student, group, student_minutes in zip(self.students, self.group_of, minutes):
+            if is_absent(student_minutes):
+                absents[group].append(student)
+                self.absence_counts[student] = self.absence_counts.get(student, 0) + 1
+        self.absences[day] = absents
+
+    def absent_count_by_group(self):
+        # Nombre total d'absences par groupe, toutes séances confondues
+        return {group: sum(len(self.absences[day][group]) for day in self.absences) for group in self.by_group}
+
+
 ##### Question 1: trouver la liste des étudiants par groupe
 
 def get_students_by_group():
-    # Initialiser le dictionnaire des groupes
-    studentsByGroup = {
-        'A':[],
-        'B':[],
-        'C':[],
-        'D':[],
-    }
-    [studentsByGroup[database['Groups'][i]].append(database['Students'][i]) for i in range(0, std_nbr)]
-    return studentsByGroup
+    # Les groupes sont tirés des données, en un seul parcours
+    return group_by(database['Groups'], database['Students'])
 # Test de la fonction
-print(get_students_by_group())
+if __name__ == "__main__":
+    print(get_students_by_group())
 
 
 ##### Question 2: Calcule de la note finale pour chaque étudiant selon la formule
@@ -94,37 +152,155 @@ def calculate_final_grades():
 
 
 # Test de la fonction
-print(calculate_final_grades())
+if __name__ == "__main__":
+    print(calculate_final_grades())
 
 
 ##### Question 3 : Déterminer les étudiants absents par groupe pour chaque séance
 
 def get_absent_students_by_group():
-    # Initialiser le dictionnaire des absences
-    absences = {}
-
-    # Pour chaque jour dans l'attendance
-    for day in database['Attendance']:
-        # Initialiser le sous-dictionnaire pour ce jour
-        absences[day] = {
-            'A': [],
-            'B': [],
-            'C': [],
-            'D': []
-        }
-
-        # Pour chaque étudiant
-        for i in range(std_nbr):
-            # Si l'étudiant est absent (minutes > 20)
-            if database['Attendance'][day][i] in min_att['Absent']:
-                # Récupérer son groupe et son nom
-                student_group = database['Groups'][i]
-                student_name = database['Students'][i]
-                # Ajouter l'étudiant à la liste des absents de son groupe
-                absences[day][student_group].append(student_name)
-
-    return absences
+    # Index construit en un seul parcours des étudiants, toutes séances comprises
+    return AttendanceIndex(database).absences
 
 
 # Test de la fonction
-print(get_absent_students_by_group())
+if __name__ == "__main__":
+    print(get_absent_students_by_group())
+
+    # Ajout d'une séance (sur une copie de la base) : seuls les agrégats de cette séance sont calculés
+    attendance_index = AttendanceIndex(dict(database, Attendance=dict(database['Attendance'])))
+    attendance_index.add_day('Saturday', [randint(0, 25) for i in range(std_nbr)])
+    print(attendance_index.absences['Saturday'])
+    print(attendance_index.absent_count_by_group())
+
+
+##### Question 2 (version vectorisée) : moteur en colonnes NumPy
+
+# Bornes des statuts de présence pour np.digitize : [0, 5[ Present, [5, 11[ Late, [11, 21[ Very Late, sinon Absent
+att_bins = [5, 11, 21]
+att_factors = np.array([dic_att['Present'], dic_att['Late'], dic_att['Very Late'], dic_att['Absent']])
+
+
+def to_columns(db=database):
+    # Convertir la base en colonnes : une ligne par DS / TP / séance, une colonne par étudiant
+    return {
+        'Students': np.array(db['Students']),
+        'Groups': np.array(db['Groups']),
+        'DS': np.array(db['DS'], dtype=np.float64),
+        'TP': np.array(db['TP'], dtype=np.float64),
+        'Days': list(db['Attendance']),
+        'Attendance': np.array(list(db['Attendance'].values()), dtype=np.int64).reshape(len(db['Attendance']), -1),
+    }
+
+
+def random_columns(n, ds_nbr=DS_nbr, tp_nbr=TP_nbr, att_nbr=Att_nbr, seed=None):
+    # Générer directement en colonnes une base de n étudiants, avec les mêmes lois que database
+    rng = np.random.default_rng(seed)
+    # TP : une note tirée dans [6, 12], [10, 16] ou [14, 20], la tranche étant choisie au hasard
+    tp_low = rng.choice([6, 10, 14], size=(tp_nbr, n))
+    # Présence : randint(0, 25) avec une chance sur deux, sinon 0 ou 5 minutes
+    choice = rng.integers(0, 4, size=(att_nbr, n))
+    minutes = np.where(choice < 2, rng.integers(0, 26, size=(att_nbr, n)), np.where(choice == 2, 0, 5))
+    return {
+        'Students': np.char.add('Student_', np.arange(1, n + 1).astype(str)),
+        'Groups': rng.choice(['A', 'B', 'C', 'D'], size=n),
+        'DS': rng.integers(6, 21, size=(ds_nbr, n)).astype(np.float64),
+        'TP': (tp_low + rng.integers(0, 7, size=(tp_nbr, n))).astype(np.float64),
+        'Days': rng.choice(days, size=att_nbr, replace=False).tolist(),
+        'Attendance': minutes,
+    }
+
+
+def calculate_final_grades_vectorized(columns=None):
+    # Même formule que calculate_final_grades, calculée pour tous les étudiants à la fois.
+    # Retourne le tableau des notes finales, dans l'ordre de columns['Students'].
+    if columns is None:
+        columns = to_columns()
+    moy_ds = columns['DS'].mean(axis=0)
+    max_tp = columns['TP'].max(axis=0)
+    # Statut de chaque séance (0 à 3), puis produit des facteurs de présence par étudiant
+    taux_retards = att_factors[np.digitize(columns['Attendance'], att_bins)].prod(axis=0)
+    return round_grades((moy_ds * 0.6 + max_tp * 0.4) * taux_retards)
+
+
+def round_grades(grades):
+    # Arrondir à 2 décimales exactement comme round() : np.round passe par grades * 100 et peut
+    # trancher autrement les valeurs proches d'un demi-centième. Ces rares cas sont arrondis par round().
+    scaled = grades * 100
+    rounded = np.rint(scaled) / 100
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    rounded[ties] = [round(grade, 2) for grade in grades[ties].tolist()]
+    return rounded
+
+
+# Test de la fonction : mêmes notes que la version en boucle
+if __name__ == "__main__":
+    columns = to_columns()
+    final_grades = calculate_final_grades()
+    vectorized = calculate_final_grades_vectorized(columns)
+    print(dict(zip(columns['Students'].tolist(), vectorized.tolist())))
+    print("Écart maximal avec calculate_final_grades :",
+          max(abs(final_grades[student] - grade) for student, grade in zip(columns['Students'].tolist(), vectorized.tolist())))
+
+
+##### Question 2 (version parallèle) : calcul par tranches dans plusieurs processus
+
+def _shared_array(shape, dtype):
+    # Créer un tableau NumPy dans un nouveau segment de mémoire partagée
+    segment = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1))
+    return segment, np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+
+
+def _grade_shard(descriptors, start, stop):
+    # Tâche d'un processus : noter les étudiants [start, stop[ en lisant les colonnes partagées
+    # et en écrivant directement dans le tableau de sortie partagé (rien n'est sérialisé)
+    segments = [shared_memory.SharedMemory(name=name) for name, shape, dtype in descriptors]
+    ds, tp, attendance, output = [np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+                                  for segment, (name, shape, dtype) in zip(segments, descriptors)]
+    output[start:stop] = calculate_final_grades_vectorized(
+        {'DS': ds[:, start:stop], 'TP': tp[:, start:stop], 'Attendance': attendance[:, start:stop]})
+    # Les vues doivent disparaître avant de fermer les segments
+    del ds, tp, attendance, output
+    for segment in segments:
+        segment.close()
+
+
+def calculate_final_grades_parallel(columns=None, workers=None, shards=None, as_dict=False):
+    # Même résultat que calculate_final_grades_vectorized, calculé par tranches d'étudiants
+    # dans un ProcessPoolExecutor. Les colonnes sont copiées une seule fois en mémoire partagée ;
+    # chaque tâche ne reçoit que les noms des segments et les bornes de sa tranche.
+    # as_dict=True retourne le dictionnaire {étudiant: note} de calculate_final_grades.
+    if columns is None:
+        columns = to_columns()
+    workers = workers or os.cpu_count()
+    shards = shards or 4 * workers
+    n = columns['DS'].shape[1]
+    segments = []
+    try:
+        descriptors = []
+        # Trois colonnes d'entrée, puis le tableau de sortie des notes
+        layout = [(array.shape, array.dtype, array) for array in (columns['DS'], columns['TP'], columns['Attendance'])]
+        layout.append(((n,), np.dtype(np.float64), None))
+        for shape, dtype, array in layout:
+            segment, shared = _shared_array(shape, dtype)
+            segments.append(segment)
+            if array is not None:
+                shared[...] = array
+            descriptors.append((segment.name, shape, dtype.str))
+            del shared
+        bounds = np.linspace(0, n, shards + 1, dtype=np.int64).tolist()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_grade_shard, repeat(descriptors), bounds[:-1], bounds[1:]))
+        grades = np.ndarray((n,), dtype=np.float64, buffer=segments[-1].buf).copy()
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+    if as_dict:
+        return dict(zip(columns['Students'].tolist(), grades.tolist()))
+    return grades
+
+
+# Test de la fonction : même dictionnaire que la version en boucle
+if __name__ == "__main__":
+    print(calculate_final_grades_parallel(workers=2, as_dict=True) == final_grades)
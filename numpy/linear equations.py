@@ -1,23 +1,251 @@
+import hashlib
+from collections import OrderedDict
+from time import perf_counter
+
 import numpy as np
 
-# Créer une matrice symétrique définie positive aléatoire A (10x10)
-np.random.seed(42)  # Pour la reproductibilité
-A = np.random.rand(100, 100) # Générer une matrice A de dimension 10 × 10 avec des valeurs aléatoires comprises entre 0 et 1
+try:
+    from scipy.linalg import cho_factor, cho_solve, lu_factor, lu_solve
+except ImportError:  # SciPy est optionnel : on se replie sur NumPy seul
+    cho_factor = None
+
+
+def _solve_triangular(T, B, lower, unit_diagonal=False, block=64):
+    # Substitution par blocs (avant si lower, arrière sinon) sur un facteur triangulaire T, en O(n²)
+    # par second membre : chaque bloc diagonal est résolu directement, puis retranché du reste par
+    # un produit matriciel. Remplace scipy.linalg.solve_triangular quand SciPy est absent.
+    X = np.array(B, dtype=np.float64)
+    n = len(T)
+    starts = range(0, n, block) if lower else range((n - 1) // block * block, -1, -block)
+    for start in starts:
+        stop = min(start + block, n)
+        diagonal = np.tril(T[start:stop, start:stop]) if lower else np.triu(T[start:stop, start:stop])
+        if unit_diagonal:
+            np.fill_diagonal(diagonal, 1.0)
+        X[start:stop] = np.linalg.solve(diagonal, X[start:stop])
+        rest = slice(stop, n) if lower else slice(0, start)
+        X[rest] -= T[rest, start:stop] @ X[start:stop]
+    return X
+
+
+def _lu_factor(A):
+    # Factorisation LU avec pivot partiel (P·A = L·U) en NumPy seul : L (diagonale unité) et U
+    # partagent une même matrice, comme pour scipy.linalg.lu_factor ; perm[i] est la ligne de A
+    # placée en position i.
+    LU = np.array(A, dtype=np.float64)
+    n = len(LU)
+    perm = np.arange(n)
+    for k in range(n - 1):
+        pivot = k + np.argmax(np.abs(LU[k:, k]))
+        if LU[pivot, k] == 0:
+            raise np.linalg.LinAlgError("matrice singulière")
+        if pivot != k:
+            LU[[k, pivot]] = LU[[pivot, k]]
+            perm[[k, pivot]] = perm[[pivot, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    if n and LU[-1, -1] == 0:
+        raise np.linalg.LinAlgError("matrice singulière")
+    return LU, perm
+
+
+class FactorizationCache:
+    # Solveur qui factorise chaque matrice une seule fois et garde les facteurs en cache (LRU).
+    # Matrice symétrique définie positive : facteur de Cholesky ; sinon : facteur LU.
+    # La clé de cache est une empreinte du contenu de la matrice (forme, type et octets),
+    # ou une clé fournie par l'appelant (key=...) pour éviter de relire la matrice.
+    # Sans SciPy, les mêmes facteurs (Cholesky, ou LU avec pivot partiel calculé en NumPy) sont
+    # gardés en cache et chaque résolution fait deux substitutions triangulaires par blocs.
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._factors = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(A):
+        # Empreinte du contenu de la matrice : deux matrices égales partagent la même factorisation
+        A = np.ascontiguousarray(A)
+        digest = hashlib.blake2b(memoryview(A).cast('B'), digest_size=16)  # Sans copie du contenu
+        digest.update(repr((A.shape, A.dtype.str)).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def is_symmetric(A):
+        # Symétrie à la précision machine près, relativement à la norme de A : Cholesky ne lit
+        # qu'un triangle, une matrice seulement « presque » symétrique serait mal résolue
+        return np.linalg.norm(A - A.T) <= len(A) * np.finfo(np.float64).eps * np.linalg.norm(A)
+
+    @classmethod
+    def _factorize(cls, A):
+        # Retourne (méthode, facteur)
+        if cls.is_symmetric(A):
+            try:
+                if cho_factor is not None:
+                    return 'cholesky', cho_factor(A, lower=True)
+                return 'cholesky', np.linalg.cholesky(A)
+            except np.linalg.LinAlgError:
+                pass  # Symétrique mais pas définie positive
+        if cho_factor is not None:
+            return 'lu', lu_factor(A)
+        return 'lu', _lu_factor(A)
+
+    def factor(self, A, key=None):
+        # Retourne (méthode, facteur) depuis le cache, en factorisant A au premier appel
+        key = self.fingerprint(A) if key is None else key
+        if key in self._factors:
+            self.hits += 1
+            self._factors.move_to_end(key)
+            return self._factors[key]
+        self.misses += 1
+        entry = self._factors[key] = self._factorize(np.asarray(A, dtype=np.float64))
+        if len(self._factors) > self.maxsize:
+            self._factors.popitem(last=False)  # Éviction de la matrice la moins récemment utilisée
+        return entry
+
+    def solve(self, A, B, key=None):
+        # Résout A·X = B ; B est un vecteur (n,) ou des seconds membres empilés en colonnes (n, k),
+        # tous résolus par un seul appel de résolution triangulaire
+        method, factor = self.factor(A, key)
+        if cho_factor is None:
+            if method == 'cholesky':  # A = L·Lᵀ : L·y = B, puis Lᵀ·x = y
+                return _solve_triangular(factor.T, _solve_triangular(factor, B, lower=True), lower=False)
+            LU, perm = factor  # P·A = L·U : L·y = P·B, puis U·x = y
+            y = _solve_triangular(LU, np.asarray(B, dtype=np.float64)[perm], lower=True, unit_diagonal=True)
+            return _solve_triangular(LU, y, lower=False)
+        if method == 'cholesky':
+            return cho_solve(factor, B)
+        return lu_solve(factor, B)
+
+    def clear(self):
+        self._factors.clear()
+
+
+class IncompleteCholesky:
+    # Préconditionneur de Cholesky incomplet sans remplissage, IC(0) : L a la même structure de
+    # zéros que la partie inférieure de A, et M = L·Lᵀ ≈ A. Seuls les coefficients non nuls sont
+    # stockés, ligne par ligne ; les substitutions sont des boucles Python sur les lignes, d'un coût
+    # proportionnel au nombre de coefficients non nuls (adapté aux matrices creuses de taille moyenne).
+    def __init__(self, A):
+        A = np.array(A, dtype=np.float64)
+        n = len(A)
+        pattern = A != 0
+        for k in range(n):
+            if A[k, k] <= 0:
+                raise np.linalg.LinAlgError("IC(0) impossible : pivot non positif")
+            A[k, k] = np.sqrt(A[k, k])
+            rows = k + 1 + np.flatnonzero(pattern[k + 1:, k])
+            A[rows, k] /= A[k, k]
+            # Mise à jour restreinte aux positions non nulles de A (aucun remplissage)
+            block = np.ix_(rows, rows)
+            A[block] -= np.where(pattern[block], np.outer(A[rows, k], A[rows, k]), 0.0)
+        self.diagonal = np.diag(A).copy()
+        # Coefficients hors diagonale de L, par ligne (substitution avant) et par colonne (arrière)
+        self.rows = [(np.flatnonzero(pattern[i, :i]), A[i, :i][pattern[i, :i]]) for i in range(n)]
+        self.columns = [(i + 1 + np.flatnonzero(pattern[i + 1:, i]), A[i + 1:, i][pattern[i + 1:, i]])
+                        for i in range(n)]
+
+    def __call__(self, r):
+        # Retourne M⁻¹·r = L⁻ᵀ·(L⁻¹·r)
+        y = np.empty_like(r)
+        for i, (indices, values) in enumerate(self.rows):
+            y[i] = (r[i] - values @ y[indices]) / self.diagonal[i]
+        x = np.empty_like(r)
+        for i in range(len(r) - 1, -1, -1):
+            indices, values = self.columns[i]
+            x[i] = (y[i] - values @ x[indices]) / self.diagonal[i]
+        return x
+
+
+def conjugate_gradient(A, b, x0=None, tol=1e-10, maxiter=None, preconditioner=None, diagonal=None):
+    # Gradient conjugué (préconditionné) pour un système A·x = b symétrique défini positif.
+    # A est une matrice (tableau NumPy) ou une fonction matvec(v) qui retourne A·v, ce qui évite de
+    # stocker A : mémoire O(n), et un coût par itération égal à celui d'un produit matrice-vecteur.
+    # preconditioner : None, 'jacobi' (diagonale de A, donnée par diagonal=... si A est une fonction),
+    # 'ichol' (IC(0), A doit être une matrice) ou une fonction qui retourne M⁻¹·r.
+    # Arrêt lorsque ||b - A·x|| <= tol·||b||. Retourne (x, stats) avec stats un dictionnaire :
+    # iterations, residual (norme relative du résidu), converged.
+    b = np.asarray(b, dtype=np.float64)
+    matvec = A.__matmul__ if isinstance(A, np.ndarray) else A
+    if preconditioner == 'jacobi':
+        inverse_diagonal = 1.0 / (np.diag(A) if diagonal is None else np.asarray(diagonal, dtype=np.float64))
+        preconditioner = lambda r: inverse_diagonal * r
+    elif preconditioner == 'ichol':
+        if not isinstance(A, np.ndarray):
+            raise TypeError("le préconditionneur 'ichol' nécessite la matrice A")
+        preconditioner = IncompleteCholesky(A)
+    elif preconditioner is None:
+        preconditioner = lambda r: r
+    maxiter = 10 * len(b) if maxiter is None else maxiter
+
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=np.float64)
+    r = b - matvec(x) if x0 is not None else b.copy()
+    b_norm = np.linalg.norm(b) or 1.0
+    z = preconditioner(r)
+    p = z.copy()
+    rz = r @ z
+    iterations = 0
+    residual = np.linalg.norm(r) / b_norm
+    while residual > tol and iterations < maxiter:
+        Ap = matvec(p)
+        alpha = rz / (p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+        iterations += 1
+        residual = np.linalg.norm(r) / b_norm
+        if residual <= tol:
+            break
+        z = preconditioner(r)
+        rz, rz_old = r @ z, rz
+        p = z + (rz / rz_old) * p
+    return x, {'iterations': iterations, 'residual': float(residual), 'converged': bool(residual <= tol)}
+
+
+if __name__ == "__main__":
+    # Créer une matrice symétrique définie positive aléatoire A (100x100)
+    np.random.seed(42)  # Pour la reproductibilité
+    A = np.random.rand(100, 100) # Générer une matrice A de dimension 100 × 100 avec des valeurs aléatoires comprises entre 0 et 1
+
+    A = np.dot(A, A.T)  # Rendre la matrice symétrique et définie positive, ce qui est une condition pour utiliser la décomposition de Cholesky
+    # Créer un vecteur aléatoire b (100 éléments)
+    b = np.random.rand(100)
+    # Résolution en utilisant numpy.linalg.solve
+    x_solve = np.linalg.solve(A, b)
+
+    # Résolution en utilisant la décomposition de Cholesky (factorisation mise en cache)
+    solver = FactorizationCache()
+    x_cholesky = solver.solve(A, b)  # Substitutions avant et arrière sur le facteur triangulaire
+
+    # Calculer l'erreur quadratique pour chaque méthode
+    error_solve = np.linalg.norm(np.dot(A, x_solve) - b)**2
+    error_cholesky = np.linalg.norm(np.dot(A, x_cholesky) - b)**2
 
-A = np.dot(A, A.T)  # Rendre la matrice symétrique et définie positive, ce qui est une condition pour utiliser la décomposition de Cholesky
-# Créer un vecteur aléatoire b (10 éléments)
-b = np.random.rand(100)
-# Résolution en utilisant numpy.linalg.solve
-x_solve = np.linalg.solve(A, b)
+    print(f"Erreur quadratique pour solve: {error_solve}")
+    print(f"Erreur quadratique pour cholesky: {error_cholesky}")
 
-# Résolution en utilisant la décomposition de Cholesky
-L = np.linalg.cholesky(A)
-y = np.linalg.solve(L, b)       # Substitution avant
-x_cholesky = np.linalg.solve(L.T, y)  # Substitution arrière
+    # Nombreux seconds membres pour la même matrice : une factorisation, une résolution groupée
+    k = 1000
+    B = np.random.rand(100, k)
+    start = perf_counter()
+    X_loop = np.column_stack([np.linalg.solve(A, B[:, j]) for j in range(k)])
+    loop_time = perf_counter() - start
+    solver.clear()
+    start = perf_counter()
+    X_cached = solver.solve(A, B)  # Factorisation comprise
+    cached_time = perf_counter() - start
+    start = perf_counter()
+    solver.solve(A, B)
+    reuse_time = perf_counter() - start
 
-# Calculer l'erreur quadratique pour chaque méthode
-error_solve = np.linalg.norm(np.dot(A, x_solve) - b)**2
-error_cholesky = np.linalg.norm(np.dot(A, x_cholesky) - b)**2
+    print(f"{k} seconds membres : solve un par un {loop_time:.4f} s, factorisation + résolution groupée "
+          f"{cached_time:.4f} s (accélération {loop_time / cached_time:.0f}x), "
+          f"facteur déjà en cache {reuse_time:.4f} s")
+    print(f"Erreur quadratique moyenne : solve {np.linalg.norm(A @ X_loop - B)**2 / k:.3e}, "
+          f"facteur en cache {np.linalg.norm(A @ X_cached - B)**2 / k:.3e}")
+    print(f"Cache : {solver.hits} réutilisation(s), {solver.misses} factorisation(s)")
 
-print(f"Erreur quadratique pour solve: {error_solve}")
-print(f"Erreur quadratique pour cholesky: {error_cholesky}")
\ No newline at end of file
+    # Gradient conjugué : sans préconditionnement, puis avec les préconditionneurs de Jacobi et IC(0)
+    for preconditioner in (None, 'jacobi', 'ichol'):
+        x_cg, stats = conjugate_gradient(A, b, tol=1e-10, preconditioner=preconditioner)
+        print(f"Gradient conjugué ({preconditioner or 'sans préconditionneur'}) : {stats['iterations']} itérations, "
+              f"résidu relatif {stats['residual']:.1e}, erreur quadratique {np.linalg.norm(A @ x_cg - b)**2:.3e}")
@@ -1,32 +1,113 @@
+import os
+import tempfile
+
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Données d'exemple
-x = np.linspace(0, 10, 100) # Valeurs de x
-# Générer les valeurs de y en utilisant une relation linéaire avec du bruit aléatoire
-true_slope = 2.5  # Pente réelle
-true_intercept = 1.0  # Intercept réel
-noise = np.random.normal(0, 1, size=x.shape)  # Bruit aléatoire
-
-# Valeurs observées de y
-y = true_slope * x + true_intercept + noise
-# Ajustement linéaire avec numpy.polyfit
-coefficients = np.polyfit(x, y, 1)  # Degré 1 pour une régression linéaire
-a, b = coefficients  # a = pente, b = ordonnée à l'origine
-
-# Générer les valeurs prédites
-y_pred = a * x + b
-
-# Affichage des résultats
-print(f"Pente (a) : {a}")
-print(f"Ordonnée à l'origine (b) : {b}")
-
-# Tracé des points et de la droite d'ajustement
-plt.scatter(x, y, color="blue", label="Données observées")  # Points
-plt.plot(x, y_pred, color="red", label="Droite d'ajustement")  # Droite
-plt.xlabel("x")
-plt.ylabel("y")
-plt.title("Régression linéaire avec numpy.polyfit")
-plt.legend()
-plt.grid()
-plt.show()
+
+
+class StreamingLeastSquares:
+    # Régression par moindres carrés incrémentale : les données arrivent par morceaux et ne sont
+    # jamais gardées en mémoire. On maintient une factorisation QR courante de la matrice augmentée
+    # [X | y] : seul le facteur triangulaire R (taille (p + 1) x (p + 1)) est conservé, et chaque
+    # morceau est absorbé par une QR de [R ; X_morceau | y_morceau]. C'est plus stable que
+    # d'accumuler XᵀX et Xᵀy, et les coefficients sont disponibles à tout moment.
+    # Colonnes du modèle : pour chaque variable, ses puissances degree, ..., 1 (sans termes croisés),
+    # puis la constante. Avec une seule variable, l'ordre est celui de np.polyfit.
+    def __init__(self, n_features=1, degree=1, fit_intercept=True):
+        self.n_features = n_features
+        self.degree = degree
+        self.fit_intercept = fit_intercept
+        self.n_columns = n_features * degree + fit_intercept
+        self._R = np.zeros((0, self.n_columns + 1))
+        self.n_samples = 0
+
+    def design(self, x):
+        # Construire les colonnes du modèle pour un morceau de données x, de forme (m,) ou (m, n_features)
+        x = np.asarray(x, dtype=np.float64).reshape(len(x), self.n_features)
+        columns = [x[:, [j]] ** power for j in range(self.n_features) for power in range(self.degree, 0, -1)]
+        if self.fit_intercept:
+            columns.append(np.ones((len(x), 1)))
+        return np.hstack(columns)
+
+    def partial_fit(self, x, y):
+        # Absorber un morceau (x, y) ; seul le facteur R est mis à jour
+        block = np.hstack([self.design(x), np.asarray(y, dtype=np.float64).reshape(-1, 1)])
+        self._R = np.linalg.qr(np.vstack([self._R, block]), mode='r')
+        self.n_samples += len(block)
+        return self
+
+    def fit(self, chunks):
+        # Consommer un itérable de morceaux (x, y) : générateur, tranches d'un np.memmap, ...
+        for x, y in chunks:
+            self.partial_fit(x, y)
+        return self
+
+    @property
+    def coefficients(self):
+        # Coefficients des moindres carrés pour les données vues jusqu'ici (R·c = Qᵀy)
+        p = self.n_columns
+        return np.linalg.lstsq(self._R[:p, :p], self._R[:p, p], rcond=None)[0]
+
+    @property
+    def residual(self):
+        # Somme des carrés des résidus : dernier élément diagonal de R, au carré
+        p = self.n_columns
+        return float(self._R[p, p] ** 2) if len(self._R) > p else 0.0
+
+    def predict(self, x):
+        return self.design(x) @ self.coefficients
+
+
+def iter_chunks(x, y, chunk_size):
+    # Découper des tableaux (ou des np.memmap, lus page par page) en morceaux de chunk_size lignes
+    for start in range(0, len(x), chunk_size):
+        yield x[start:start + chunk_size], y[start:start + chunk_size]
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt  # Seulement pour le tracé : inutile en mode bibliothèque
+
+    # Données d'exemple
+    x = np.linspace(0, 10, 100) # Valeurs de x
+    # Générer les valeurs de y en utilisant une relation linéaire avec du bruit aléatoire
+    true_slope = 2.5  # Pente réelle
+    true_intercept = 1.0  # Intercept réel
+    noise = np.random.normal(0, 1, size=x.shape)  # Bruit aléatoire
+
+    # Valeurs observées de y
+    y = true_slope * x + true_intercept + noise
+    # Ajustement linéaire avec numpy.polyfit
+    coefficients = np.polyfit(x, y, 1)  # Degré 1 pour une régression linéaire
+    a, b = coefficients  # a = pente, b = ordonnée à l'origine
+
+    # Générer les valeurs prédites
+    y_pred = a * x + b
+
+    # Affichage des résultats
+    print(f"Pente (a) : {a}")
+    print(f"Ordonnée à l'origine (b) : {b}")
+
+    # Même ajustement en flux, par morceaux de 10 points
+    streaming = StreamingLeastSquares().fit(iter_chunks(x, y, 10))
+    print(f"Coefficients en flux : {streaming.coefficients} (identiques à polyfit : {np.allclose(streaming.coefficients, coefficients)})")
+
+    # Données hors mémoire : 1 000 000 de points dans un fichier projeté (np.memmap), modèle de degré 2
+    with tempfile.TemporaryDirectory() as folder:
+        n = 1_000_000
+        x_big = np.memmap(os.path.join(folder, "x.dat"), dtype=np.float64, mode="w+", shape=(n,))
+        y_big = np.memmap(os.path.join(folder, "y.dat"), dtype=np.float64, mode="w+", shape=(n,))
+        x_big[:] = np.random.uniform(-5, 5, n)
+        y_big[:] = 0.5 * x_big ** 2 - 2 * x_big + 3 + np.random.normal(0, 1, n)
+        quadratic = StreamingLeastSquares(degree=2).fit(iter_chunks(x_big, y_big, 100_000))
+        print(f"Degré 2 sur {quadratic.n_samples} points en flux : {quadratic.coefficients}")
+        print(f"Identiques à polyfit : {np.allclose(quadratic.coefficients, np.polyfit(x_big, y_big, 2))}")
+        del x_big, y_big
+
+    # Tracé des points et de la droite d'ajustement
+    plt.scatter(x, y, color="blue", label="Données observées")  # Points
+    plt.plot(x, y_pred, color="red", label="Droite d'ajustement")  # Droite
+    plt.xlabel("x")
+    plt.ylabel("y")
+    plt.title("Régression linéaire avec numpy.polyfit")
+    plt.legend()
+    plt.grid()
+    plt.show()
@@ -0,0 +1,216 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedBlockList:
+    """
+    Conteneur trié en « liste de blocs », alternative compacte à bst.BinarySearchTree.
+    Les valeurs sont rangées dans des blocs (listes Python triées) d'au plus 2 * load éléments ;
+    la liste maxes garde le maximum de chaque bloc. Une recherche fait donc deux bisect :
+    un pour choisir le bloc, un dans le bloc. Les blocs étant contigus en mémoire, on évite
+    la poursuite de pointeurs d'un arbre binaire et la hauteur effective reste de 2.
+
+    Même interface que BinarySearchTree pour l'insertion, la recherche, le minimum,
+    le maximum, le parcours en ordre et le vidage.
+    Attributs :
+        load : Taille de référence des blocs (un bloc est coupé en deux au-delà de 2 * load).
+    """
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, data=None, load=DEFAULT_LOAD):
+        self.load = load
+        self.clear()
+        if isinstance(data, (int, float, str)):
+            self.insert(data)
+        elif isinstance(data, (list, set)):
+            self._load_sorted(sorted(data))
+        elif isinstance(data, dict):
+            self._load_sorted(sorted(data.values()))
+
+    def _load_sorted(self, data):
+        """Méthode auxiliaire pour découper des données triées en blocs, en O(n)."""
+        load = self.load
+        self._blocks = [data[i:i + load] for i in range(0, len(data), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._size = len(data)
+
+    def is_empty(self):
+        """
+        Vérifier si le conteneur est vide.
+        Retourne True s'il est vide, False sinon.
+        """
+        return self._size == 0
+
+    def clear(self):
+        """
+        Supprimer toutes les valeurs du conteneur.
+        """
+        self._blocks = []
+        self._maxes = []
+        self._size = 0
+
+    def calculate_size(self):
+        """
+        Retourner le nombre de valeurs stockées, en O(1).
+        """
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, data):
+        """
+        Insérer une valeur en conservant l'ordre : O(log n) comparaisons plus un décalage
+        en mémoire contiguë dans un bloc de taille bornée.
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([data])
+            maxes.append(data)
+            self._size = 1
+            return
+        position = bisect_right(maxes, data)
+        if position == len(maxes):
+            # Nouvelle valeur maximale : elle va à la fin du dernier bloc
+            position -= 1
+            self._blocks[position].append(data)
+            maxes[position] = data
+        else:
+            insort(self._blocks[position], data)
+        self._size += 1
+        if len(self._blocks[position]) > 2 * self.load:
+            self._split(position)
+
+    def _split(self, position):
+        """Méthode auxiliaire pour couper en deux un bloc devenu trop grand."""
+        block = self._blocks[position]
+        half = block[self.load:]
+        del block[self.load:]
+        self._maxes[position] = block[-1]
+        self._blocks.insert(position + 1, half)
+        self._maxes.insert(position + 1, half[-1])
+
+    def _locate(self, data):
+        """
+        Méthode auxiliaire pour localiser la première occurrence de data.
+        Retourne (indice du bloc, indice dans le bloc) ou None si la valeur est absente.
+        """
+        position = bisect_left(self._maxes, data)
+        if position == len(self._maxes):
+            return None
+        block = self._blocks[position]
+        index = bisect_left(block, data)
+        if block[index] != data:
+            return None
+        return position, index
+
+    def find(self, data):
+        """
+        Rechercher une valeur dans le conteneur.
+        Retourne True si la valeur est trouvée, sinon False.
+        """
+        # Version déroulée de _locate : c'est l'opération la plus fréquente
+        maxes = self._maxes
+        position = bisect_left(maxes, data)
+        if position == len(maxes):
+            return False
+        block = self._blocks[position]
+        return block[bisect_left(block, data)] == data
+
+    __contains__ = find
+
+    def discard(self, data):
+        """
+        Supprimer une occurrence de data si elle est présente.
+        Retourne True si la valeur a été trouvée et supprimée, sinon False.
+        """
+        location = self._locate(data)
+        if location is None:
+            return False
+        position, index = location
+        block = self._blocks[position]
+        del block[index]
+        self._size -= 1
+        if not block:
+            del self._blocks[position]
+            del self._maxes[position]
+        else:
+            self._maxes[position] = block[-1]
+            # Fusionner un bloc devenu trop petit avec son voisin
+            if len(block) < self.load // 2 and len(self._blocks) > 1:
+                neighbour = position - 1 if position else position
+                merged = self._blocks[neighbour] + self._blocks[neighbour + 1]
+                self._blocks[neighbour:neighbour + 2] = [merged]
+                self._maxes[neighbour:neighbour + 2] = [merged[-1]]
+                if len(merged) > 2 * self.load:
+                    self._split(neighbour)
+        return True
+
+    def delete(self, data):
+        """
+        Supprimer une occurrence de data.
+        Lève KeyError si la valeur n'est pas présente.
+        """
+        if not self.discard(data):
+            raise KeyError(data)
+
+    def find_minimum(self):
+        """Retourner la valeur minimale, ou None si le conteneur est vide."""
+        return self._blocks[0][0] if self._blocks else None
+
+    def find_maximum(self):
+        """Retourner la valeur maximale, ou None si le conteneur est vide."""
+        return self._maxes[-1] if self._maxes else None
+
+    def iter_in_order(self):
+        """Parcourir paresseusement les valeurs en ordre croissant."""
+        for block in self._blocks:
+            yield from block
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def in_order(self):
+        """Retourner les valeurs selon le parcours en ordre (une simple concaténation des blocs)."""
+        result = []
+        for block in self._blocks:
+            result.extend(block)
+        return result
+
+    def range(self, low, high):
+        """
+        Parcourir paresseusement les valeurs de l'intervalle fermé [low, high].
+        """
+        position = bisect_left(self._maxes, low)
+        if position == len(self._maxes):
+            return
+        index = bisect_left(self._blocks[position], low)
+        for block in self._blocks[position:]:
+            stop = bisect_right(block, high)
+            yield from block[index:stop]
+            if stop < len(block):
+                return
+            index = 0
+
+    def __str__(self):
+        return "[" + ", ".join(map(repr, self)) + "]"
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    blocks = SortedBlockList([20, 10, 30, 25, 5], load=2)
+    blocks.insert(27)
+    blocks.insert(1)
+    print("Conteneur trié :", blocks)
+    print("Blocs internes :", blocks._blocks)
+    print("La valeur 25 est présente :", blocks.find(25))
+    print("Minimum / maximum :", blocks.find_minimum(), "/", blocks.find_maximum())
+    print("Valeurs dans [6, 26] :", list(blocks.range(6, 26)))
+    blocks.delete(25)
+    print("Après suppression de 25 :", blocks, "- taille :", len(blocks))
+    blocks.clear()
+    print("Vide après vidage :", blocks.is_empty())
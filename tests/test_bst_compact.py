@@ -0,0 +1,113 @@
+"""
+Tests de l'arbre compact CompactBinarySearchTree : mêmes méthodes publiques que BinarySearchTree,
+résultats identiques sur une suite aléatoire d'insertions, de suppressions et de requêtes,
+réutilisation des emplacements libérés.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import BinarySearchTree, np  # noqa: E402
+from bst_compact import CompactBinarySearchTree  # noqa: E402
+
+# Constructeurs de nœuds de BinarySearchTree : remplacés par le constructeur de l'arbre compact
+NODE_BUILDERS = {"from_sorted", "from_sorted_iter", "from_list", "from_dict", "from_set"}
+
+
+class CompactTreeTest(unittest.TestCase):
+    def assertSameTree(self, compact, reference):
+        self.assertEqual(compact.in_order(), reference.in_order())
+        self.assertEqual(len(compact), len(reference))
+        self.assertEqual(list(reversed(compact)), list(reference.iter_reverse_order()))
+
+    def test_public_api_matches(self):
+        public = {name for name in dir(BinarySearchTree) if not name.startswith("_")}
+        missing = {name for name in public - NODE_BUILDERS if not hasattr(CompactBinarySearchTree, name)}
+        self.assertEqual(missing, set())
+
+    def test_traversals_match(self):
+        data = [20, 10, 30, 25, 5, 27, 10]
+        compact, reference = CompactBinarySearchTree(data), BinarySearchTree(data)
+        for name in ("in_order", "pre_order", "post_order", "level_order"):
+            self.assertEqual(getattr(compact, name)(), getattr(reference, name)(), name)
+            self.assertEqual(list(getattr(compact, "iter_" + name)()), getattr(reference, name)(), name)
+        for name in ("height", "count_leaves", "is_degenerate", "is_balanced", "get_root_value"):
+            self.assertEqual(getattr(compact, name)(), getattr(reference, name)(), name)
+
+    def test_random_operations_match(self):
+        rng = random.Random(7)
+        for typecode in (None, "q"):
+            compact, reference = CompactBinarySearchTree(typecode=typecode), BinarySearchTree(None)
+            for _ in range(3000):
+                key = rng.randrange(200)
+                operation = rng.random()
+                if operation < 0.5:
+                    compact.insert(key)
+                    reference.insert(key)
+                elif operation < 0.8:
+                    self.assertEqual(compact.discard(key), reference.discard(key))
+                elif operation < 0.9 and len(reference):
+                    self.assertEqual(compact.pop_min(), reference.pop_min())
+                elif len(reference):
+                    self.assertEqual(compact.pop_max(), reference.pop_max())
+                for name in ("floor", "ceiling", "successor", "predecessor", "rank", "find"):
+                    self.assertEqual(getattr(compact, name)(key), getattr(reference, name)(key), name)
+                self.assertEqual(compact.count_between(key, key + 20), reference.count_between(key, key + 20))
+                self.assertEqual(list(compact.range(key, key + 20)), list(reference.range(key, key + 20)))
+            self.assertSameTree(compact, reference)
+            self.assertEqual([compact.select(k) for k in range(-len(reference), len(reference))],
+                             [reference.select(k) for k in range(-len(reference), len(reference))])
+            self.assertEqual(compact.count_leaves(), reference.count_leaves())
+            # Les suppressions libèrent des emplacements, réutilisés par les insertions suivantes
+            self.assertLessEqual(len(compact.keys), 3000)
+
+    def test_freed_slots_are_reused(self):
+        compact = CompactBinarySearchTree(list(range(100)))
+        for key in range(0, 100, 2):
+            compact.delete(key)
+        self.assertEqual(len(compact), 50)
+        for key in list(range(0, 20, 2)) + list(range(101, 111)):
+            compact.insert(key)
+        self.assertEqual(len(compact.keys), 100)
+        self.assertEqual(len(compact), 70)
+        self.assertEqual(compact.in_order(), sorted(list(range(1, 100, 2)) + list(range(0, 20, 2)) + list(range(101, 111))))
+
+    def test_errors_match(self):
+        compact = CompactBinarySearchTree()
+        with self.assertRaises(KeyError):
+            compact.pop_min()
+        with self.assertRaises(KeyError):
+            compact.delete(3)
+        with self.assertRaises(IndexError):
+            compact.select(0)
+        self.assertIsNone(compact.get_left_subtree())
+
+    def test_bulk_operations(self):
+        compact = CompactBinarySearchTree([5, 1, 9], typecode="q")
+        compact.insert_many(list(range(100, 0, -7)))
+        reference = BinarySearchTree([5, 1, 9])
+        reference.insert_many(list(range(100, 0, -7)))
+        self.assertSameTree(compact, reference)
+        self.assertTrue(compact.is_balanced())
+        self.assertEqual(list(compact.find_many([1, 3, 9, 100])), [True, False, True, True])
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_numpy_batches(self):
+        compact = CompactBinarySearchTree(list(range(0, 50, 5)))
+        compact.insert_many(np.arange(1, 50, 5))
+        self.assertTrue(all(type(key) is int for key in compact))
+        mask = compact.contains_mask(np.array([0, 1, 2, 45, 46]))
+        self.assertEqual(mask.tolist(), [True, True, False, True, True])
+        compact.delete(45)
+        self.assertFalse(compact.contains_mask([45])[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
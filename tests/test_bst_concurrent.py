@@ -0,0 +1,117 @@
+"""
+Tests de ConcurrentBinarySearchTree et de ReadWriteLock : écritures concurrentes,
+exclusion lecteurs/rédacteur, isolation des instantanés.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import LazyDeletionTree  # noqa: E402
+from bst_concurrent import ConcurrentBinarySearchTree, ReadWriteLock  # noqa: E402
+
+
+class ReadWriteLockTest(unittest.TestCase):
+    def test_writer_is_exclusive(self):
+        lock = ReadWriteLock()
+        state = {"readers": 0, "writers": 0}
+        violations = []
+        guard = threading.Lock()
+
+        def read():
+            with lock.read_locked():
+                with guard:
+                    state["readers"] += 1
+                    if state["writers"]:
+                        violations.append("lecture pendant une écriture")
+                with guard:
+                    state["readers"] -= 1
+
+        def write():
+            with lock.write_locked():
+                with guard:
+                    state["writers"] += 1
+                    if state["writers"] > 1 or state["readers"]:
+                        violations.append("écriture non exclusive")
+                with guard:
+                    state["writers"] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for i in range(2000):
+                pool.submit(write if i % 4 == 0 else read)
+        self.assertEqual(violations, [])
+
+
+class ConcurrentTreeTest(unittest.TestCase):
+    def test_concurrent_inserts(self):
+        shared = ConcurrentBinarySearchTree()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(shared.insert, range(2000)))
+        self.assertEqual(len(shared), 2000)
+        self.assertEqual(shared.in_order(), list(range(2000)))
+        self.assertTrue(shared._tree.is_balanced())
+
+    def test_readers_and_writers(self):
+        shared = ConcurrentBinarySearchTree()
+        shared.insert_many(list(range(0, 1000, 2)))
+        errors = []
+
+        def reader():
+            for value in range(0, 1000, 2):
+                if not shared.find(value):
+                    errors.append(value)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            readers = [pool.submit(reader) for _ in range(4)]
+            writes = [pool.submit(shared.insert, value) for value in range(1, 1000, 2)]
+            for future in readers + writes:
+                future.result()
+        self.assertEqual(errors, [])
+        self.assertEqual(shared.in_order(), list(range(1000)))
+
+    def test_snapshot_isolation(self):
+        shared = ConcurrentBinarySearchTree()
+        shared.insert_many([1, 2, 3])
+        view = iter(shared)
+        shared.insert(4)
+        shared.delete(1)
+        self.assertEqual(list(view), [1, 2, 3])
+        self.assertEqual(list(shared), [2, 3, 4])
+
+    def test_snapshot_reused_until_write(self):
+        shared = ConcurrentBinarySearchTree()
+        shared.insert_many([1, 2])
+        self.assertIs(shared.snapshot(), shared.snapshot())
+        before = shared.snapshot()
+        shared.insert(3)
+        self.assertIsNot(shared.snapshot(), before)
+        self.assertFalse(shared.discard(42))
+
+    def test_wraps_lazy_deletion_tree(self):
+        shared = ConcurrentBinarySearchTree(LazyDeletionTree(None, compaction_ratio=0.5))
+        shared.insert_many(list(range(100)))
+
+        def delete_evens():
+            for value in range(0, 100, 2):
+                shared.delete(value)
+
+        def read_floors():
+            for value in range(100):
+                shared.floor(value)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(delete_evens)] + [pool.submit(read_floors) for _ in range(3)]:
+                future.result()
+        self.assertEqual(shared.in_order(), list(range(1, 100, 2)))
+        self.assertEqual(shared.floor(50), 49)
+
+
+if __name__ == "__main__":
+    unittest.main()
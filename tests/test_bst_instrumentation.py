@@ -0,0 +1,90 @@
+"""
+Tests de l'instrumentation des arbres (bst_instrumentation) : comptage des nœuds visités,
+appels imbriqués, désactivation, arbre partagé entre threads.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import AVLTree, BinarySearchTree, LazyDeletionTree  # noqa: E402
+from bst_concurrent import ConcurrentBinarySearchTree  # noqa: E402
+from bst_instrumentation import instrument, shape_report, uninstrument  # noqa: E402
+
+
+class InstrumentationTest(unittest.TestCase):
+    def test_degenerate_tree(self):
+        tree = BinarySearchTree(None)
+        reports = []
+        stats = instrument(tree, shape_interval=100, on_shape_report=reports.append)
+        for key in range(500):
+            tree.insert(key)
+        self.assertTrue(tree.find(499))
+        self.assertEqual(stats.max_depth, 500)
+        self.assertEqual(stats.operations["insert"].calls, 500)
+        self.assertEqual(stats.operations["find"].max_nodes_visited, 500)
+        self.assertEqual(len(reports), 5)
+        self.assertTrue(reports[-1]["degenerate"])
+        self.assertEqual(reports[-1]["height"], 500)
+
+    def test_nested_calls_not_counted(self):
+        tree = LazyDeletionTree(list(range(100)), compaction_ratio=0.5)
+        stats = instrument(tree)
+        tree.delete(5)
+        tree.find_many([1, 2, 3])
+        with self.assertRaises(KeyError):
+            tree.delete(1000)
+        self.assertNotIn("find", stats.operations)
+        tree.find(3)
+        self.assertEqual(stats.operations["find"].calls, 1)
+
+    def test_uninstrument_restores_class(self):
+        tree = AVLTree(list(range(10)))
+        stats = instrument(tree)
+        self.assertIs(instrument(tree), stats)
+        tree.find(3)
+        self.assertIs(uninstrument(tree), stats)
+        self.assertIs(type(tree), AVLTree)
+        self.assertNotIn("stats", tree.__dict__)
+        self.assertIsNone(uninstrument(tree))
+
+    def test_shape_report(self):
+        report = shape_report(AVLTree(list(range(15))))
+        self.assertEqual((report["size"], report["height"], report["leaves"]), (15, 4, 8))
+        self.assertFalse(report["degenerate"])
+
+    def test_shared_tree_counts_every_call(self):
+        tree = LazyDeletionTree(list(range(1000)))
+        stats = instrument(tree)
+        shared = ConcurrentBinarySearchTree(tree)
+
+        def read():
+            for i in range(5000):
+                shared.find(i % 1000)
+
+        def delete():
+            for value in range(0, 1000, 3):
+                shared.discard(value)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=read) for _ in range(4)] + [threading.Thread(target=delete)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(stats.operations["find"].calls, 20000)
+        self.assertEqual(stats.operations["find"].latency.total, 20000)
+
+
+if __name__ == "__main__":
+    unittest.main()
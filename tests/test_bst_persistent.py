@@ -0,0 +1,87 @@
+"""
+Tests de PersistentBinarySearchTree : isolation des versions, partage des nœuds,
+équilibre AVL.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import os
+import random
+import sys
+import unittest
+from bisect import insort
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst_persistent import PersistentBinarySearchTree  # noqa: E402
+
+
+class PersistentTreeTest(unittest.TestCase):
+    def test_versions_are_isolated(self):
+        v1 = PersistentBinarySearchTree([5, 3, 8])
+        v2 = v1.insert(4)
+        v3 = v2.delete(5)
+        v4 = v3.clear()
+        self.assertEqual(v1.in_order(), [3, 5, 8])
+        self.assertEqual(v2.in_order(), [3, 4, 5, 8])
+        self.assertEqual(v3.in_order(), [3, 4, 8])
+        self.assertTrue(v4.is_empty())
+        self.assertEqual(len(v1), 3)
+
+    def test_unchanged_nodes_are_shared(self):
+        v1 = PersistentBinarySearchTree(list(range(100)))
+        v2 = v1.insert(1000)  # Seul le chemin droit est recopié
+        self.assertIsNot(v1.root, v2.root)
+        self.assertIs(v1.root.left, v2.root.left)
+
+    def test_history_of_versions(self):
+        rng = random.Random(2)
+        versions = [PersistentBinarySearchTree(None)]
+        contents = [[]]
+        for _ in range(300):
+            expected = list(contents[-1])
+            if expected and rng.random() < 0.4:
+                value = rng.choice(expected)
+                versions.append(versions[-1].delete(value))
+                expected.remove(value)
+            else:
+                value = rng.randint(0, 50)
+                versions.append(versions[-1].insert(value))
+                insort(expected, value)
+            contents.append(expected)
+        for version, expected in zip(versions, contents):
+            self.assertEqual(version.in_order(), expected)
+            self.assertEqual(len(version), len(expected))
+            self.assertTrue(version.is_balanced())
+
+    def test_missing_values(self):
+        v1 = PersistentBinarySearchTree([1, 2, 3])
+        self.assertIs(v1.discard(42), v1)
+        with self.assertRaises(KeyError):
+            v1.delete(42)
+        with self.assertRaises(KeyError):
+            PersistentBinarySearchTree(None).pop_min()
+
+    def test_pop_returns_new_version(self):
+        v1 = PersistentBinarySearchTree([4, 1, 7])
+        minimum, v2 = v1.pop_min()
+        maximum, v3 = v2.pop_max()
+        self.assertEqual((minimum, maximum), (1, 7))
+        self.assertEqual(v3.in_order(), [4])
+        self.assertEqual(v1.in_order(), [1, 4, 7])
+
+    def test_insert_many(self):
+        v1 = PersistentBinarySearchTree([10, 30])
+        v2 = v1.insert_many([20, 40, 5])
+        self.assertEqual(v1.in_order(), [10, 30])
+        self.assertEqual(v2.in_order(), [5, 10, 20, 30, 40])
+        self.assertEqual(v2.select(2), 20)
+
+    def test_in_place_modification_rejected(self):
+        with self.assertRaises(TypeError):
+            PersistentBinarySearchTree([1]).set_root_value(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests de la persistance par projection mémoire (bst_storage) : aller-retour, fichiers
+tronqués ou corrompus, fermeture de la projection.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import BinarySearchTree  # noqa: E402
+from bst_storage import HEADER, load, save  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class MappedTreeTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "arbre.bst")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write_corrupted(self, content):
+        path = os.path.join(self.folder, "corrompu.bst")
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def test_round_trip(self):
+        for values in ([50, 20, 80, 10, 30, 70, 90], [2.5, -1.0, 7.25], []):
+            save(BinarySearchTree(list(values)), self.path)
+            with load(self.path) as mapped:
+                self.assertEqual(mapped.in_order(), sorted(values))
+                self.assertEqual(len(mapped), len(values))
+                for value in values:
+                    self.assertTrue(mapped.find(value))
+                self.assertFalse(mapped.find(1000))
+
+    def test_same_shape_as_balanced_tree(self):
+        values = list(range(1, 16))
+        save(BinarySearchTree(values), self.path)
+        tree = BinarySearchTree(None)
+        tree.root = BinarySearchTree.from_sorted(values)
+        with load(self.path) as mapped:
+            self.assertEqual(mapped.pre_order(), tree.pre_order())
+            self.assertEqual(mapped.post_order(), tree.post_order())
+            self.assertEqual(mapped.level_order(), tree.level_order())
+            self.assertEqual(list(mapped.range(4, 9)), list(range(4, 10)))
+            self.assertEqual(mapped.to_tree().in_order(), values)
+
+    def test_non_numeric_keys_rejected(self):
+        with self.assertRaises(TypeError):
+            save(BinarySearchTree(["a", "b"]), self.path)
+
+    def test_truncated_file(self):
+        save(BinarySearchTree(list(range(100))), self.path)
+        with open(self.path, "rb") as file:
+            content = file.read()
+        for corrupted in (content[:-8], content[:-3], content + b"\0"):
+            with self.assertRaisesRegex(ValueError, "tronqué ou corrompu"):
+                load(self.write_corrupted(corrupted))
+
+    def test_not_a_tree(self):
+        save(BinarySearchTree([1, 2, 3]), self.path)
+        with open(self.path, "rb") as file:
+            content = file.read()
+        bad_typecode = content[:6] + b"z" + content[7:]
+        for corrupted in (b"", content[:HEADER.size - 1], b"XXXX" + content[4:], bad_typecode):
+            with self.assertRaisesRegex(ValueError, "n'est pas un arbre sauvegardé"):
+                load(self.write_corrupted(corrupted))
+
+    def test_close_is_idempotent(self):
+        save(BinarySearchTree([1, 2, 3]), self.path)
+        mapped = load(self.path)
+        mapped.close()
+        mapped.close()
+
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_close_with_live_numpy_view(self):
+        save(BinarySearchTree([1, 2, 3]), self.path)
+        mapped = load(self.path)
+        view = mapped.as_numpy()
+        with self.assertRaises(BufferError):
+            mapped.close()
+        # La projection reste utilisable tant que la vue existe
+        self.assertTrue(mapped.find(2))
+        self.assertEqual(view.tolist(), [1, 2, 3])
+        del view
+        mapped.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Tests de l'application « recherche dans une liste selon deux clés » (GestionEtudiants,
+CollectionIndexee) : recherches multi-critères, index de hachage, planificateur, import
+en masse, affichage et exports des arbres.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from importlib.util import module_from_spec, spec_from_file_location
+
+APPLICATION = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                           "BST Application 1 - Recherche dans une liste selon deux clés",
+                           "recherche_dans_une_liste_selon_deux_clés.py")
+
+
+def load_application():
+    # Le nom du script contient des espaces : il est chargé depuis son chemin
+    spec = spec_from_file_location("recherche_deux_cles", APPLICATION)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+application = load_application()
+
+
+def matricules(etudiants):
+    return [etudiant.matricule for etudiant in etudiants]
+
+
+def etudiants(*lignes):
+    return [application.Etudiant(*ligne) for ligne in lignes]
+
+
+class CollectionIndexeeTest(unittest.TestCase):
+    def setUp(self):
+        self.collection = application.CollectionIndexee("matricule", "moyenne")
+        self.donnees = etudiants(("E3", "c", 12.0), ("E1", "a", 15.5), ("E2", "b", 12.0),
+                                 ("E4", "d", 9.0), ("E5", "a", 18.0))
+        for etudiant in self.donnees:
+            self.collection.ajouter(etudiant)
+
+    def reference(self, **criteres):
+        return [e for e in self.donnees if all(application.CollectionIndexee._satisfait(getattr(e, c), v)
+                                               for c, v in criteres.items())]
+
+    def test_same_results_for_every_plan(self):
+        requetes = [dict(moyenne=12.0), dict(moyenne=(10, 16)), dict(matricule="E1", moyenne=(None, 16)),
+                    dict(matricule=("E2", "E4"), moyenne=(12.0, None)), dict(nom="a"),
+                    dict(nom="a", moyenne=(None, 16)), dict(matricule="E9"), dict(moyenne=(None, None))]
+        for criteres in requetes:
+            with self.subTest(**criteres):
+                attendu = sorted(matricules(self.reference(**criteres)))
+                self.assertEqual(sorted(matricules(self.collection.rechercher(**criteres))), attendu)
+
+    def test_planner_picks_most_selective_index(self):
+        self.assertEqual(self.collection.planifier(matricule="E1", moyenne=(0, 20))[:2], ("matricule", "ordonne"))
+        self.assertEqual(self.collection.planifier(nom="a")[:2], (None, None))
+        champ, _, estimation = self.collection.planifier(moyenne=12.0)
+        self.assertEqual((champ, estimation), ("moyenne", 2))
+
+    def test_results_ordered(self):
+        self.assertEqual(matricules(self.collection.rechercher(moyenne=(0, 20))), ["E4", "E3", "E2", "E1", "E5"])
+        self.assertEqual(matricules(self.collection.rechercher(ordre="matricule", moyenne=(0, 20))),
+                         ["E1", "E2", "E3", "E4", "E5"])
+
+    def test_index_declared_later(self):
+        self.collection.ajouter_index("nom")
+        self.assertEqual(self.collection.planifier(nom="a")[0], "nom")
+        self.assertEqual(matricules(self.collection.rechercher(nom="a")), ["E1", "E5"])
+
+    def test_duplicate_keys_kept(self):
+        gestion = application.GestionEtudiants()
+        gestion.ajouter_etudiant("E1", "a", 12.0)
+        gestion.ajouter_etudiant("E2", "b", 12.0)
+        self.assertEqual(gestion.rechercher_par_moyenne(12.0).matricule, "E1")
+        self.assertEqual(matricules(gestion.rechercher_tous_par_moyenne(12.0)), ["E1", "E2"])
+        self.assertEqual(matricules(gestion.rechercher_par_moyenne_entre(None, 12.0)), ["E1", "E2"])
+
+    def test_sorted_inserts_stay_balanced(self):
+        collection = application.CollectionIndexee("matricule")
+        for i in range(1024):
+            collection.ajouter(application.Etudiant(f"E{i:04d}", "x", 10.0))
+        self.assertLessEqual(collection.index["matricule"].root.height, 11)
+
+
+class HashIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.collection = application.CollectionIndexee("moyenne", hachage=("matricule",))
+        for etudiant in etudiants(("E1", "a", 12.0), ("E2", "b", 15.0), ("E1", "c", 9.0)):
+            self.collection.ajouter(etudiant)
+
+    def test_exact_match_uses_hash_index(self):
+        self.assertEqual(self.collection.planifier(matricule="E2", moyenne=(0, 20)), ("matricule", "hachage", 1))
+        self.assertEqual([e.nom for e in self.collection.chercher_exact("matricule", "E1")], ["a", "c"])
+        self.assertEqual(self.collection.chercher_exact("matricule", "E9"), [])
+        self.assertEqual([e.nom for e in self.collection.chercher_exact("moyenne", 15.0)], ["b"])
+        self.assertEqual([e.nom for e in self.collection.chercher_exact("nom", "c")], ["c"])
+
+    def test_range_cannot_use_hash_index(self):
+        self.assertEqual(self.collection.planifier(matricule=("E1", "E2")), (None, None, 3))
+        self.assertEqual(sorted(e.nom for e in self.collection.rechercher(matricule=("E1", "E1"))), ["a", "c"])
+
+    def test_hash_results_sorted_on_request(self):
+        resultats = self.collection.rechercher(ordre="matricule", matricule="E1")
+        self.assertEqual([e.nom for e in resultats], ["a", "c"])
+        resultats = self.collection.rechercher(ordre="moyenne", matricule="E1")
+        self.assertEqual([e.nom for e in resultats], ["c", "a"])
+
+    def test_hash_index_declared_later(self):
+        self.collection.ajouter_index_hachage("nom")
+        self.assertEqual(self.collection.planifier(nom="b")[:2], ("nom", "hachage"))
+        self.assertEqual(self.collection.chercher_exact("nom", "b")[0].matricule, "E2")
+
+    def test_gestion_lookup_by_matricule(self):
+        gestion = application.GestionEtudiants()
+        gestion.ajouter_etudiant("E7", "g", 11.0)
+        self.assertEqual(gestion.rechercher_par_matricule("E7").nom, "g")
+        self.assertIsNone(gestion.rechercher_par_matricule("E8"))
+
+
+def rendu_recursif(arbre):
+    # Rendu de référence : l'ancien affichage récursif de print_tree_2d
+    lignes = []
+
+    def construire(courant, est_droit, prefixe):
+        if courant is not None:
+            construire(courant.right, True, prefixe + ('    ' if est_droit else '│   '))
+            lignes.append(prefixe + ('┌── ' if est_droit else '└── ') + str(courant.key))
+            construire(courant.left, False, prefixe + ('    ' if not est_droit else '│   '))
+
+    construire(arbre.root, False, '')
+    return ''.join(ligne + '\n' for ligne in lignes)
+
+
+class TreeDisplayTest(unittest.TestCase):
+    def setUp(self):
+        self.arbre = application.BinarySearchTree()
+        for cle in [8, 3, 12, 1, 5, 10, 14, 4, 6, 12]:
+            self.arbre.insert(cle, f"e{cle}")
+
+    def rendu(self, **options):
+        out = io.StringIO()
+        self.arbre.print_tree_2d(out=out, **options)
+        return out.getvalue()
+
+    def test_matches_recursive_renderer(self):
+        self.assertEqual(self.rendu(), rendu_recursif(self.arbre))
+        vide = io.StringIO()
+        application.BinarySearchTree().print_tree_2d(out=vide)
+        self.assertEqual(vide.getvalue(), "")
+
+    def test_max_depth_and_subtree(self):
+        lignes = self.rendu(max_depth=1).splitlines()
+        self.assertEqual(len(lignes), 7)  # Racine, 2 enfants, 4 sous-arbres coupés
+        self.assertEqual(sum(ligne.endswith('…') for ligne in lignes), 4)
+        sous_arbre = self.rendu(key=3).splitlines()
+        self.assertEqual(sorted(int(ligne.split()[-1]) for ligne in sous_arbre), [1, 3, 4, 5, 6])
+        self.assertEqual(self.rendu(key=99), "")
+
+    def test_export_json(self):
+        out = io.StringIO()
+        self.arbre.export_json(out)
+        noeuds = [json.loads(ligne) for ligne in out.getvalue().splitlines()]
+        self.assertEqual(sorted(noeud["key"] for noeud in noeuds), [1, 3, 4, 5, 6, 8, 10, 12, 14])
+        self.assertEqual(sum(noeud["parent"] is None for noeud in noeuds), 1)
+        self.assertEqual(next(noeud["count"] for noeud in noeuds if noeud["key"] == 12), 2)
+        ids = {noeud["id"] for noeud in noeuds}
+        self.assertTrue(all(noeud["parent"] in ids for noeud in noeuds if noeud["parent"] is not None))
+        out = io.StringIO()
+        self.arbre.export_json(out, max_depth=0)
+        (racine,) = [json.loads(ligne) for ligne in out.getvalue().splitlines()]
+        self.assertTrue(racine["truncated"])
+
+    def test_export_dot(self):
+        out = io.StringIO()
+        self.arbre.export_dot(out, max_depth=1)
+        texte = out.getvalue()
+        self.assertTrue(texte.startswith('digraph ABR {') and texte.endswith('}\n'))
+        self.assertEqual(texte.count(' -> '), 2)
+        self.assertIn('clés', texte)
+
+
+class ImportTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write(self, name, content):
+        path = os.path.join(self.folder, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_import_csv_and_jsonl(self):
+        gestion = application.GestionEtudiants()
+        gestion.ajouter_etudiant("E0", "z", 15.0)
+        gestion.importer(self.write("a.csv", "matricule,nom,moyenne\nE2,b,9.5\nE1,a,12.0\nE3,c,12.0\n"),
+                         taille_paquet=2)
+        gestion.importer(self.write("b.jsonl", '{"matricule": "E4", "nom": "d", "moyenne": 11}\n\n'))
+        self.assertEqual(len(gestion.etudiants), 5)
+        self.assertEqual(matricules(gestion.abr_matricule.range_search()), ["E0", "E1", "E2", "E3", "E4"])
+        # À moyenne égale, l'ordre d'arrivée est conservé
+        self.assertEqual(matricules(gestion.rechercher_tous_par_moyenne(12.0)), ["E1", "E3"])
+        self.assertEqual(gestion.rechercher_par_matricule("E4").moyenne, 11.0)
+        self.assertEqual(gestion.abr_moyenne.count, 5)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            application.GestionEtudiants().importer(self.write("a.txt", ""))
+
+    def test_failed_import_leaves_indexes_unchanged(self):
+        gestion = application.GestionEtudiants()
+        gestion.ajouter_etudiant("E0", "z", 15.0)
+        path = self.write("a.csv", "matricule,nom,moyenne\nE1,a,12.0\nE2,b,9.5\nE3,c,8.0\nE4,d,oops\n")
+        with self.assertRaises(ValueError):
+            gestion.importer(path, taille_paquet=2)
+        self.assertEqual(len(gestion.etudiants), 1)
+        self.assertIsNone(gestion.rechercher_par_matricule("E1"))
+        self.assertIsNone(gestion.abr_matricule.search("E1"))
+        self.assertIsNone(gestion.rechercher_par_moyenne(12.0))
+        # Tous les plans de recherche voient le même contenu
+        self.assertEqual(matricules(gestion.rechercher(moyenne=(0, 20))), ["E0"])
+        self.assertEqual(matricules(gestion.rechercher(nom="a")), [])
+        self.assertEqual(matricules(gestion.rechercher(nom="z")), ["E0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
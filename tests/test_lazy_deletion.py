@@ -0,0 +1,136 @@
+"""
+Tests de la suppression (delete, discard, pop_min, pop_max) et de l'arbre à suppression
+paresseuse LazyDeletionTree : équivalence avec une liste triée, seuil de compaction,
+arbre entièrement marqué.
+
+Utilisation :
+    python -m pytest tests
+"""
+
+import os
+import random
+import sys
+import unittest
+from bisect import bisect_left, insort
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bst import AVLTree, BinarySearchTree, LazyDeletionTree  # noqa: E402
+
+
+class DeletionTest(unittest.TestCase):
+    def test_delete_and_pop(self):
+        for cls in (BinarySearchTree, AVLTree, LazyDeletionTree):
+            tree = cls([5, 3, 8, 1, 4, 7, 9])
+            tree.delete(3)
+            self.assertEqual(tree.in_order(), [1, 4, 5, 7, 8, 9])
+            self.assertFalse(tree.discard(3))
+            with self.assertRaises(KeyError):
+                tree.delete(3)
+            self.assertEqual((tree.pop_min(), tree.pop_max()), (1, 9))
+            self.assertEqual(tree.in_order(), [4, 5, 7, 8])
+
+    def test_pop_on_empty_tree(self):
+        for cls in (BinarySearchTree, AVLTree, LazyDeletionTree):
+            tree = cls(None)
+            with self.assertRaises(KeyError):
+                tree.pop_min()
+            with self.assertRaises(KeyError):
+                tree.pop_max()
+
+    def test_avl_stays_balanced(self):
+        tree = AVLTree(list(range(200)))
+        for value in random.Random(0).sample(range(200), 150):
+            tree.delete(value)
+            self.assertTrue(tree.is_balanced())
+
+
+class LazyDeletionTreeTest(unittest.TestCase):
+    def assert_matches(self, tree, expected):
+        self.assertEqual(list(tree), expected)
+        self.assertEqual(len(tree), len(expected))
+        self.assertEqual(tree.is_empty(), not expected)
+        for k in range(len(expected)):
+            self.assertEqual(tree.select(k), expected[k])
+        for query in range(-2, 44):
+            below = [value for value in expected if value < query]
+            at_most = [value for value in expected if value <= query]
+            self.assertEqual(tree.rank(query), bisect_left(expected, query))
+            self.assertEqual(tree.count_between(query, query + 5), sum(query <= v <= query + 5 for v in expected))
+            self.assertEqual(tree.floor(query), at_most[-1] if at_most else None)
+            self.assertEqual(tree.predecessor(query), below[-1] if below else None)
+            self.assertEqual(tree.ceiling(query), expected[len(below)] if len(below) < len(expected) else None)
+            self.assertEqual(tree.successor(query),
+                             expected[len(at_most)] if len(at_most) < len(expected) else None)
+            self.assertEqual(tree.find(query), query in expected)
+
+    def test_matches_sorted_list(self):
+        rng = random.Random(1)
+        for ratio in (0.1, 0.25, 0.5, 1.0, 2.0):
+            expected = sorted(rng.randint(0, 40) for _ in range(30))
+            tree = LazyDeletionTree(list(expected), compaction_ratio=ratio)
+            for _ in range(80):
+                value = rng.randint(-2, 42)
+                if rng.random() < 0.5:
+                    deleted = tree.discard(value)
+                    self.assertEqual(deleted, value in expected)
+                    if deleted:
+                        expected.remove(value)
+                else:
+                    tree.insert(value)
+                    insort(expected, value)
+                self.assert_matches(tree, expected)
+
+    def test_ordered_queries_do_not_compact(self):
+        tree = LazyDeletionTree(list(range(100)), compaction_ratio=0.5)
+        for value in range(0, 40, 2):
+            tree.delete(value)
+        self.assertEqual(tree.root.size, 100)  # Seuil non atteint : nœuds encore présents
+        self.assertEqual(tree.floor(10), 9)
+        self.assertEqual(tree.select(0), 1)
+        self.assertEqual(tree.rank(41), 21)
+        self.assertEqual(list(tree.contains_mask([2, 3])), [False, True])
+        self.assertEqual(tree.root.size, 100)
+
+    def test_compaction_threshold(self):
+        tree = LazyDeletionTree(list(range(1, 11)), compaction_ratio=0.3)
+        for value in (2, 4, 6):
+            tree.delete(value)
+        self.assertEqual(tree.root.size, 10)
+        tree.delete(8)  # 4 valeurs marquées sur 10 nœuds : compaction
+        self.assertEqual(tree.root.size, 6)
+        self.assertEqual(tree.in_order(), [1, 3, 5, 7, 9, 10])
+        self.assertTrue(tree.is_balanced())
+
+    def test_reinsert_reactivates_tombstone(self):
+        tree = LazyDeletionTree([1, 2, 3], compaction_ratio=1.0)
+        tree.delete(2)
+        self.assertEqual(list(tree.contains_mask([2])), [False])
+        tree.insert(2)
+        self.assertEqual(tree.root.size, 3)
+        self.assertEqual(list(tree.contains_mask([2])), [True])
+        self.assertEqual(tree.in_order(), [1, 2, 3])
+
+    def test_fully_tombstoned_tree_is_empty(self):
+        tree = LazyDeletionTree([1, 2, 3], compaction_ratio=1.0)
+        for value in (1, 2, 3):
+            tree.delete(value)
+        self.assertTrue(tree.is_empty())
+        self.assertEqual(len(tree), 0)
+        self.assertIsNone(tree.find_minimum())
+        self.assertIsNone(tree.floor(5))
+        with self.assertRaises(KeyError):
+            tree.pop_min()
+        with self.assertRaises(KeyError):
+            tree.pop_max()
+
+    def test_insert_many_after_deletes(self):
+        tree = LazyDeletionTree(list(range(10)), compaction_ratio=1.0)
+        tree.delete(3)
+        tree.insert_many(list(range(20, 40)))  # Lot important : reconstruction à partir des valeurs vivantes
+        self.assertEqual(tree.in_order(), [v for v in range(10) if v != 3] + list(range(20, 40)))
+        self.assertEqual(tree.root.size, len(tree))
+
+
+if __name__ == "__main__":
+    unittest.main()